@@ -0,0 +1,113 @@
+# benchmarks/auction_memory_benchmark.py
+"""
+Compares the memory held by the original dict-based auction record, with float
+amounts keyed by bidder name, against the slotted AuctionData. Bids rotate
+through a pool of bidders. The legacy record only kept each bidder's last bid,
+while the slotted record also keeps the full bid history, indexed per bidder.
+
+Run from the repository root:
+    python -m benchmarks.auction_memory_benchmark [auctions] [bids_per_auction] [bidders]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from utils.auction_data import MONEY_SCALE, AuctionData
+
+
+class LegacyAuctionData:
+    """The auction record as it was before slots and integer amounts."""
+
+    def __init__(
+        self,
+        id,
+        item,
+        starting_bid,
+        min_increment,
+        end_time,
+        channel_id,
+        guild_id,
+        creator_name,
+        creator_id,
+        message_id=None,
+    ):
+        self.id = id
+        self.item = item
+        self.starting_bid = starting_bid
+        self.current_bid = starting_bid
+        self.min_increment = min_increment
+        self.end_time = end_time
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.creator_name = creator_name
+        self.creator_id = creator_id
+        self.bidders = {}
+        self.active = True
+        self.message_id = message_id
+        self.remaining_time_str = None
+        self.winner = None
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def build_legacy(auction_count: int, bids_per_auction: int, bidders: int):
+    auctions = []
+    for index in range(auction_count):
+        auction = LegacyAuctionData(
+            str(index), "item", 1000.0, 100.0, datetime.now(), index, 1, "creator", 1
+        )
+        for bid in range(bids_per_auction):
+            amount = 1000.0 + (bid + 1) * 100.0
+            auction.current_bid = amount
+            auction.bidders[f"bidder{bid % bidders}"] = amount
+        auctions.append(auction)
+    return auctions
+
+
+def build_slotted(auction_count: int, bids_per_auction: int, bidders: int):
+    auctions = []
+    for index in range(auction_count):
+        auction = AuctionData(
+            str(index),
+            "item",
+            1000 * MONEY_SCALE,
+            100 * MONEY_SCALE,
+            datetime.now(),
+            index,
+            1,
+            "creator",
+            1,
+        )
+        for bid in range(bids_per_auction):
+            auction.record_bid(
+                bid % bidders, f"bidder{bid % bidders}", (1000 + (bid + 1) * 100) * MONEY_SCALE, time.time()
+            )
+        auctions.append(auction)
+    return auctions
+
+
+def main(auction_count: int, bids_per_auction: int, bidders: int):
+    print(f"{auction_count} auctions, {bids_per_auction} bids each from {bidders} bidders")
+    for name, build in (("legacy", build_legacy), ("slotted", build_slotted)):
+        empty = measure(lambda: build(auction_count, 0, bidders))
+        full = measure(lambda: build(auction_count, bids_per_auction, bidders))
+        per_bid = (full - empty) / (auction_count * bids_per_auction or 1)
+        print(
+            f"{name:<8} {empty / auction_count:>8.1f} B/auction "
+            f"{per_bid:>8.1f} B/bid"
+        )
+
+
+if __name__ == "__main__":
+    auctions_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    bids_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    bidders_arg = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    main(auctions_arg, bids_arg, bidders_arg)
@@ -0,0 +1,310 @@
+# benchmarks/fake_discord.py
+"""
+In-memory stand-ins for the parts of discord.py the auction cog touches.
+
+Every REST call goes through FakeRest, which records it, adds latency and
+applies fixed-window rate limits per route and channel. When a bucket is
+exhausted the call waits for the reset like discord.py does after a 429,
+and the hit is counted. The buckets are kept the way discord.py's HTTP
+client keeps what the response headers report, so FakeBot.http can stand
+in for it.
+"""
+import asyncio
+import itertools
+import random
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import discord
+
+from cogs.auction.outbound import DISCORD_ROUTES
+
+_snowflakes = itertools.count(1 << 40)
+
+# Calls allowed per window and window length in seconds of each route, per channel
+ROUTE_LIMITS = {
+    "send": (5, 5.0),
+    "edit": (5, 5.0),
+    "reaction": (1, 0.25),
+}
+DEFAULT_LIMIT = (5, 5.0)
+
+
+def next_snowflake() -> int:
+    return next(_snowflakes)
+
+
+class _Bucket:
+    """Mirrors the fields of discord.py's Ratelimit that the outbound dispatcher reads."""
+
+    __slots__ = ("limit", "remaining", "expires")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.remaining = 0
+        self.expires = 0.0  # Monotonic, like the event loop clock discord.py uses
+
+
+class FakeRest:
+    """Records REST calls and simulates latency and per-channel rate limits."""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.02):
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = Counter()  # Calls per route
+        self.rate_limit_hits = 0
+        self.listeners = []  # Called with (route, channel_id, target) after every call
+        self._bucket_hashes = {}  # Discord sends no bucket hashes here
+        self._buckets = {}  # "METHOD path:channel_id" -> _Bucket
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    async def request(self, route: str, channel_id: int, target=None):
+        limit, per = ROUTE_LIMITS.get(route, DEFAULT_LIMIT)
+        method, path = DISCORD_ROUTES.get(route, ("GET", route))
+        key = f"{method} {path}:{channel_id}"
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(limit)
+        while True:
+            now = time.monotonic()
+            if now >= bucket.expires:
+                bucket.remaining = limit
+                bucket.expires = now + per
+            if bucket.remaining:
+                break
+            # A 429: discord.py sleeps until the bucket resets and retries
+            self.rate_limit_hits += 1
+            await asyncio.sleep(bucket.expires - now)
+        bucket.remaining -= 1
+
+        await asyncio.sleep(max(self.latency + random.uniform(-self.jitter, self.jitter), 0))
+        self.calls[route] += 1
+        for listener in self.listeners:
+            listener(route, channel_id, target)
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", content=None, embed=None, view=None):
+        self.id = next_snowflake()
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.view = view
+        self.reactions = []
+
+    @property
+    def embeds(self):
+        return [self.embed] if self.embed is not None else []
+
+    async def edit(self, *, content=None, embed=None, view=None):
+        await self.channel.rest.request("edit", self.channel.id, self)
+        if self.id not in self.channel.messages:
+            raise not_found()
+        self.embed = embed if embed is not None else self.embed
+        self.content = content if content is not None else self.content
+        return self
+
+    async def add_reaction(self, emoji):
+        await self.channel.rest.request("reaction", self.channel.id, self)
+        self.reactions.append(emoji)
+
+    async def delete(self):
+        await self.channel.rest.request("delete", self.channel.id, self)
+        self.channel.messages.pop(self.id, None)
+
+
+class FakeChannel:
+    def __init__(self, rest: FakeRest, guild: "FakeGuild"):
+        self.id = next_snowflake()
+        self.rest = rest
+        self.guild = guild
+        self.name = f"channel-{self.id}"
+        self.mention = f"<#{self.id}>"
+        self.messages = {}
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs):
+        await self.rest.request("send", self.id)
+        message = FakeMessage(self, content, embed, view)
+        self.messages[message.id] = message
+        return message
+
+    def get_partial_message(self, message_id: int):
+        message = self.messages.get(message_id)
+        if message is None:
+            # Behave like a partial message of a deleted message
+            message = FakeMessage(self)
+            message.id = message_id
+        return message
+
+    async def fetch_message(self, message_id: int):
+        await self.rest.request("fetch", self.id)
+        if message_id not in self.messages:
+            raise not_found()
+        return self.messages[message_id]
+
+    async def history(self, *, limit=100, after=None, before=None, around=None, oldest_first=None):
+        await self.rest.request("history", self.id)
+        messages = sorted(self.messages.values(), key=lambda message: message.id)
+        if after is not None:
+            messages = [message for message in messages if message.id > after.id]
+        if before is not None:
+            messages = [message for message in messages if message.id < before.id]
+        for message in messages[:limit]:
+            yield message
+
+
+class FakeGuild:
+    def __init__(self, rest: FakeRest):
+        self.id = next_snowflake()
+        self.name = f"guild-{self.id}"
+        self.rest = rest
+        self.channels = []
+
+    def create_channel(self) -> FakeChannel:
+        channel = FakeChannel(self.rest, self)
+        self.channels.append(channel)
+        return channel
+
+
+class FakeMember:
+    def __init__(self, display_name: str, manage_channels: bool = False):
+        self.id = next_snowflake()
+        self.name = display_name
+        self.display_name = display_name
+        self.mention = f"<@{self.id}>"
+        self.guild_permissions = SimpleNamespace(
+            manage_channels=manage_channels, manage_guild=manage_channels
+        )
+
+    def __str__(self):
+        return self.display_name
+
+
+class FakeContext:
+    """Stand-in for commands.Context."""
+
+    def __init__(self, bot: "FakeBot", channel: FakeChannel, author: FakeMember, content: str = ""):
+        self.bot = bot
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.message = FakeMessage(channel, content)
+        self.message.author = author
+        self.message.attachments = []
+        self.command = None
+        self.prefix = "$"
+        self.invoked_with = content[1:].split(" ", 1)[0] if content else None
+        channel.messages[self.message.id] = self.message
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+    async def send_help(self, *args):
+        pass
+
+
+class FakeInteractionResponse:
+    """Stand-in for InteractionResponse. Responses are limited per interaction, not per channel."""
+
+    def __init__(self, interaction: "FakeInteraction"):
+        self.interaction = interaction
+        self.type = None
+
+    def is_done(self) -> bool:
+        return self.type is not None
+
+    async def _respond(self, response_type: str):
+        if self.type is not None:
+            raise RuntimeError("This interaction has already been responded to before")
+        self.type = response_type
+        await self.interaction.rest.request("interaction", self.interaction.id, self.interaction)
+
+    async def edit_message(self, *, content=None, embed=None, view=None):
+        await self._respond("edit_message")
+        message = self.interaction.message
+        message.embed = embed if embed is not None else message.embed
+        message.content = content if content is not None else message.content
+
+    async def send_message(self, content=None, *, embed=None, ephemeral=False, **kwargs):
+        await self._respond("send_message")
+
+    async def send_modal(self, modal):
+        await self._respond("send_modal")
+
+    async def defer(self, **kwargs):
+        await self._respond("defer")
+
+
+class FakeInteraction(discord.Interaction):
+    """Stand-in for a component or modal interaction on a message."""
+
+    def __init__(self, message: FakeMessage, user: FakeMember, custom_id: str, modal: bool = False):
+        self.id = next_snowflake()
+        self.type = (
+            discord.InteractionType.modal_submit if modal else discord.InteractionType.component
+        )
+        self.data = {"custom_id": custom_id}
+        self.message = message
+        self.channel = message.channel
+        self.guild_id = message.channel.guild.id
+        self.user = user
+        self.rest = message.channel.rest
+        self._cs_response = FakeInteractionResponse(self)
+
+
+class FakeBot:
+    """Stand-in for commands.Bot exposing what the cogs use."""
+
+    def __init__(self, rest: FakeRest):
+        self.rest = rest
+        self.http = rest  # Holds the rate limit buckets the way discord.py's HTTPClient does
+        self.user = SimpleNamespace(id=next_snowflake(), name="auction-bot")
+        self.owner_id = None
+        self.shard_ids = None
+        self.shard_count = None
+        self.guilds = []
+        self._channels = {}
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def create_guild(self, channels: int) -> FakeGuild:
+        guild = FakeGuild(self.rest)
+        for _ in range(channels):
+            channel = guild.create_channel()
+            self._channels[channel.id] = channel
+        self.guilds.append(guild)
+        return guild
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    async def fetch_channel(self, channel_id: int):
+        await self.rest.request("fetch_channel", channel_id)
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            raise not_found()
+        return channel
+
+    def is_ready(self) -> bool:
+        return True
+
+    async def wait_until_ready(self):
+        pass
+
+    def dispatch(self, event, *args, **kwargs):
+        pass
+
+    async def is_owner(self, user) -> bool:
+        return user.id == self.owner_id
+
+
+def not_found():
+    """Build the discord.NotFound error raised for missing messages and channels."""
+    response = SimpleNamespace(status=404, reason="Not Found")
+    return discord.NotFound(response, {"code": 10008, "message": "Unknown Message"})
@@ -0,0 +1,68 @@
+# benchmarks/journal_replay_benchmark.py
+"""
+Measures how fast the auction journal is written and replayed.
+
+Run from the repository root:
+    python -m benchmarks.journal_replay_benchmark [auctions] [bids_per_auction]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+
+from utils.auction_journal import AuctionJournal, apply_record
+
+
+async def main(auction_count: int, bids_per_auction: int):
+    with tempfile.TemporaryDirectory() as directory:
+        journal = AuctionJournal(directory)
+        await journal.open()
+
+        start = time.perf_counter()
+        end = time.time() + 3600
+        for auction_id in range(auction_count):
+            journal.append(
+                "create",
+                id=str(auction_id),
+                item=f"Item {auction_id}",
+                start=1000,
+                inc=100,
+                end=end,
+                channel=auction_id,
+                guild=1,
+                creator_name="creator",
+                creator=1,
+                message=auction_id,
+            )
+        for bid in range(bids_per_auction):
+            for auction_id in range(auction_count):
+                journal.append(
+                    "bid",
+                    id=str(auction_id),
+                    bidder=bid % 50,
+                    name=f"bidder{bid % 50}",
+                    amount=1000 + (bid + 1) * 100,
+                    t=time.time(),
+                )
+            await journal.flush()
+        await journal.close()
+        written = journal.seq
+        write_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        auctions = {}
+        replayed = 0
+        for record in AuctionJournal(directory).read_records(0):
+            apply_record(auctions, record)
+            replayed += 1
+        replay_seconds = time.perf_counter() - start
+
+    print(f"{written} records for {auction_count} auctions")
+    print(f"write + fsync  {written / write_seconds:>12.0f} records/s")
+    print(f"replay         {replayed / replay_seconds:>12.0f} records/s")
+
+
+if __name__ == "__main__":
+    auctions_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    bids_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    asyncio.run(main(auctions_arg, bids_arg))
@@ -0,0 +1,226 @@
+# benchmarks/load_generator.py
+"""
+Offline load generator for the auction cog.
+
+Drives start_auction, place_bid, check_ongoing_auctions and manual_close_auction
+against the in-memory Discord of benchmarks/fake_discord.py. Bids arrive at a
+fixed rate and pick their auction from a Zipf distribution, so a few auctions
+run hot. A share of the bids can be placed with the quick bid button instead
+of the bid command. Run from the repository root:
+    python -m benchmarks.load_generator --guilds 10 --auctions 5 --rate 200 --seconds 10 --buttons 0.5
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+
+from discord.ext import commands
+
+from benchmarks.fake_discord import FakeBot, FakeContext, FakeInteraction, FakeMember, FakeRest
+from cogs.auction.auction import Auction
+
+LAG_SAMPLE_INTERVAL = 0.05  # Seconds between event-loop lag samples
+BIDDERS_PER_GUILD = 50
+
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def zipf_weights(count: int, exponent: float):
+    return [1 / rank**exponent for rank in range(1, count + 1)]
+
+
+class LoadGenerator:
+    def __init__(self, args, directory: str):
+        self.args = args
+        self.rest = FakeRest(args.latency, args.latency / 2)
+        self.bot = FakeBot(self.rest)
+
+        class LoadTestAuction(Auction):
+            DATABASE_PATH = os.path.join(directory, "auctions.db")
+            JOURNAL_DIRECTORY = os.path.join(directory, "journal")
+
+        self.cog = LoadTestAuction(self.bot)
+        self.latencies = defaultdict(list)  # Command name -> seconds per invocation
+        self.ack_latencies = []  # Seconds from a bid to its reaction or interaction response
+        self.lag = []  # Event-loop lag samples in seconds
+        self.bid_started = {}  # Command message or interaction ID -> time the bid was placed
+        self.tasks = set()
+        self.rest.listeners.append(self._on_rest_call)
+
+    def _on_rest_call(self, route, channel_id, target):
+        if route in ("reaction", "interaction"):
+            started = self.bid_started.pop(target.id, None)
+            if started is not None:
+                self.ack_latencies.append(time.perf_counter() - started)
+
+    async def invoke(self, name: str, ctx, *args):
+        handler = getattr(self.cog, name)
+        start = time.perf_counter()
+        if isinstance(handler, commands.Command):
+            await handler.callback(self.cog, ctx, *args)
+        else:
+            await handler(ctx, *args)  # A listener
+        self.latencies[name].append(time.perf_counter() - start)
+
+    def spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def sample_lag(self):
+        while True:
+            expected = time.perf_counter() + LAG_SAMPLE_INTERVAL
+            await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+            self.lag.append(max(time.perf_counter() - expected, 0.0))
+
+    async def run(self):
+        args = self.args
+        await self.cog.cog_load()
+        sampler = asyncio.create_task(self.sample_lag())
+
+        guilds = [self.bot.create_guild(args.auctions) for _ in range(args.guilds)]
+        sellers = {guild.id: FakeMember(f"seller-{guild.id}", manage_channels=True) for guild in guilds}
+        bidders = {
+            guild.id: [FakeMember(f"bidder-{idx}") for idx in range(BIDDERS_PER_GUILD)]
+            for guild in guilds
+        }
+        channels = [channel for guild in guilds for channel in guild.channels]
+
+        # Open one auction per channel
+        await asyncio.gather(*(
+            self.invoke(
+                "start_auction",
+                FakeContext(self.bot, channel, sellers[channel.guild.id]),
+                f"item-{idx}", "1k", "100", "1h",
+            )
+            for idx, channel in enumerate(channels)
+        ))
+
+        # Zipf over a shuffled order, so the hottest auctions land in random guilds
+        random.shuffle(channels)
+        cum_weights = []
+        total = 0.0
+        for weight in zipf_weights(len(channels), args.zipf):
+            total += weight
+            cum_weights.append(total)
+        next_amount = {channel.id: 0 for channel in channels}  # Minor units
+
+        calls_before = self.rest.total_calls
+        bids = 0
+        interval = 1 / args.rate
+        deadline = time.perf_counter() + args.seconds
+        next_at = time.perf_counter()
+        next_listing = next_at
+        while time.perf_counter() < deadline:
+            now = time.perf_counter()
+            # Catch up on every bid due since the last pass
+            while next_at <= now:
+                channel = random.choices(channels, cum_weights=cum_weights)[0]
+                auction = self.cog.auctions.in_channel(channel.id)[0]
+                bidder = random.choice(bidders[channel.guild.id])
+                bids += 1
+                if random.random() < args.buttons:
+                    interaction = FakeInteraction(
+                        channel.messages[auction.message_id], bidder, f"auction:bid:{auction.id}"
+                    )
+                    self.bid_started[interaction.id] = time.perf_counter()
+                    self.spawn(self.invoke("on_interaction", interaction))
+                    next_at += interval
+                    continue
+
+                amount = max(next_amount[channel.id], auction.current_bid)
+                if random.random() >= args.stale:  # Otherwise lost a race to a higher bid
+                    amount += auction.min_increment
+                    next_amount[channel.id] = amount
+                amount_str = self.cog.format_amount(amount)
+                ctx = FakeContext(self.bot, channel, bidder, f"$bid {amount_str}")
+                self.bid_started[ctx.message.id] = time.perf_counter()
+                self.spawn(self.invoke("place_bid", ctx, amount_str))
+                next_at += interval
+            if now >= next_listing:
+                channel = random.choice(channels)
+                ctx = FakeContext(self.bot, channel, random.choice(bidders[channel.guild.id]))
+                self.spawn(self.invoke("check_ongoing_auctions", ctx, 1))
+                next_listing += 1 / args.listing_rate
+            await asyncio.sleep(max(min(next_at, next_listing) - time.perf_counter(), 0))
+
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        for queue in list(self.cog.bid_queues.values()):
+            await queue.wait_acknowledged()
+        bid_calls = self.rest.total_calls - calls_before
+
+        await asyncio.gather(*(
+            self.invoke("manual_close_auction", FakeContext(self.bot, channel, sellers[channel.guild.id]))
+            for channel in channels
+        ))
+        sampler.cancel()
+        await self.cog.cog_unload()
+        self.report(bids, bid_calls)
+
+    def report(self, bids: int, bid_calls: int):
+        print(f"{'command':<24}{'calls':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        rows = dict(self.latencies)
+        rows["bid acknowledgement"] = self.ack_latencies
+        for name, values in rows.items():
+            print(
+                f"{name:<24}{len(values):>8}{percentile(values, 0.5) * 1000:>10.2f}"
+                f"{percentile(values, 0.99) * 1000:>10.2f}{max(values, default=0) * 1000:>10.2f}"
+            )
+        print()
+        print(f"bids placed:           {bids}")
+        print(f"API calls per bid:     {bid_calls / max(bids, 1):.3f}")
+        print(f"API calls by route:    {dict(self.rest.calls)}")
+        print(f"rate limit hits:       {self.rest.rate_limit_hits}")
+        print(
+            f"outbound sent/dropped/merged: {self.cog.outbound.sent}/"
+            f"{self.cog.outbound.dropped}/{self.cog.outbound.merged}"
+        )
+        print(
+            f"embed updates/coalesced/unchanged/edits: {self.cog.embed_editor.submitted}/"
+            f"{self.cog.embed_editor.coalesced}/{self.cog.embed_editor.unchanged}/"
+            f"{self.cog.embed_editor.edits}"
+        )
+        print(
+            f"bids shed user/auction/channel: {self.cog.bid_throttle.shed['user']}/"
+            f"{self.cog.bid_throttle.shed['auction']}/{self.cog.bid_throttle.shed['channel']}"
+        )
+        print(
+            f"bid rejections sent/merged: {self.cog.rejections.sent}/{self.cog.rejections.merged}"
+        )
+        print(
+            f"event-loop lag ms p50/p99/max: {percentile(self.lag, 0.5) * 1000:.2f}/"
+            f"{percentile(self.lag, 0.99) * 1000:.2f}/{max(self.lag, default=0) * 1000:.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the auction cog with a fake Discord.")
+    parser.add_argument("--guilds", type=int, default=10, help="Number of guilds")
+    parser.add_argument("--auctions", type=int, default=5, help="Auctions per guild")
+    parser.add_argument("--rate", type=float, default=100, help="Bids per second")
+    parser.add_argument("--seconds", type=float, default=10, help="Length of the bid phase")
+    parser.add_argument("--zipf", type=float, default=1.2, help="Zipf exponent of auction popularity")
+    parser.add_argument("--stale", type=float, default=0.1, help="Fraction of command bids that are too low")
+    parser.add_argument("--buttons", type=float, default=0.0, help="Fraction of bids placed with the bid button")
+    parser.add_argument("--listing-rate", type=float, default=2, help="Ongoing auction listings per second")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated REST latency in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+    random.seed(args.seed)
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(LoadGenerator(args, directory).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/parsing_benchmark.py
+"""
+Microbenchmarks for the amount and duration parsers and the amount formatter.
+
+Each case is timed warm (memoized) and cold (cache cleared before every call).
+Run from the repository root:
+    python -m benchmarks.parsing_benchmark [min_seconds_per_case]
+"""
+import sys
+import time
+
+from utils.parsing import format_amount, parse_amount, parse_duration
+
+CASES = [
+    ("parse_amount", parse_amount, "1.5m"),
+    ("parse_amount", parse_amount, "1500"),
+    ("parse_amount", parse_amount, "1.23456789012t"),
+    ("parse_duration", parse_duration, "1d 2h 30m"),
+    ("parse_duration", parse_duration, "2 weeks 3 days"),
+    ("format_amount", format_amount, 150_000_000),
+    ("format_amount", format_amount, 123_456_789_012_345_600),
+    ("format_amount", format_amount, 99_999),
+]
+
+
+def run_case(func, argument, min_seconds: float, cold: bool) -> float:
+    """Return operations per second, timed in rounds until `min_seconds` elapsed."""
+    operations = 0
+    elapsed = 0.0
+    rounds = 1000
+    while elapsed < min_seconds:
+        start = time.perf_counter()
+        if cold:
+            for _ in range(rounds):
+                func.cache_clear()
+                func(argument)
+        else:
+            for _ in range(rounds):
+                func(argument)
+        elapsed += time.perf_counter() - start
+        operations += rounds
+    return operations / elapsed
+
+
+def main(min_seconds: float):
+    print(f"{'name':<16}{'input':<26}{'warm ops/s':>14}{'cold ops/s':>14}")
+    for name, func, argument in CASES:
+        warm = run_case(func, argument, min_seconds, cold=False)
+        cold = run_case(func, argument, min_seconds, cold=True)
+        print(f"{name:<16}{argument!r:<26}{warm:>14,.0f}{cold:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.2)
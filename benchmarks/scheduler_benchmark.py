@@ -0,0 +1,99 @@
+# benchmarks/scheduler_benchmark.py
+"""
+Compares one sleeping task per auction against the shared DeadlineScheduler.
+
+Run from the repository root:
+    python -m benchmarks.scheduler_benchmark [auctions] [seconds]
+"""
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+
+from utils.scheduler import DeadlineScheduler
+
+REFRESH_PERIOD = 0.5  # Seconds between simulated embed refreshes
+
+
+async def run_per_task(auctions: int, seconds: float) -> dict:
+    wakeups = 0
+    start = time.time()
+
+    async def close(end_time):
+        nonlocal wakeups
+        while time.time() < end_time:
+            await asyncio.sleep(end_time - time.time())
+            wakeups += 1
+
+    async def refresh(end_time):
+        nonlocal wakeups
+        while time.time() < end_time:
+            await asyncio.sleep(REFRESH_PERIOD)
+            wakeups += 1
+
+    tracemalloc.start()
+    tasks = []
+    for _ in range(auctions):
+        end_time = start + random.uniform(seconds / 2, seconds)
+        tasks.append(asyncio.create_task(close(end_time)))
+        tasks.append(asyncio.create_task(refresh(end_time)))
+    await asyncio.sleep(0)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    await asyncio.gather(*tasks)
+    return {"memory": memory, "wakeups": wakeups, "elapsed": time.time() - start}
+
+
+async def run_scheduler(auctions: int, seconds: float) -> dict:
+    scheduler = DeadlineScheduler()
+    start = time.time()
+
+    def arm_refresh(key, end_time):
+        async def refresh():
+            if time.time() < end_time:
+                arm_refresh(key, end_time)
+
+        scheduler.schedule((key, "refresh"), time.time() + REFRESH_PERIOD, refresh)
+
+    async def close():
+        pass
+
+    tracemalloc.start()
+    for key in range(auctions):
+        end_time = start + random.uniform(seconds / 2, seconds)
+        scheduler.schedule((key, "close"), end_time, close)
+        arm_refresh(key, end_time)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    scheduler.start()
+    while len(scheduler):
+        await asyncio.sleep(0.1)
+    await scheduler.stop()
+    return {
+        "memory": memory,
+        "wakeups": scheduler.wakeups,
+        "elapsed": time.time() - start,
+    }
+
+
+def report(name: str, auctions: int, result: dict):
+    print(
+        f"{name:<12} {result['memory'] / 1024:>10.1f} KiB "
+        f"{result['memory'] / auctions:>8.1f} B/auction "
+        f"{result['wakeups'] / result['elapsed']:>12.1f} wakeups/s"
+    )
+
+
+async def main(auctions: int, seconds: float):
+    print(f"{auctions} concurrent auctions over {seconds}s")
+    report("per-task", auctions, await run_per_task(auctions, seconds))
+    report("scheduler", auctions, await run_scheduler(auctions, seconds))
+
+
+if __name__ == "__main__":
+    auction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    asyncio.run(main(auction_count, duration))
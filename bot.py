@@ -4,30 +4,104 @@ from discord.ext import commands
 import os
 from dotenv import load_dotenv
 import asyncio
+from utils.logging_setup import setup_logging
+from utils.utilities import resident_memory_bytes
 
 # Load environment variables from .env file
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 
-# Configure logging to output to a file and the console with a specific format
-logging.basicConfig(level=logging.INFO)
+# Sharding configuration. launcher.py sets these for each cluster process.
+SHARD_COUNT = os.getenv('SHARD_COUNT')  # Total number of shards across all clusters
+SHARD_IDS = os.getenv('SHARD_IDS')  # Comma-separated shards run by this process
+CLUSTER_ID = int(os.getenv('CLUSTER_ID', '0'))  # Index of this process among the clusters
+CLUSTER_COUNT = int(os.getenv('CLUSTER_COUNT', '1'))  # Number of cluster processes
+AUTO_SHARD = os.getenv('AUTO_SHARD', '').lower() in ('1', 'true', 'yes')
+
+# Runtime profile: 'default', or 'lean' to trim intents and caches to what the cogs use
+BOT_PROFILE = os.getenv('BOT_PROFILE', 'default').lower()
+IDLE_MEMORY_DELAY = 60  # Seconds after connecting before the idle memory is logged
+
+# Logging configuration. Records are written to the console and a rotating log file
+# by a background thread, so disk writes never block the event loop.
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()  # 'text' or 'json'
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))  # Rotate at this size...
+LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN')  # ...or at this interval instead, e.g. 'midnight'
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))  # Rotated files to keep
+
+log_file = 'discord_bot.log' if CLUSTER_COUNT == 1 else f'discord_bot-cluster{CLUSTER_ID}.log'
+log_listener = setup_logging(
+    log_file,
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    json_format=LOG_FORMAT == 'json',
+    max_bytes=LOG_MAX_BYTES,
+    backup_count=LOG_BACKUP_COUNT,
+    rotate_when=LOG_ROTATE_WHEN,
+)
 logger = logging.getLogger('discord_bot')
-logger.setLevel(logging.INFO)
-handler = logging.FileHandler(filename='discord_bot.log', encoding='utf-8', mode='w')
-handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(name)s: %(message)s'))
-logger.addHandler(handler)
 
-# Define the intents for the bot (e.g., server messages, reactions)
-intents = discord.Intents.default()
-intents.message_content = True  # Enable message content intent
+if BOT_PROFILE == 'lean':
+    # The cogs only read commands in guild channels and receive interactions, which are
+    # always delivered. Guilds are kept for the channel and role caches.
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.guild_messages = True
+    intents.message_content = True
+    client_options = dict(
+        max_messages=None,  # No message cache; auction messages are edited through cached handles
+        member_cache_flags=discord.MemberCacheFlags.none(),
+        chunk_guilds_at_startup=False,
+    )
+else:
+    # Define the intents for the bot (e.g., server messages, reactions)
+    intents = discord.Intents.default()
+    intents.message_content = True  # Enable message content intent
+    client_options = {}
 
-# Create an instance of the bot with a specific command prefix and the defined intents
-bot = commands.Bot(command_prefix='$', intents=intents)
+# Create an instance of the bot with a specific command prefix and the defined intents.
+# An auto-sharded bot is used when sharding is requested; it runs every shard in
+# SHARD_IDS (or all shards, if unset) on one gateway connection manager.
+if AUTO_SHARD or SHARD_COUNT or SHARD_IDS:
+    bot = commands.AutoShardedBot(
+        command_prefix='$',
+        intents=intents,
+        shard_count=int(SHARD_COUNT) if SHARD_COUNT else None,
+        shard_ids=[int(shard_id) for shard_id in SHARD_IDS.split(',')] if SHARD_IDS else None,
+        **client_options,
+    )
+else:
+    bot = commands.Bot(command_prefix='$', intents=intents, **client_options)
+
+# Cogs use these to keep per-cluster state apart
+bot.cluster_id = CLUSTER_ID
+bot.cluster_count = CLUSTER_COUNT
 
 # Event listener for when the bot successfully connects to Discord
 @bot.event
 async def on_ready():
-    logger.info(f'{bot.user.name} has connected to Discord!')
+    logger.info('%s has connected to Discord!', bot.user.name)
+    if bot.shard_ids:
+        logger.info(
+            'Cluster %s is running shards %s of %s',
+            CLUSTER_ID,
+            bot.shard_ids,
+            bot.shard_count,
+        )
+    if not getattr(bot, 'idle_memory_logged', False):
+        bot.idle_memory_logged = True
+        bot.loop.call_later(IDLE_MEMORY_DELAY, log_idle_memory)
+
+
+def log_idle_memory():
+    rss = resident_memory_bytes()
+    logger.info(
+        'Resident memory with the %s profile, %ss after connecting to %s guilds: %.1f MiB',
+        BOT_PROFILE,
+        IDLE_MEMORY_DELAY,
+        len(bot.guilds),
+        (rss or 0) / 2**20,
+    )
 
 # Function to load cogs asynchronously
 async def load_cogs():
@@ -35,13 +109,38 @@ async def load_cogs():
     await bot.load_extension('cogs.auction.auction')
     # Load the help cog
     await bot.load_extension('cogs.help')
+    # Load the metrics endpoint
+    await bot.load_extension('cogs.metrics')
+    # Load the event-loop watchdog and profiler
+    await bot.load_extension('cogs.diagnostics')
 
-# Main coroutine that loads the cogs and starts the bot
+# Main coroutine that loads the cogs and starts the bot.
+# The context manager closes the bot on shutdown, which unloads the cogs so they can flush their state.
 async def main():
-    await load_cogs()
-    await bot.start(TOKEN)
+    logger.info(
+        'Starting with the %s profile (event loop: %s, JSON: %s)',
+        BOT_PROFILE,
+        type(asyncio.get_running_loop()).__module__.split('.')[0],
+        'orjson' if discord.utils.HAS_ORJSON else 'json',
+    )
+    async with bot:
+        await load_cogs()
+        await bot.start(TOKEN)
 
 # Entry point for the script
 if __name__ == '__main__':
+    # Optional speedups of the lean profile: uvloop replaces the event loop when it is
+    # installed. discord.py decodes gateway and HTTP JSON with orjson on its own.
+    if BOT_PROFILE == 'lean':
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     # Start the event loop and run the main coroutine
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        # Write out the records still queued for the logging thread
+        log_listener.stop()
@@ -3,28 +3,168 @@ from discord.ext import commands, tasks
 import logging
 from .auction_helpers import AuctionHelpers
 from .auction_commands import AuctionCommands
+from .embed_editor import EmbedEditPipeline
+from .handoff import AuctionHandoff, claim_handoff, stash_handoff
+from .outbound import OutboundDispatcher, discord_rate_limits
+from .rehydration import AuctionRehydrator
+from .rejections import RejectionBatcher
+from utils.auction_journal import AuctionJournal
+from utils.auction_registry import AuctionRegistry
+from utils.auction_store import AuctionStore
+from utils.ids import SnowflakeGenerator
+from utils.rate_limit import BidThrottle
+from utils.scheduler import DeadlineScheduler
 from datetime import datetime
+import asyncio
 import discord
+import os
+import time
+from typing import Optional
 
 # Configure logger for the cog
 logger = logging.getLogger("discord_bot")
 
 
 class Auction(commands.Cog, AuctionCommands, AuctionHelpers):
-    MAX_AUCTIONS_PER_GUILD = 10  # Limit the number of concurrent auctions per guild
+    MAX_AUCTIONS_PER_GUILD = 10  # Default limit of concurrent auctions per guild
+    MAX_GUILD_CAPACITY = 100  # Highest limit a guild can set for itself
     MIN_AUCTION_DURATION = 5 * 60  # Minimum duration for an auction in seconds
+    MAX_AUCTION_DURATION = 365 * 86400  # Maximum duration for an auction in seconds
     BID_EMOJI_TOGGLE = True  # Toggle to enable/disable bid emoji reactions
     MIN_BID_TIME = 3 * 60  # Minimum time between bids in seconds
+    PROXY_BID_KEYWORDS = ("max", "proxy")  # Bid options that place a hidden maximum bid
+    TOP_BIDDERS_SHOWN = 5  # Number of bidders ranked in the auction embed
+    ONGOING_PAGE_SIZE = 5  # Auctions listed per page of the ongoing auctions command
+    HISTORY_PAGE_SIZE = 10  # Closed auctions listed per page of the history command
+    LEADERBOARD_SIZE = 10  # Members ranked by the leaderboard commands
+    MIN_WIN_RATE_AUCTIONS = 3  # Auctions a member must have bid in to be ranked by win rate
+    EMBED_EDIT_DEBOUNCE = 2.0  # Seconds to collect updates before editing an auction embed
+    REFRESH_SLACK = 0.5  # Seconds past a display change before refreshing an embed
+    CHANNEL_SEND_RATE = 5  # Outbound calls assumed allowed per route and channel...
+    CHANNEL_SEND_PER = 5.0  # ...within this many seconds, until Discord reports the limits
+    CHANNEL_QUEUE_LIMIT = 50  # Queued outbound calls per channel before shedding
+    USER_BID_RATE = (3, 3.0)  # Bids admitted per user, per this many seconds
+    AUCTION_BID_RATE = (10, 1.0)  # Bids admitted per auction, per this many seconds
+    CHANNEL_BID_RATE = (15, 1.0)  # Bids admitted per channel, per this many seconds
+    REJECTION_WINDOW = 5.0  # Seconds bid rejections in a channel are collected into one message
+    DATABASE_PATH = "auctions.db"  # SQLite file holding live auctions
+    SNAPSHOT_INTERVAL = 30.0  # Seconds between database snapshots of the journal
+    JOURNAL_DIRECTORY = "journal"  # Directory holding the auction journal segments
+    JOURNAL_FSYNC_INTERVAL = 0.2  # Seconds between journal fsync batches
+    REHYDRATE_CONCURRENCY = 5  # Channels resolved at once when restoring auctions
+    BULK_MAX_AUCTIONS = 50  # Auctions one bulk listing may start
+    BULK_MAX_FILE_SIZE = 64 * 1024  # Bytes of an attached bulk listing
+    BULK_POST_INTERVAL = 0.5  # Seconds between the posts of a bulk listing
+    BULK_CLOSE_STAGGER = 15  # Seconds between the deadlines of consecutive bulk auctions
 
-    def __init__(self, bot: commands.Bot):
+    def __init__(self, bot: commands.Bot, handoff: Optional[AuctionHandoff] = None):
         self.bot = bot
-        self.auctions = {}
-        self.next_auction_id = 1
+        self.handoff = handoff  # State left by the instance this one replaces on reload
+        self.auctions = AuctionRegistry()
+        self.bid_queues = {}  # Single-writer bid queue per auction ID
+        self.scheduler = DeadlineScheduler()  # Shared closing and refresh deadlines
+        self.outbound = OutboundDispatcher(
+            self.CHANNEL_SEND_RATE,
+            self.CHANNEL_SEND_PER,
+            self.CHANNEL_QUEUE_LIMIT,
+            discord_rate_limits(bot.http),
+        )
+        self.embed_editor = EmbedEditPipeline(
+            bot, self.EMBED_EDIT_DEBOUNCE, self.outbound
+        )
+        self.bid_throttle = BidThrottle(
+            self.USER_BID_RATE, self.AUCTION_BID_RATE, self.CHANNEL_BID_RATE
+        )
+        self.rejections = RejectionBatcher(self.REJECTION_WINDOW, self._send_rejection)
+        # Set by bot.py when running as one cluster of a multi-process deployment
+        self.cluster_id = getattr(bot, "cluster_id", 0)
+        self.cluster_count = getattr(bot, "cluster_count", 1)
+        self.id_generator = SnowflakeGenerator(self.cluster_id)
+        journal_directory = self.JOURNAL_DIRECTORY
+        if self.cluster_count > 1:
+            journal_directory = os.path.join(journal_directory, f"cluster-{self.cluster_id}")
+        self.journal = AuctionJournal(journal_directory, self.JOURNAL_FSYNC_INTERVAL)
+        self.store = AuctionStore(
+            self.DATABASE_PATH, self.SNAPSHOT_INTERVAL, on_commit=self._on_snapshot
+        )
+        self.static_descriptions = {}  # Auction ID -> rendered lines that never change
+        self.guild_capacities = {}  # Guild ID -> concurrent auction limit, where changed
+        self.restored = False  # Whether reloaded auctions were reconnected to Discord
+        self.rehydration: Optional[asyncio.Task] = None  # Reconnection in progress
+        self.command_tasks = set()  # Tasks running a command of this cog
+        self.load_started = None  # perf_counter() when the cog started loading
         AuctionCommands.__init__(self, bot)
         AuctionHelpers.__init__(self, bot)
 
+    async def cog_load(self):
+        self.load_started = time.perf_counter()
+        await self.store.open()
+        self.guild_capacities = await self.store.load_guild_capacities()
+        await self.journal.open()
+        if self.handoff is not None:
+            self.handoff.adopt(self)
+            self.handoff = None
+            logger.info(
+                "Adopted %s live auctions from the previous instance in %.1f ms",
+                len(self.auctions),
+                (time.perf_counter() - self.load_started) * 1000,
+            )
+        else:
+            await self._load_auctions()
+        if not self.restored and self.bot.is_ready():
+            # Loaded into a running bot, so on_ready will not come to reconnect the auctions
+            asyncio.create_task(self.on_ready())
+        self.scheduler.start()
+
+    async def cog_before_invoke(self, ctx: commands.Context):
+        self.command_tasks.add(asyncio.current_task())
+
+    async def cog_after_invoke(self, ctx: commands.Context):
+        self.command_tasks.discard(asyncio.current_task())
+
+    async def cog_unload(self):
+        # Commands still running would register or arm auctions on this cog after the handoff
+        if self.command_tasks:
+            await asyncio.wait(list(self.command_tasks))
+        # A reconnection in progress arms its auctions when it ends, so they are handed over armed
+        if self.rehydration is not None:
+            await asyncio.wait([self.rehydration])
+        await self.scheduler.stop()
+        # Let closings that already started finish, and settle the bids still queued
+        await self.scheduler.wait_running()
+        for queue in self.bid_queues.values():
+            queue.flush()
+        await asyncio.gather(*(queue.wait_acknowledged() for queue in self.bid_queues.values()))
+        self.rejections.close()
+        # Pending edits and queued calls are handed over unsent rather than waited for
+        handoff = AuctionHandoff.export(self)
+        await self.store.close()
+        await self.journal.close()
+        # Everything is written, so a replacement loaded next can take over from memory
+        stash_handoff(self.bot, handoff)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Channels are only resolvable once connected, so restored auctions are
+        # reconnected to their messages and armed here
+        if self.restored or self.rehydration is not None:
+            return
+        self.rehydration = asyncio.create_task(self._rehydrate())
+        try:
+            await self.rehydration
+        finally:
+            self.rehydration = None
+        logger.info(
+            "All auctions live %.2fs after the cog started loading",
+            time.perf_counter() - self.load_started,
+        )
+
+    async def _rehydrate(self):
+        await AuctionRehydrator(self, self.REHYDRATE_CONCURRENCY).run()
+        self.restored = True
+
 
 async def setup(bot: commands.Bot):
-    """Sets up the Auction cog."""
-    await bot.add_cog(Auction(bot))
+    """Sets up the Auction cog, taking over the state of the one it replaces on reload."""
+    await bot.add_cog(Auction(bot, claim_handoff(bot)))
     logger.info("Auction cog loaded")
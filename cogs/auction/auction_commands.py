@@ -1,11 +1,19 @@
 # cogs/auction/auction_commands.py
 import discord
 from discord.ext import commands, tasks
-from utils.auction_data import AuctionData
+from utils.auction_data import MAX_AMOUNT, AuctionData
+from utils.proxy_bidding import resolve_proxy_bids
 from utils.utilities import parse_duration, format_time_remaining
+from .bid_queue import PendingBid
+from .bid_view import CustomBidModal, parse_custom_id
+from .bulk import parse_listing
+from .ongoing_view import OngoingAuctionsView
+from .outbound import Priority
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 
 logger = logging.getLogger("discord_bot")
@@ -14,7 +22,6 @@ logger = logging.getLogger("discord_bot")
 class AuctionCommands:
     def __init__(self, bot):
         self.bot = bot
-        self.auction_timers = {}  # Dictionary to keep track of auction tasks
 
     @commands.command(
         name="startauction",
@@ -30,7 +37,7 @@ class AuctionCommands:
         *duration_parts: str,
     ):
         """Starts a new auction with the provided item, starting bid, minimum increment, and duration."""
-        logger.info(f"{ctx.author} invoked the start_auction command")
+        logger.info("%s invoked the start_auction command", ctx.author)
 
         # Parse starting bid and min increment
         starting_bid = self.parse_amount(starting_bid_str)
@@ -45,7 +52,10 @@ class AuctionCommands:
             return
 
         # Parse and validate duration
-        duration = parse_duration(" ".join(duration_parts))
+        try:
+            duration = parse_duration(" ".join(duration_parts))
+        except (ValueError, OverflowError):
+            duration = None  # Too large for a timedelta
         if not await self._validate_duration(ctx, duration):
             return
 
@@ -56,127 +66,436 @@ class AuctionCommands:
             auction_id, item, starting_bid, min_increment, end_time, ctx
         )
 
-        auction_message = await ctx.send(embed=self._build_auction_embed(new_auction))
+        auction_embed = self._build_auction_embed(new_auction)
+        auction_message = await self._send(
+            ctx,
+            Priority.RESULT,
+            embed=auction_embed,
+            view=self._build_bid_view(new_auction),
+        )
+        if auction_message is None:
+            logger.error("Auction message for %s could not be sent.", item)
+            return
         new_auction.message_id = auction_message.id
+        self.embed_editor.bind(auction_message, auction_embed)
 
         self._set_auction(ctx, new_auction)
         logger.info(
-            f"Auction started for {item} in guild {ctx.guild.name} (ID: {ctx.guild.id})"
+            "Auction started for %s in guild %s (ID: %s)",
+            item,
+            ctx.guild.name,
+            ctx.guild.id,
         )
 
-        self.bot.loop.create_task(self.close_auction(ctx, auction_id, ctx.guild.id))
-        auction_timer = asyncio.create_task(self.run_timer(ctx, new_auction))
-        self.auction_timers[new_auction.id] = auction_timer
+        self._arm_auction(new_auction)
 
     @commands.command(
-        name="bid",
-        aliases=["placebid", "b"],
-        help="Places a bid on the active auction with the given bid amount.",
+        name="bulkauction",
+        aliases=["bulkstart", "bulk"],
+        help=(
+            "Starts several auctions from an attached CSV file, or one auction per line: "
+            "item, starting bid, minimum increment, duration and an optional channel."
+        ),
     )
-    async def place_bid(self, ctx: commands.Context, bid_amount_str: str):
-        """Places a bid on an active auction with the given auction ID and bid amount."""
-        logger.info(f"{ctx.author} attempted to bid with {bid_amount_str}")
+    async def bulk_start_auctions(self, ctx: commands.Context, *, listing: str = ""):
+        """Validates a whole listing of auctions, then starts them all at a paced rate."""
+        logger.info("%s invoked the bulk_start_auctions command", ctx.author)
 
-        bid_amount = self.parse_amount(bid_amount_str)
-        if bid_amount is None:
-            embed = discord.Embed(
-                title="Error",
-                description="Invalid bid format. Please enter a number or use formats like '1k', '1m', etc.",
-                color=discord.Color.red(),
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
+            )
+            return
+        if not ctx.author.guild_permissions.manage_channels:
+            await self._send_error_message(
+                ctx, "You need the Manage Channels permission to start auctions in bulk."
             )
-            await ctx.send(embed=embed)
             return
 
-        if not await self._validate_guild_context_and_auction(ctx):
+        if ctx.message.attachments:
+            attachment = ctx.message.attachments[0]
+            if attachment.size > self.BULK_MAX_FILE_SIZE:
+                await self._send_error_message(ctx, "The attached listing is too large.")
+                return
+            try:
+                listing = (await attachment.read()).decode("utf-8-sig")
+            except (discord.HTTPException, UnicodeDecodeError) as e:
+                logger.error("Failed to read bulk listing %s: %s", attachment.filename, e)
+                await self._send_error_message(
+                    ctx, "The attached listing could not be read as a UTF-8 CSV file."
+                )
+                return
+
+        # Every line is validated before anything is created, and all errors are reported together
+        rows, errors = parse_listing(
+            listing, self.MIN_AUCTION_DURATION, self.MAX_AUCTION_DURATION
+        )
+        if not rows and not errors:
+            await self._send_error_message(
+                ctx,
+                "No auctions were listed. Attach a CSV file or write one auction per line, "
+                "like `\"Rare Painting\", 1000, 100, 2h 30m, #auctions`.",
+            )
+            return
+        channels, channel_errors = self._validate_bulk_rows(ctx, rows)
+        errors += channel_errors
+        if errors:
+            shown = errors[:15]
+            if len(errors) > len(shown):
+                shown.append(f"...and {len(errors) - len(shown)} more errors.")
+            await self._send_error_message(
+                ctx, "No auctions were started:\n" + "\n".join(shown)
+            )
             return
 
-        auction = self._get_auction(ctx)
-        if not self._validate_bid(auction, bid_amount):
-            embed = discord.Embed(
-                title="Error",
-                description=f"Your bid must be at least {self.format_amount(auction.min_increment)} higher than the current bid of {self.format_amount(auction.current_bid)}.",
-                color=discord.Color.red(),
+        # Registered up front to reserve the channels and the guild's capacity
+        auction_ids = self._generate_auction_ids(len(rows))
+        now = datetime.now()
+        auctions = []
+        for index, (row, channel, auction_id) in enumerate(zip(rows, channels, auction_ids)):
+            auction = AuctionData(
+                id=auction_id,
+                item=row.item,
+                starting_bid=row.starting_bid,
+                min_increment=row.min_increment,
+                # Staggered so auctions of equal duration do not all close at once
+                end_time=now + row.duration + timedelta(seconds=index * self.BULK_CLOSE_STAGGER),
+                channel_id=channel.id,
+                guild_id=ctx.guild.id,
+                creator_name=ctx.author.display_name,
+                creator_id=ctx.author.id,
+            )
+            self._set_auction(ctx, auction)
+            auctions.append(auction)
+
+        posts = []
+        for channel, auction in zip(channels, auctions):
+            posts.append(asyncio.create_task(self._post_auction(channel, auction)))
+            await asyncio.sleep(self.BULK_POST_INTERVAL)
+        results = await asyncio.gather(*posts)
+
+        started = [auction for auction, posted in zip(auctions, results) if posted]
+        description = f"Started {len(started)} of {len(auctions)} auctions."
+        if len(started) < len(auctions):
+            failed = ", ".join(auction.item for auction, posted in zip(auctions, results) if not posted)
+            description += f"\nThese could not be posted: {failed}"
+        await self._send(
+            ctx,
+            Priority.REPLY,
+            embed=discord.Embed(
+                title="Bulk Auction", description=description, color=discord.Color.blue()
+            ),
+        )
+        logger.info(
+            "Started %s auctions in bulk in guild %s (ID: %s)",
+            len(started),
+            ctx.guild.name,
+            ctx.guild.id,
+        )
+
+    @commands.command(
+        name="auctioncapacity",
+        aliases=["capacity", "maxauctions"],
+        help="Shows or sets how many auctions can run at once in the server. Use 'default' to reset it.",
+    )
+    async def auction_capacity(self, ctx: commands.Context, limit: Optional[str] = None):
+        """Shows or changes the concurrent auction limit of the guild."""
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
             )
-            await ctx.send(embed=embed)
             return
 
-        auction.current_bid = bid_amount
-        auction.bidders[ctx.author.display_name] = bid_amount
-        if self._get_remaining_time(auction) < self.MIN_BID_TIME:
-            auction.end_time = datetime.now() + timedelta(seconds=self.MIN_BID_TIME)
-        await self.update_auction_embed(auction)
+        if limit is not None:
+            if not ctx.author.guild_permissions.manage_guild:
+                await self._send_error_message(
+                    ctx, "You need the Manage Server permission to change the auction limit."
+                )
+                return
+            if limit.lower() == "default":
+                capacity = None
+            elif limit.isdigit() and 1 <= int(limit) <= self.MAX_GUILD_CAPACITY:
+                capacity = int(limit)
+            else:
+                await self._send_error_message(
+                    ctx,
+                    f"The auction limit must be a number from 1 to {self.MAX_GUILD_CAPACITY}, or 'default'.",
+                )
+                return
+            if capacity is None:
+                self.guild_capacities.pop(ctx.guild.id, None)
+            else:
+                self.guild_capacities[ctx.guild.id] = capacity
+            self.store.set_guild_capacity(ctx.guild.id, capacity)
+            logger.info(
+                "%s set the auction limit of guild %s to %s", ctx.author, ctx.guild.id, limit
+            )
 
-        logger.info(f"Bid placed on auction {auction.id} by {ctx.author.display_name}")
-        if self.BID_EMOJI_TOGGLE:
-            await ctx.message.add_reaction("✅")
-        else:
-            embed = discord.Embed(
-                title="Bid Placed Successfully",
-                description=f"Current highest bid: {bid_amount_str} by {ctx.author.display_name}",
+        await self._send(
+            ctx,
+            Priority.REPLY,
+            embed=discord.Embed(
+                title="Auction Capacity",
+                description=(
+                    f"{self.auctions.count(ctx.guild.id)} of "
+                    f"{self._get_guild_capacity(ctx.guild.id)} auctions are running in this server."
+                ),
                 color=discord.Color.blue(),
+            ),
+        )
+
+    @commands.command(
+        name="bid",
+        aliases=["placebid", "b"],
+        usage="[auction_id] <bid_amount> [max]",
+        help=(
+            "Places a bid with the given bid amount on the auction with the given ID, or on the "
+            "auction of the channel. Add 'max' to bid automatically for you up to that amount, "
+            "keeping it hidden."
+        ),
+    )
+    async def place_bid(self, ctx: commands.Context, *arguments: str):
+        """Places a bid on an auction, addressed by its ID or by the channel it runs in."""
+        logger.info("%s attempted to bid with %s", ctx.author, " ".join(arguments))
+
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
             )
-            embed.set_footer(text=f"Auction ID: {auction.id}")
-            await ctx.send(embed=embed)
+            return
+
+        # Throttled before anything is sent, so spam cannot spend the channel's rate limit
+        auction_id, bid_amount_str, mode = self._split_bid_arguments(arguments)
+        # A maximum bid must stay hidden, even when it is rejected
+        reject = self._reject_bid if mode is None else self._reject_proxy_bid
+        auction, not_found = self._find_auction(ctx, auction_id)
+        shed_reason = self._throttle_bid(ctx.author.id, auction, ctx.channel.id)
+        if shed_reason:
+            await reject(ctx, shed_reason)
+            return
+
+        if bid_amount_str is None:
+            await reject(
+                ctx, f"Usage: `{ctx.prefix}{ctx.invoked_with} [auction ID] <amount> [max]`"
+            )
+            return
+        bid_amount = self.parse_amount(bid_amount_str)
+        if bid_amount is None:
+            await reject(
+                ctx,
+                "Invalid bid format. Please enter a number or use formats like '1k', '1m', etc.",
+            )
+            return
 
-    async def close_auction(
-        self, ctx, auction_id: str, guild_id: int, manual: bool = False
-    ):
-        """Closes the auction identified by the auction ID, either manually or automatically after the set duration."""
-        logger.info(f"Attempting to close auction {auction_id} in guild {guild_id}")
-        auction = self._get_auction(ctx)
         if not auction:
-            logger.error(f"Auction {auction_id} not found in guild {guild_id}.")
+            await reject(ctx, not_found)
             return
 
-        if not manual:
-            await self._wait_for_auction_end(auction)
+        # Validation and acceptance happen in the auction's bid queue, in arrival order
+        self._get_bid_queue(auction).submit(
+            PendingBid(ctx, ctx.author, bid_amount, bid_amount_str, mode is not None)
+        )
 
-        if not self._is_auction_active(ctx):
+    def _split_bid_arguments(
+        self, arguments: Tuple[str, ...]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Split `[auction ID] <amount> [max]` into (auction ID, amount, mode).
+        The ID and amount are None if the arguments do not fit that shape.
+        """
+        arguments = list(arguments)
+        mode = None
+        if len(arguments) > 1 and arguments[-1].lower() in self.PROXY_BID_KEYWORDS:
+            mode = arguments.pop()
+        if len(arguments) == 1:
+            return None, arguments[0], mode
+        if len(arguments) == 2 and arguments[0].isdigit():
+            return arguments[0], arguments[1], mode
+        return None, None, mode
+
+    def _process_bid(self, auction: AuctionData, bid: PendingBid):
+        """Validates and applies one queued bid. Must not await."""
+        if not self._is_auction_live(auction):
+            bid.reason = "This auction has already ended."
             return
-        self._cancel_auction_timer(auction_id)
+        if bid.proxy:
+            if not self._set_proxy_bid(auction, bid):
+                return
+            bids = []
+        else:
+            if not self._check_direct_bid(auction, bid):
+                return
+            bids = [(bid.bidder.id, bid.bidder.display_name, bid.amount)]
+
+        # Hidden maximums answer right away; only the outcome of the bid war is recorded
+        if bids:
+            leader_id, price = bids[-1][0], bids[-1][2]
+        else:
+            leader = auction.highest_bid
+            leader_id, price = (leader[0] if leader else None), auction.current_bid
+        bids += [
+            (bidder_id, auction.bidder_names[bidder_id], amount)
+            for bidder_id, amount in resolve_proxy_bids(
+                leader_id, price, auction.min_increment, auction.proxies or {}
+            )
+        ]
+
+        if bids and self._get_remaining_time(auction) < self.MIN_BID_TIME:
+            self._extend_auction(
+                auction, datetime.now() + timedelta(seconds=self.MIN_BID_TIME)
+            )
+        for bidder_id, bidder_name, amount in bids:
+            self._record_bid(auction, bidder_id, bidder_name, amount)
+        auction.prune_proxies()
+        bid.accepted = True
+        logger.info(
+            "Bid placed on auction %s by %s, %s bids recorded",
+            auction.id,
+            bid.bidder.display_name,
+            len(bids),
+        )
+
+    def _check_direct_bid(self, auction: AuctionData, bid: PendingBid) -> bool:
+        """Validates a bid of a fixed amount, resolving quick bids. Must not await."""
+        if bid.amount is None:
+            # Quick bid: the minimum raise over the highest bid at processing time
+            bid.amount = auction.current_bid + auction.min_increment
+            if bid.amount > MAX_AMOUNT:
+                bid.reason = "This auction cannot be raised any further."
+                return False
+            bid.amount_str = self.format_amount(bid.amount)
+        if not self._validate_bid(auction, bid.amount):
+            bid.reason = f"Your bid must be at least {self.format_amount(auction.min_increment)} higher than the current bid of {self.format_amount(auction.current_bid)}."
+            return False
+        return True
+
+    async def _acknowledge_bids(self, auction: AuctionData, batch: list):
+        """Sends one embed update and every reply for a batch of processed bids."""
+        acknowledgements = []
+        # A button bid answers its interaction by editing the auction message, which
+        # replaces the channel edit and costs no channel rate limit
+        responder = next(
+            (
+                bid
+                for bid in reversed(batch)
+                if bid.accepted
+                and isinstance(bid.source, discord.Interaction)
+                and bid.source.message is not None
+                and bid.source.message.id == auction.message_id
+            ),
+            None,
+        )
+        if responder:
+            embed = self._build_auction_embed(auction)
+            self.embed_editor.discard(auction.message_id)
+            self.embed_editor.record(auction.message_id, embed)
+            acknowledgements.append(responder.source.response.edit_message(embed=embed))
+        elif any(bid.accepted for bid in batch):
+            acknowledgements.append(
+                self.update_auction_embed(auction, priority=Priority.BID)
+            )
+
+        for bid in batch:
+            ctx = bid.source
+            if isinstance(ctx, discord.Interaction):
+                if not bid.accepted:
+                    acknowledgements.append(self._send_interaction_error(ctx, bid.reason))
+                elif bid is not responder:
+                    acknowledgements.append(ctx.response.defer())
+            elif not bid.accepted and bid.proxy:
+                acknowledgements.append(self._reject_proxy_bid(ctx, bid.reason))
+            elif not bid.accepted:
+                acknowledgements.append(self._reject_bid(ctx, bid.reason))
+            elif bid.proxy:
+                # The command shows the maximum, which must stay hidden
+                acknowledgements.append(self._delete_invocation(ctx))
+            elif self.BID_EMOJI_TOGGLE:
+                acknowledgements.append(self._react(ctx, "✅"))
+            else:
+                embed = discord.Embed(
+                    title="Bid Placed Successfully",
+                    description=f"Current highest bid: {bid.amount_str} by {bid.bidder.display_name}",
+                    color=discord.Color.blue(),
+                )
+                embed.set_footer(text=f"Auction ID: {auction.id}")
+                acknowledgements.append(self._send(ctx, Priority.BID, embed=embed))
+
+        for result in await asyncio.gather(*acknowledgements, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to acknowledge a bid on auction %s: %s", auction.id, result
+                )
+
+    async def close_auction(self, auction: AuctionData, manual: bool = False):
+        """Closes the given auction, either manually or automatically once its end time is reached."""
+        logger.info(
+            "Attempting to close auction %s in guild %s", auction.id, auction.guild_id
+        )
+        if not self._is_auction_live(auction):
+            logger.error(
+                "Auction %s not found in guild %s.", auction.id, auction.guild_id
+            )
+            return
+
+        if not manual and self._get_remaining_time(auction) > 0:
+            # The end time was extended after this close was scheduled
+            self._schedule_close(auction)
+            return
+
+        self._cancel_auction_timer(auction.id)
+        self._remove_auction(auction, closed_at=time.time())
+        self.bid_queues.pop(auction.id, None)
 
         announcement, color = self._determine_winner(auction)
         await self._announce_winner(
-            auction.channel_id, auction.item, announcement, color, auction_id
+            auction.channel_id, auction.item, announcement, color, auction.id
         )
         auction.active = False
-        await self.update_auction_embed(auction)
-        self._remove_auction(ctx)
+        await self.update_auction_embed(
+            auction, immediate=True, priority=Priority.RESULT, clear_view=True
+        )
+        self.embed_editor.forget(auction.message_id)
+        self.static_descriptions.pop(auction.id, None)
 
     @commands.command(
         name="closeauction",
         aliases=["ca", "endauction", "close", "end"],
-        help="Closes the auction with the given auction ID.",
+        help="Closes the auction with the given auction ID, or the auction of the channel.",
     )
-    async def manual_close_auction(self, ctx: commands.Context):
+    async def manual_close_auction(
+        self, ctx: commands.Context, auction_id: Optional[str] = None
+    ):
         """Allows server staff to manually close an auction before its set duration ends."""
-        logger.info(f"{ctx.author} invoked the manual_close_auction command")
+        logger.info("%s invoked the manual_close_auction command", ctx.author)
 
-        if not await self._validate_guild_context_and_auction(ctx):
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
+            )
             return
 
-        auction = self._get_auction(ctx)
+        auction, not_found = self._find_auction(ctx, auction_id)
         if not auction:
-            await self._send_error_message(
-                ctx, f"Auction not found in current channel."
-            )
+            await self._send_error_message(ctx, not_found)
             return
 
         if not await self._validate_close_auction_permissions(ctx, auction):
             return
 
-        await self.close_auction(ctx, auction.id, ctx.guild.id, manual=True)
+        await self.close_auction(auction, manual=True)
         closed_by = ctx.author.display_name
 
-        await ctx.send(
+        await self._send(
+            ctx,
+            Priority.RESULT,
             embed=discord.Embed(
                 title="Auction Closed",
                 description=f"Auction {auction.id} has been closed manually by {closed_by}.",
                 color=discord.Color.orange(),
-            )
+            ),
         )
         logger.info(
-            f"Auction {auction.id} closed manually by {ctx.author.display_name}"
+            "Auction %s closed manually by %s", auction.id, ctx.author.display_name
         )
 
     @commands.command(
@@ -189,29 +508,185 @@ class AuctionCommands:
             "current",
             "oa",
         ],
-        help="Lists all ongoing auctions in the server.",
+        help="Lists all ongoing auctions in the server, a page at a time.",
     )
-    async def check_ongoing_auctions(self, ctx: commands.Context):
-        """Lists all ongoing auctions in the server."""
+    async def check_ongoing_auctions(self, ctx: commands.Context, page: int = 1):
+        """Lists all ongoing auctions in the server, ending soonest first."""
         if not self._is_in_guild_context(ctx):
             await self._send_error_message(
                 ctx, "This command can only be used in a server."
             )
             return
 
-        ongoing_auctions = self._get_ongoing_auctions(ctx.guild.id)
-        if not ongoing_auctions:
+        if not self.auctions.count(ctx.guild.id):
             await self._send_error_message(
                 ctx, "There are no ongoing auctions in this server."
             )
             return
 
-        await ctx.send(
-            embed=discord.Embed(
-                title="Ongoing Auctions",
-                description="\n\n".join(ongoing_auctions),
-                color=discord.Color.blue(),
+        embed, page, page_count = self._build_ongoing_page(ctx.guild.id, page - 1)
+        view = None
+        if page_count > 1:
+            view = OngoingAuctionsView(self, ctx.guild.id, ctx.author.id, page, page_count)
+        await self._send(ctx, Priority.REPLY, embed=embed, view=view)
+
+    @commands.command(
+        name="auctionhistory",
+        aliases=["history", "pastauctions"],
+        help="Lists the closed auctions of the server, most recent first, optionally only those a member created or won.",
+    )
+    async def auction_history(
+        self, ctx: commands.Context, member: Optional[discord.User] = None, page: int = 1
+    ):
+        """Lists archived auctions of the server, a page at a time."""
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
+            )
+            return
+
+        page = max(page, 1)
+        rows = await self.store.load_history(
+            ctx.guild.id,
+            self.HISTORY_PAGE_SIZE,
+            (page - 1) * self.HISTORY_PAGE_SIZE,
+            member.id if member else None,
+        )
+        if not rows:
+            await self._send_error_message(
+                ctx, "There are no closed auctions to show on this page."
+            )
+            return
+
+        title = "Auction History"
+        if member:
+            title += f" of {member.display_name}"
+        embed = discord.Embed(
+            title=title,
+            description="\n\n".join(self._format_history_entry(row) for row in rows),
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(text=f"Page {page}")
+        await self._send(ctx, Priority.REPLY, embed=embed)
+
+    @commands.command(
+        name="topspenders",
+        aliases=["spenders", "leaderboard"],
+        help="Ranks the members of the server by the total of their winning bids.",
+    )
+    async def top_spenders(self, ctx: commands.Context):
+        """Shows the members who spent the most on won auctions."""
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
+            )
+            return
+
+        rows = await self.store.load_top_spenders(ctx.guild.id, self.LEADERBOARD_SIZE)
+        if not rows:
+            await self._send_error_message(ctx, "No auctions have been won in this server yet.")
+            return
+
+        embed = discord.Embed(
+            title="Top Spenders",
+            description="\n".join(
+                f"{rank}. {name}: {self.format_amount(spent)} across {won} won auctions"
+                for rank, (name, spent, won) in enumerate(rows, start=1)
+            ),
+            color=discord.Color.gold(),
+        )
+        await self._send(ctx, Priority.REPLY, embed=embed)
+
+    @commands.command(
+        name="winrates",
+        aliases=["winrate", "bestbidders"],
+        help="Ranks the members of the server by the share of the auctions they bid in that they won.",
+    )
+    async def win_rates(self, ctx: commands.Context):
+        """Shows the members with the highest auction win rates."""
+        if not self._is_in_guild_context(ctx):
+            await self._send_error_message(
+                ctx, "This command can only be used in a server."
+            )
+            return
+
+        rows = await self.store.load_win_rates(
+            ctx.guild.id, self.LEADERBOARD_SIZE, self.MIN_WIN_RATE_AUCTIONS
+        )
+        if not rows:
+            await self._send_error_message(
+                ctx,
+                f"No member has bid in {self.MIN_WIN_RATE_AUCTIONS} closed auctions in this server yet.",
             )
+            return
+
+        embed = discord.Embed(
+            title="Win Rates",
+            description="\n".join(
+                f"{rank}. {name}: {won / entered:.0%} ({won} of {entered} auctions)"
+                for rank, (name, won, entered) in enumerate(rows, start=1)
+            ),
+            color=discord.Color.gold(),
+        )
+        embed.set_footer(text=f"Members who bid in at least {self.MIN_WIN_RATE_AUCTIONS} auctions")
+        await self._send(ctx, Priority.REPLY, embed=embed)
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Routes clicks on the bid buttons of auction messages."""
+        if interaction.type is not discord.InteractionType.component:
+            return
+        parsed = parse_custom_id((interaction.data or {}).get("custom_id", ""))
+        if parsed is None:
+            return
+        action, auction_id = parsed
+
+        auction = self.auctions.get(auction_id)
+        if auction is None or not auction.active:
+            await self._send_interaction_error(interaction, "This auction has already ended.")
+            return
+        if action == "custom":
+            await interaction.response.send_modal(CustomBidModal(self, auction_id))
+            return
+        logger.info(
+            "%s clicked the quick bid button of auction %s",
+            interaction.user,
+            auction_id,
+        )
+        # Interaction replies do not count against the channel's rate limit
+        shed_reason = self._throttle_bid(interaction.user.id, auction, None)
+        if shed_reason:
+            await self._send_interaction_error(interaction, shed_reason)
+            return
+        self._get_bid_queue(auction).submit(PendingBid(interaction, interaction.user, None, ""))
+
+    async def place_interaction_bid(
+        self, interaction: discord.Interaction, auction_id: str, bid_amount_str: str
+    ):
+        """Places a bid entered in the custom bid modal."""
+        logger.info("%s attempted to bid with %s", interaction.user, bid_amount_str)
+        amount_str, _, mode = bid_amount_str.partition(" ")
+        proxy = mode.strip().lower() in self.PROXY_BID_KEYWORDS
+        if proxy:
+            bid_amount_str = amount_str
+        bid_amount = self.parse_amount(bid_amount_str)
+        if bid_amount is None:
+            await self._send_interaction_error(
+                interaction,
+                "Invalid bid format. Please enter a number or use formats like '1k', '1m', etc.",
+            )
+            return
+
+        auction = self.auctions.get(auction_id)
+        if auction is None or not auction.active:
+            await self._send_interaction_error(interaction, "This auction has already ended.")
+            return
+        shed_reason = self._throttle_bid(interaction.user.id, auction, None)
+        if shed_reason:
+            await self._send_interaction_error(interaction, shed_reason)
+            return
+        self._get_bid_queue(auction).submit(
+            PendingBid(interaction, interaction.user, bid_amount, bid_amount_str, proxy)
         )
 
     @commands.Cog.listener()
@@ -233,21 +708,11 @@ class AuctionCommands:
                 await handler(ctx, error)
                 return
 
-        logger.error(f"An unexpected error occurred: {error}")
+        logger.error("An unexpected error occurred: %s", error)
 
-    async def run_timer(self, ctx, auction):
-        if not self._get_auction(ctx):
+    async def refresh_auction(self, auction: AuctionData):
+        """Refreshes the auction embed and schedules the next refresh."""
+        if not self._is_auction_live(auction) or self._get_remaining_time(auction) <= 0:
             return
-        while self._get_remaining_time(auction) > 0:
-            remaining_seconds = self._get_remaining_time(auction)
-
-            await self.update_auction_embed(auction)
-
-            # Use match case to adjust the interval
-            match remaining_seconds:
-                case seconds if seconds > 604800:  # More than a week remains
-                    await asyncio.sleep(86400)  # Wait for 1 day before updating again
-                case seconds if seconds > 86400:  # More than a day remains
-                    await asyncio.sleep(3600)  # Wait for 1 hour before updating again
-                case _:  # Less than a day remains
-                    await asyncio.sleep(60)  # Wait for 60 seconds before updating again
+        await self.update_auction_embed(auction)
+        self._schedule_refresh(auction)
@@ -3,11 +3,20 @@
 import discord
 from discord.ext import commands
 from utils.auction_data import AuctionData
+from utils.auction_journal import apply_record
+from .bid_queue import BidQueue
+from .bid_view import build_bid_view
+from .bulk import BulkRow, resolve_channel
+from .outbound import Priority
+from .rejections import PRIVATE_REJECTION_REASON, SHED_REASONS
+from utils.parsing import format_amount, parse_amount
 from utils.utilities import format_time_remaining
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 import asyncio
+import math
+import time
 
 logger = logging.getLogger("discord_bot")
 
@@ -20,16 +29,37 @@ class AuctionHelpers:
         """Check if the command is invoked in a guild (server) context."""
         return ctx.guild is not None
 
+    def _get_guild_capacity(self, guild_id: int) -> int:
+        """Return the number of concurrent auctions the guild allows."""
+        return self.guild_capacities.get(guild_id, self.MAX_AUCTIONS_PER_GUILD)
+
     def _has_max_auctions(self, guild_id: int) -> bool:
         """Check if the guild has reached the maximum number of concurrent auctions."""
-        return len(self.auctions.get(guild_id, {})) >= self.MAX_AUCTIONS_PER_GUILD
+        return self.auctions.count(guild_id) >= self._get_guild_capacity(guild_id)
 
-    def _get_auction(self, ctx: commands.Context) -> Optional[AuctionData]:
-        """Retrieve an auction by its channel within a specific guild."""
-        auction_key = self._get_auction_key(ctx)
-        return self.auctions.get(auction_key)
+    def _find_auction(
+        self, ctx: commands.Context, auction_id: Optional[str] = None
+    ) -> Tuple[Optional[AuctionData], Optional[str]]:
+        """
+        Find an auction of the guild by ID, or the only auction of the channel if
+        no ID is given. Returns (auction, None), or (None, the reason it was not found).
+        """
+        if auction_id is not None:
+            auction = self.auctions.get(auction_id)
+            if auction is None or auction.guild_id != ctx.guild.id:
+                return None, f"There is no ongoing auction with ID {auction_id} in this server."
+            return auction, None
+        auctions = self.auctions.in_channel(ctx.channel.id)
+        if not auctions:
+            return None, "There is no ongoing auction in this channel."
+        if len(auctions) > 1:
+            return None, (
+                f"{len(auctions)} auctions are running in this channel. "
+                f"Add the auction ID from the auction's footer, like `{ctx.prefix}{ctx.invoked_with} <auction ID> ...`."
+            )
+        return auctions[0], None
 
-    def _is_valid_bid(self, auction: AuctionData, bid_amount: float) -> bool:
+    def _is_valid_bid(self, auction: AuctionData, bid_amount: int) -> bool:
         """Check if the bid amount is valid for the auction."""
         return (
             bid_amount > auction.current_bid
@@ -41,7 +71,7 @@ class AuctionHelpers:
         # Make sure auction.end_time is a datetime object
         if not isinstance(auction.end_time, datetime):
             logger.error(
-                f"Invalid end_time for auction {auction.id}: {auction.end_time}"
+                "Invalid end_time for auction %s: %s", auction.id, auction.end_time
             )
             return 0
         remaining_time = (auction.end_time - datetime.now()).total_seconds()
@@ -49,8 +79,8 @@ class AuctionHelpers:
 
     def _determine_winner(self, auction: AuctionData) -> Tuple[str, discord.Color]:
         """Determine the winner of the auction."""
-        if auction.bidders:
-            winner, winning_bid = max(auction.bidders.items(), key=lambda bid: bid[1])
+        if auction.highest_bid:
+            _, winner, winning_bid = auction.highest_bid
             auction.winner = winner
             return (
                 f"The auction for {auction.item} is won by {winner} with a bid of {self.format_amount(winning_bid)}!",
@@ -76,77 +106,311 @@ class AuctionHelpers:
                 title=f"Auction Ended: {item}", description=announcement, color=color
             )
             embed.set_footer(text=f"Auction ID: {auction_id}")
-            await channel.send(embed=embed)
+            await self._send(channel, Priority.RESULT, embed=embed)
         else:
-            logger.error(f"Channel {channel_id} not found for auction announcement.")
-
-    def _remove_auction(self, ctx: commands.Context):
-        """Remove an auction from the active auctions list."""
-        auction_key = self._get_auction_key(ctx)
-        self.auctions.pop(auction_key, None)
-
-    def _get_ongoing_auctions(self, guild_id: int) -> list:
-        """Compile a list of formatted strings representing ongoing auctions."""
-        ongoing_auctions = []
-        # Iterate over all auction keys and auction objects
-        for auction_key, auction in self.auctions.items():
-            # Check if the auction key's guild part (first element of the tuple) matches the provided guild_id
-            if auction_key[0] == guild_id and auction.active:
-                remaining_seconds = self._get_remaining_time(auction)
-                auction_info = (
-                    f"Auction ID: {auction.id}\n"
-                    f"Item: {auction.item}\n"
-                    f"Current Bid: {self.format_amount(auction.current_bid)}\n"
-                    f"Time Remaining: {format_time_remaining(remaining_seconds)}"
-                )
-                ongoing_auctions.append(auction_info)
+            logger.error("Channel %s not found for auction announcement.", channel_id)
 
-        return ongoing_auctions
+    def _remove_auction(self, auction: AuctionData, closed_at: Optional[float] = None):
+        """Remove an auction from the active auctions list, archiving it if it was closed."""
+        self.auctions.remove(auction)
+        if closed_at is None:
+            self._journal("close", id=auction.id)
+        else:
+            self._journal("close", id=auction.id, t=closed_at)
+            self.store.archive_auction(auction, closed_at)
+        self.store.delete_auction(auction.id)
+
+    def _drop_auction(self, auction: AuctionData):
+        """Remove an auction that can no longer be shown, without announcing a winner."""
+        self._cancel_auction_timer(auction.id)
+        self._remove_auction(auction)
+        self.bid_queues.pop(auction.id, None)
+        self.static_descriptions.pop(auction.id, None)
+        auction.active = False
+
+    def _set_auction_message(self, auction: AuctionData, message_id: int):
+        """Point an auction at a new message, such as a repost of a deleted one."""
+        auction.message_id = message_id
+        self._journal("message", id=auction.id, message=message_id)
+        self.store.save_auction(auction)
+
+    def _get_ongoing_auctions(self, guild_id: int) -> List[AuctionData]:
+        """Return the ongoing auctions of a guild, ending soonest first."""
+        return [
+            auction for auction in self.auctions.by_deadline(guild_id) if auction.active
+        ]
+
+    def _build_ongoing_page(
+        self, guild_id: int, page: int
+    ) -> Tuple[discord.Embed, int, int]:
+        """Render one page of a guild's ongoing auctions. Returns (embed, page, page count)."""
+        ongoing_auctions = self._get_ongoing_auctions(guild_id)
+        page_count = max(math.ceil(len(ongoing_auctions) / self.ONGOING_PAGE_SIZE), 1)
+        page = min(max(page, 0), page_count - 1)
+        start = page * self.ONGOING_PAGE_SIZE
+
+        # Only the auctions on the requested page are formatted
+        entries = []
+        for auction in ongoing_auctions[start : start + self.ONGOING_PAGE_SIZE]:
+            remaining_seconds = self._get_remaining_time(auction)
+            entries.append(
+                f"Auction ID: {auction.id}\n"
+                f"Item: {auction.item}\n"
+                f"Current Bid: {self.format_amount(auction.current_bid)}\n"
+                f"Time Remaining: {format_time_remaining(remaining_seconds)}"
+            )
+
+        embed = discord.Embed(
+            title="Ongoing Auctions",
+            description="\n\n".join(entries),
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(
+            text=f"Page {page + 1}/{page_count} • {len(ongoing_auctions)} auctions"
+        )
+        return embed, page, page_count
 
     def _generate_auction_id(self) -> str:
-        """Generate a new auction ID and increment the counter."""
-        auction_id = self.next_auction_id
-        self.next_auction_id += 1
-        return str(auction_id)
+        """Generate a new auction ID."""
+        return self._generate_auction_ids(1)[0]
+
+    def _generate_auction_ids(self, count: int) -> List[str]:
+        """
+        Generate a block of time-ordered auction IDs. Each cluster generates with
+        its own worker ID, so processes never hand out the same ID.
+        """
+        auction_ids = self.id_generator.generate(count)
+        self.store.set_meta(self._meta_key("last_auction_id"), auction_ids[-1])
+        return [str(auction_id) for auction_id in auction_ids]
+
+    def _meta_key(self, name: str) -> str:
+        """Name of a store meta value owned by this cluster."""
+        return name if self.cluster_count == 1 else f"{name}:{self.cluster_id}"
+
+    def _owns_guild(self, guild_id: int) -> bool:
+        """Check if the guild is served by one of this process's shards."""
+        shard_ids = getattr(self.bot, "shard_ids", None)
+        shard_count = getattr(self.bot, "shard_count", None)
+        if not shard_ids or not shard_count:
+            return True
+        return (guild_id >> 22) % shard_count in shard_ids
+
+    async def _load_auctions(self):
+        """Reload the last snapshot, replay the journal tail and restore the ID counter."""
+        # The database is shared between clusters; only this process's guilds are loaded
+        auctions = {
+            auction.id: auction
+            for auction in await self.store.load_active()
+            if self._owns_guild(auction.guild_id)
+        }
+        snapshot_seq = int(await self.store.get_meta(self._meta_key("journal_seq")) or 0)
+        self.journal.seq = max(self.journal.seq, snapshot_seq)
+
+        records = await self.journal.replay(snapshot_seq)
+        for record in records:
+            auction = apply_record(auctions, record)
+            if auction is None:
+                continue
+            if record["op"] == "close":
+                # Closes that were not committed yet are archived again
+                if "t" in record:
+                    self.store.archive_auction(auction, record["t"])
+                self.store.delete_auction(auction.id)
+                continue
+            self.store.save_auction(auction)
+            if record["op"] == "bid":
+                self.store.record_bid(
+                    auction.id, record["bidder"], record["name"], record["amount"], record["t"]
+                )
+        if records:
+            self.store.set_meta(self._meta_key("journal_seq"), records[-1]["s"])
+
+        for auction in auctions.values():
+            self.auctions.add(auction)
+        # Keep IDs increasing across restarts, even if the clock stepped back
+        last_id = await self.store.get_meta(self._meta_key("last_auction_id"))
+        for auction_id in [last_id, *auctions]:
+            if auction_id and auction_id.isdigit():
+                self.id_generator.advance_past(int(auction_id))
+        logger.info(
+            "Loaded %s auctions from %s after replaying %s journal records",
+            len(auctions),
+            self.store.path,
+            len(records),
+        )
 
-    def _get_auction_key(self, ctx: commands.Context) -> tuple:
-        """Generate a key for the auctions dictionary based on the guild and channel."""
-        return (ctx.guild.id, ctx.channel.id)
+    def _journal(self, op: str, **fields):
+        """Append a mutation to the journal and tie the next snapshot to it."""
+        seq = self.journal.append(op, **fields)
+        self.store.set_meta(self._meta_key("journal_seq"), seq)
 
-    def _is_auction_active(self, ctx: commands.Context) -> bool:
-        """Check if there is an active auction in the current channel."""
-        auction_key = self._get_auction_key(ctx)
-        return auction_key in self.auctions
+    def _on_snapshot(self, meta: dict):
+        """Let the journal drop the records covered by a committed snapshot."""
+        seq = meta.get(self._meta_key("journal_seq"))
+        if seq is not None:
+            self.journal.mark_snapshot(int(seq))
+
+    def _is_auction_live(self, auction: AuctionData) -> bool:
+        """Check if the given auction is still registered."""
+        return self.auctions.get(auction.id) is auction
 
     def _set_auction(self, ctx: commands.Context, auction_data: AuctionData):
-        """Store an auction in the auctions dictionary."""
-        auction_key = self._get_auction_key(ctx)
-        self.auctions[auction_key] = auction_data
+        """Store an auction in the auction registry."""
+        self.auctions.add(auction_data)
+        self._journal(
+            "create",
+            id=auction_data.id,
+            item=auction_data.item,
+            start=auction_data.starting_bid,
+            inc=auction_data.min_increment,
+            end=auction_data.end_time.timestamp(),
+            channel=auction_data.channel_id,
+            guild=auction_data.guild_id,
+            creator_name=auction_data.creator_name,
+            creator=auction_data.creator_id,
+            message=auction_data.message_id,
+        )
+        self.store.save_auction(auction_data)
+
+    def _record_bid(
+        self, auction: AuctionData, bidder_id: int, bidder_name: str, bid_amount: int
+    ):
+        """Apply an accepted bid to the auction and persist it."""
+        placed_at = time.time()
+        auction.record_bid(bidder_id, bidder_name, bid_amount, placed_at)
+        self._journal(
+            "bid",
+            id=auction.id,
+            bidder=bidder_id,
+            name=bidder_name,
+            amount=bid_amount,
+            t=placed_at,
+        )
+        self.store.record_bid(auction.id, bidder_id, bidder_name, bid_amount, placed_at)
+        self.store.save_auction(auction)
+
+    def _set_proxy_bid(self, auction: AuctionData, bid) -> bool:
+        """Validate and register a hidden maximum bid. Must not await."""
+        bidder = bid.bidder
+        leader = auction.highest_bid
+        previous = (auction.proxies or {}).get(bidder.id)
+        if previous is not None and bid.amount <= previous:
+            bid.reason = f"Your maximum bid is already {self.format_amount(previous)}."
+            return False
+        if leader and leader[0] == bidder.id:
+            if bid.amount <= auction.current_bid:
+                bid.reason = f"Your maximum bid must be higher than your current bid of {self.format_amount(auction.current_bid)}."
+                return False
+        elif not self._validate_bid(auction, bid.amount):
+            bid.reason = f"Your maximum bid must be at least {self.format_amount(auction.min_increment)} higher than the current bid of {self.format_amount(auction.current_bid)}."
+            return False
+
+        registered_at = time.time()
+        auction.set_proxy(bidder.id, bidder.display_name, bid.amount)
+        self._journal(
+            "proxy", id=auction.id, bidder=bidder.id, name=bidder.display_name, max=bid.amount
+        )
+        self.store.save_proxy(
+            auction.id, bidder.id, bidder.display_name, bid.amount, registered_at
+        )
+        return True
+
+    def _extend_auction(self, auction: AuctionData, end_time: datetime):
+        """Move the end time of an auction and reschedule its closing."""
+        auction.end_time = end_time
+        self._schedule_close(auction)
+        self._schedule_refresh(auction)
+        self._journal("extend", id=auction.id, end=end_time.timestamp())
+        self.store.save_auction(auction)
 
     async def _send_error_message(self, ctx: commands.Context, message: str):
         """Send an error message embedded in the Discord channel."""
         embed = discord.Embed(
             title="Error", description=message, color=discord.Color.red()
         )
-        await ctx.send(embed=embed)
+        await self._send(ctx, Priority.REPLY, embed=embed)
+
+    async def _reject_bid(self, ctx: commands.Context, reason: str):
+        """Reject a bid placed with a command, merged with other rejections in the channel."""
+        await self.rejections.reject(ctx, ctx.author.display_name, reason)
+
+    async def _reject_proxy_bid(self, ctx: commands.Context, reason: str):
+        """
+        Reject a maximum bid placed with a command without revealing it: the
+        invocation is deleted and the reason, which may name the maximum, is sent
+        by direct message. The channel only sees a generic rejection if that fails.
+        """
+        await self._delete_invocation(ctx)
+        embed = discord.Embed(
+            title="Maximum bid not placed", description=reason, color=discord.Color.red()
+        )
+        try:
+            await ctx.author.send(embed=embed)
+        except discord.HTTPException:
+            await self._reject_bid(ctx, PRIVATE_REJECTION_REASON)
+
+    async def _send_rejection(self, destination, embed: discord.Embed):
+        await self._send(destination, Priority.REPLY, embed=embed)
+
+    def _throttle_bid(self, user_id: int, auction: Optional[AuctionData], channel_id: Optional[int]) -> Optional[str]:
+        """Admit a bid through the throttle. Returns the reason it was shed, or None."""
+        scope = self.bid_throttle.admit(user_id, auction.id if auction else None, channel_id)
+        if scope is None:
+            return None
+        logger.info("Shed a bid by user %s: %s limit reached", user_id, scope)
+        return SHED_REASONS[scope]
+
+    async def _send_interaction_error(self, interaction: discord.Interaction, message: str):
+        """Answer an interaction with an error only its user can see."""
+        embed = discord.Embed(
+            title="Error", description=message, color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def _build_bid_view(self, auction: AuctionData) -> discord.ui.View:
+        """Build the bid buttons attached to an auction message."""
+        return build_bid_view(auction.id, self.format_amount(auction.min_increment))
+
+    async def _send(self, destination, priority: Priority, **kwargs):
+        """Send a message to a context or channel through the outbound dispatcher."""
+        channel = getattr(destination, "channel", destination)
+        return await self.outbound.submit(
+            "send", channel.id, priority, lambda: destination.send(**kwargs)
+        )
+
+    async def _delete_invocation(self, ctx: commands.Context):
+        """Delete the invoking message through the outbound dispatcher, if permitted."""
+        try:
+            await self.outbound.submit(
+                "delete", ctx.channel.id, Priority.BID, lambda: ctx.message.delete()
+            )
+        except (discord.Forbidden, discord.NotFound):
+            pass
+
+    async def _react(self, ctx: commands.Context, emoji: str):
+        """Add a reaction to the invoking message through the outbound dispatcher."""
+        return await self.outbound.submit(
+            "reaction", ctx.channel.id, Priority.BID, lambda: ctx.message.add_reaction(emoji)
+        )
 
     def _build_auction_embed(self, auction: AuctionData) -> discord.Embed:
         """Build an embed for auction start and updates."""
         remaining_seconds = self._get_remaining_time(auction)
         formatted_time = format_time_remaining(remaining_seconds)
 
-        # Build the auction description including the current highest bid
-        description = (
-            f"**Item:** {auction.item}\n"
-            f"**Starting Bid:** {self.format_amount(auction.starting_bid)}\n"
-            f"**Minimum Increment:** {self.format_amount(auction.min_increment)}\n"
-        )
+        # Build the auction description including the current highest bid.
+        # The lines that never change are rendered once per auction.
+        description = self.static_descriptions.get(auction.id)
+        if description is None:
+            description = self.static_descriptions[auction.id] = (
+                f"**Item:** {auction.item}\n"
+                f"**Starting Bid:** {self.format_amount(auction.starting_bid)}\n"
+                f"**Minimum Increment:** {self.format_amount(auction.min_increment)}\n"
+            )
 
         # Add current highest bid information if there are bids
-        if auction.bidders:
-            highest_bidder, highest_bid = max(
-                auction.bidders.items(), key=lambda bid: bid[1]
-            )
+        if auction.highest_bid:
+            _, highest_bidder, highest_bid = auction.highest_bid
             description += f"**Highest Bid:** {self.format_amount(highest_bid)} by {highest_bidder}\n"
         if auction.active:
             description += f"**Time Remaining:** {formatted_time}"
@@ -160,94 +424,61 @@ class AuctionHelpers:
         embed = discord.Embed(
             title=f"Auction: {auction.item}", description=description, color=embed_color
         )
+        top_bidders = auction.top_bidders(self.TOP_BIDDERS_SHOWN)
+        if len(top_bidders) > 1:
+            embed.add_field(
+                name=f"Top {len(top_bidders)} Bidders",
+                value="\n".join(
+                    f"{rank}. {name}: {self.format_amount(amount)}"
+                    for rank, (name, amount) in enumerate(top_bidders, start=1)
+                ),
+                inline=False,
+            )
         embed.set_footer(text=f"Auction ID: {auction.id}")
 
         return embed
 
-    async def update_auction_embed(self, auction: AuctionData):
-        """Update the auction embed with the current information."""
-        # Create a new embed with updated information
-        updated_embed = self._build_auction_embed(auction)
-
-        if auction.message_id:
-            try:
-                channel = self.bot.get_channel(auction.channel_id)
-                auction_message = await channel.fetch_message(auction.message_id)
-                await auction_message.edit(embed=updated_embed)
-            except discord.NotFound:
-                logger.error(
-                    f"Auction message with ID {auction.message_id} could not be found."
-                )
-            except discord.Forbidden:
-                logger.error(
-                    f"Bot does not have permissions to edit the auction message with ID {auction.message_id}."
-                )
-
-    def parse_amount(self, amount_str: str) -> float:
-        """
-        Parses a bid amount string into a float.
-        Accepts formats like '1k', '1m', '1b', '1t', etc., and their uppercase equivalents,
-        including decimal values like '1.5m'.
-        Returns None if the format is incorrect.
-        """
-        shorthand_multipliers = {
-            "k": 1_000,
-            "m": 1_000_000,
-            "b": 1_000_000_000,
-            "t": 1_000_000_000_000,
-        }
-
-        if amount_str[-1].lower() in shorthand_multipliers:
-            try:
-                number_part = float(amount_str[:-1])
-                multiplier = shorthand_multipliers[amount_str[-1].lower()]
-                return number_part * multiplier
-            except ValueError:
-                return None
-        else:
-            try:
-                return float(amount_str)
-            except ValueError:
-                return None
-
-    def format_amount(self, amount: float) -> str:
-        """
-        Formats a numeric amount into a shorthand notation with dynamic precision.
-        Examples:
-        - 1500 -> '1.5k'
-        - 2500000 -> '2.5m'
-        - 123456789 -> '123.456789m'
-        - 1200000 -> '1.2m'
-        """
-        units = ["", "K", "M", "B", "T"]
-        idx = 0
-
-        while amount >= 1000 and idx < len(units) - 1:
-            amount /= 1000.0
-            idx += 1
+    async def update_auction_embed(
+        self,
+        auction: AuctionData,
+        immediate: bool = False,
+        priority: Priority = Priority.REFRESH,
+        clear_view: bool = False,
+    ):
+        """Queue an update of the auction embed, optionally sending it right away."""
+        if not auction.message_id:
+            return
+        self.embed_editor.submit(
+            auction.channel_id,
+            auction.message_id,
+            lambda: self._build_auction_embed(auction),
+            priority,
+            clear_view,
+        )
+        if immediate:
+            await self.embed_editor.flush(auction.message_id)
 
-        # Determine the number of decimal places needed
-        if amount - int(amount) == 0:
-            # No decimal part
-            formatted_amount = f"{int(amount)}"
-        else:
-            # Keep all significant digits in the decimal part
-            decimal_part = str(amount).split(".")[1]
-            # Count non-zero digits in the decimal part for precision
-            non_zero_digits = len(decimal_part.rstrip("0"))
-            formatted_amount = f"{amount:.{non_zero_digits}f}".rstrip("0").rstrip(".")
+    def parse_amount(self, amount_str: str) -> Optional[int]:
+        """Parses a bid amount string like '1.5m' into integer minor units, or None."""
+        return parse_amount(amount_str)
 
-        return formatted_amount + units[idx]
+    def format_amount(self, amount: int) -> str:
+        """Formats an amount in minor units into shorthand notation like '1.5M'."""
+        return format_amount(amount)
 
     async def _validate_bid_and_increment(self, ctx, starting_bid, min_increment):
         if starting_bid is None:
-            await ctx.send(
-                "Invalid starting bid format. Please enter a number or use formats like '1k', '1m', etc."
+            await self._send(
+                ctx,
+                Priority.REPLY,
+                content="Invalid starting bid format. Please enter a number or use formats like '1k', '1m', etc.",
             )
             return False
         if min_increment is None:
-            await ctx.send(
-                "Invalid min increment format. Please enter a number or use formats like '1k', '1m', etc."
+            await self._send(
+                ctx,
+                Priority.REPLY,
+                content="Invalid min increment format. Please enter a number or use formats like '1k', '1m', etc.",
             )
             return False
         return True
@@ -264,11 +495,6 @@ class AuctionHelpers:
                 "The maximum number of concurrent auctions for this server has been reached.",
             )
             return False
-        if self._is_auction_active(ctx):
-            await self._send_error_message(
-                ctx, "There is already an ongoing auction in this channel."
-            )
-            return False
         return True
 
     async def _validate_duration(self, ctx, duration):
@@ -278,6 +504,11 @@ class AuctionHelpers:
                 "Invalid or too short duration format. Please use formats like '1d 2h 30m'.",
             )
             return False
+        if duration.total_seconds() > self.MAX_AUCTION_DURATION:
+            await self._send_error_message(
+                ctx, f"Auctions can last at most {self.MAX_AUCTION_DURATION // 86400} days."
+            )
+            return False
         return True
 
     def _create_auction_data(
@@ -295,34 +526,119 @@ class AuctionHelpers:
             creator_id=ctx.author.id,
         )
 
-    async def _validate_guild_context_and_auction(self, ctx):
-        if not self._is_in_guild_context(ctx):
-            await self._send_error_message(
-                ctx, "This command can only be used in a server."
+    def _get_bid_queue(self, auction: AuctionData) -> BidQueue:
+        """Return the bid queue of an auction, creating it on first use."""
+        queue = self.bid_queues.get(auction.id)
+        if queue is None:
+            queue = self.bid_queues[auction.id] = BidQueue(
+                lambda bid: self._process_bid(auction, bid),
+                lambda batch: self._acknowledge_bids(auction, batch),
             )
-            return False
-
-        auction = self._get_auction(ctx)
-        if not auction:
-            await self._send_error_message(
-                ctx, "There is no ongoing auction in this channel."
-            )
-            return False
-        return True
+        return queue
 
     def _validate_bid(self, auction, bid_amount):
         return auction and self._is_valid_bid(auction, bid_amount)
 
     def _cancel_auction_timer(self, auction_id):
-        auction_timer = self.auction_timers.get(auction_id)
-        if auction_timer and not auction_timer.done():
-            auction_timer.cancel()
-            del self.auction_timers[auction_id]
+        self.scheduler.cancel((auction_id, "close"))
+        self.scheduler.cancel((auction_id, "refresh"))
+
+    def _arm_auction(self, auction: AuctionData):
+        """Schedule the closing and the first embed refresh of an auction."""
+        self._schedule_close(auction)
+        self._schedule_refresh(auction)
+
+    def _schedule_close(self, auction: AuctionData):
+        self.scheduler.schedule(
+            (auction.id, "close"),
+            auction.end_time.timestamp(),
+            lambda: self.close_auction(auction),
+        )
 
-    async def _wait_for_auction_end(self, auction):
-        while self._get_remaining_time(auction) > 0:
-            remaining_time = self._get_remaining_time(auction)
-            await asyncio.sleep(remaining_time)
+    def _schedule_refresh(self, auction: AuctionData, deadline: Optional[float] = None):
+        """Schedule the next embed refresh, at `deadline` if given, such as one handed over on reload."""
+        if deadline is None:
+            delay = self._get_refresh_interval(self._get_remaining_time(auction))
+            if delay is None:
+                self.scheduler.cancel((auction.id, "refresh"))
+                return
+            deadline = time.time() + delay
+        self.scheduler.schedule(
+            (auction.id, "refresh"),
+            deadline,
+            lambda: self.refresh_auction(auction),
+        )
+
+    def _get_refresh_interval(self, remaining_seconds: float) -> Optional[float]:
+        """
+        Return the seconds until the remaining time shown in the embed next changes,
+        or None if it stays the same until the auction closes.
+        Mirrors the units format_time_remaining shows.
+        """
+        match remaining_seconds:
+            case seconds if seconds >= 604800:  # Weeks and days are shown
+                return seconds % 86400 + self.REFRESH_SLACK
+            case seconds if seconds >= 86400:  # Days and hours are shown
+                # Hours round up within the last minute of an hour; days never round
+                return min(seconds % 86400, (seconds + 60) % 3600 or 3600) + self.REFRESH_SLACK
+            case seconds if seconds > 60:  # Minutes are shown, rounded up
+                return (seconds % 60 or 60) + self.REFRESH_SLACK
+            case _:  # "less than a minute" is shown until the auction closes
+                return None
+
+    def _validate_bulk_rows(self, ctx, rows: List[BulkRow]) -> Tuple[list, List[str]]:
+        """Resolve the channel of every bulk listing row. Returns (channels, errors)."""
+        channels, errors = [], []
+        if len(rows) > self.BULK_MAX_AUCTIONS:
+            errors.append(
+                f"At most {self.BULK_MAX_AUCTIONS} auctions can be started at once; {len(rows)} were listed."
+            )
+        free = self._get_guild_capacity(ctx.guild.id) - self.auctions.count(ctx.guild.id)
+        if len(rows) > free:
+            errors.append(
+                f"This server has room for {max(free, 0)} more auctions; {len(rows)} were listed."
+            )
+
+        for row in rows:
+            channel = ctx.channel
+            if row.channel:
+                channel = resolve_channel(ctx.guild, row.channel)
+                if not isinstance(channel, discord.abc.Messageable):
+                    channel = None
+            if channel is None:
+                errors.append(f"Line {row.line}: text channel '{row.channel}' not found.")
+            channels.append(channel)
+        return channels, errors
+
+    async def _post_auction(self, channel, auction: AuctionData) -> bool:
+        """Post the message of a registered auction and arm it, or drop it if that fails."""
+        embed = self._build_auction_embed(auction)
+        try:
+            message = await self._send(
+                channel, Priority.RESULT, embed=embed, view=self._build_bid_view(auction)
+            )
+        except discord.HTTPException as e:
+            logger.error("Failed to post auction %s: %s", auction.id, e)
+            message = None
+        if message is None:
+            self._drop_auction(auction)
+            return False
+        self._set_auction_message(auction, message.id)
+        self.embed_editor.bind(message, embed)
+        self._arm_auction(auction)
+        return True
+
+    def _format_history_entry(self, row: tuple) -> str:
+        """Render one archived auction of the history listing."""
+        auction_id, item, final_bid, winner_name, creator_name, bid_count, closed_at = row
+        if winner_name is None:
+            outcome = "No bids"
+        else:
+            outcome = f"Won by {winner_name} for {self.format_amount(final_bid)}"
+        return (
+            f"**{item}** (ID: {auction_id})\n"
+            f"{outcome} • {bid_count} bids • by {creator_name} • closed <t:{int(closed_at)}:R>"
+        )
 
     async def _validate_close_auction_permissions(self, ctx, auction):
         if (
@@ -336,17 +652,27 @@ class AuctionHelpers:
         return True
 
     async def _handle_command_not_found(self, ctx, error):
-        logger.info(f"Command not found: {ctx.message.content}")
+        logger.info("Command not found: %s", ctx.message.content)
 
     async def _handle_missing_required_argument(self, ctx, error):
-        await ctx.send(f"Missing a required argument: {error.param.name}")
+        await self._send(
+            ctx,
+            Priority.REPLY,
+            content=f"Missing a required argument: {error.param.name}",
+        )
         await ctx.send_help(ctx.command)
 
     async def _handle_bad_argument(self, ctx, error):
-        await ctx.send("One or more arguments are invalid. Please check your input.")
+        await self._send(
+            ctx,
+            Priority.REPLY,
+            content="One or more arguments are invalid. Please check your input.",
+        )
         await ctx.send_help(ctx.command)
 
     async def _handle_command_on_cooldown(self, ctx, error):
-        await ctx.send(
-            f"This command is on cooldown. Try again after {error.retry_after:.2f} seconds."
+        await self._send(
+            ctx,
+            Priority.REPLY,
+            content=f"This command is on cooldown. Try again after {error.retry_after:.2f} seconds.",
         )
@@ -0,0 +1,86 @@
+# cogs/auction/bid_queue.py
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger("discord_bot")
+
+
+class PendingBid:
+    """A bid waiting to be processed by its auction's queue."""
+
+    __slots__ = ("source", "bidder", "amount", "amount_str", "proxy", "accepted", "reason")
+
+    def __init__(
+        self, source, bidder, amount: Optional[int], amount_str: str, proxy: bool = False
+    ):
+        self.source = source  # Context or interaction the bid came from, used to acknowledge it
+        self.bidder = bidder
+        self.amount = amount  # None for a quick bid of the minimum increment
+        self.amount_str = amount_str
+        self.proxy = proxy  # Whether the amount is a hidden maximum bid
+        self.accepted = False
+        self.reason: Optional[str] = None  # Why the bid was rejected
+
+
+class BidQueue:
+    """
+    Single-writer bid queue of one auction.
+
+    Bids are validated and applied in arrival order by a synchronous drain that
+    never awaits, so no other bid can interleave with validation. Every bid
+    drained together is then acknowledged as one batch.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[PendingBid], None],
+        acknowledge: Callable[[List[PendingBid]], Awaitable],
+    ):
+        self._process = process
+        self._acknowledge = acknowledge
+        self._pending = deque()
+        self._scheduled = False
+        self._tasks = set()  # Acknowledgements still being sent
+        self.processed = 0  # Bids processed
+        self.batches = 0  # Batches drained
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, bid: PendingBid):
+        """Queue a bid. It is processed on the next pass of the event loop."""
+        self._pending.append(bid)
+        if not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_soon(self._drain)
+
+    def flush(self):
+        """Process the queued bids now instead of on the next pass of the event loop."""
+        self._drain()
+
+    async def wait_acknowledged(self):
+        """Wait until every acknowledgement started so far has been sent."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _drain(self):
+        self._scheduled = False
+        if not self._pending:
+            return
+        batch = list(self._pending)
+        self._pending.clear()
+        for bid in batch:
+            try:
+                self._process(bid)
+            except Exception as e:
+                bid.accepted = False
+                bid.reason = "Your bid could not be processed."
+                logger.exception("Failed to process bid by %s: %s", bid.bidder, e)
+        self.processed += len(batch)
+        self.batches += 1
+
+        task = asyncio.create_task(self._acknowledge(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
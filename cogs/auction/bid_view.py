@@ -0,0 +1,63 @@
+# cogs/auction/bid_view.py
+from typing import Optional, Tuple
+
+import discord
+
+# Custom ID prefixes of the components on auction messages. The auction ID follows the prefix.
+QUICK_BID_PREFIX = "auction:bid:"
+CUSTOM_BID_PREFIX = "auction:custom:"
+
+
+def build_bid_view(auction_id: str, increment_label: str) -> discord.ui.View:
+    """
+    Build the bid buttons of an auction message.
+
+    The view is stopped before it is sent, so discord.py does not keep it in
+    memory; clicks are routed by custom ID from the on_interaction listener,
+    which keeps the buttons working across restarts.
+    """
+    view = discord.ui.View(timeout=None)
+    view.add_item(
+        discord.ui.Button(
+            label=f"Bid +{increment_label}",
+            style=discord.ButtonStyle.primary,
+            custom_id=f"{QUICK_BID_PREFIX}{auction_id}",
+        )
+    )
+    view.add_item(
+        discord.ui.Button(
+            label="Custom bid",
+            style=discord.ButtonStyle.secondary,
+            custom_id=f"{CUSTOM_BID_PREFIX}{auction_id}",
+        )
+    )
+    view.stop()
+    return view
+
+
+def parse_custom_id(custom_id: str) -> Optional[Tuple[str, str]]:
+    """Split an auction component's custom ID into (action, auction ID)."""
+    for action, prefix in (("bid", QUICK_BID_PREFIX), ("custom", CUSTOM_BID_PREFIX)):
+        if custom_id.startswith(prefix):
+            return action, custom_id[len(prefix):]
+    return None
+
+
+class CustomBidModal(discord.ui.Modal, title="Place a bid"):
+    """Asks for a bid amount and places it on the auction."""
+
+    amount = discord.ui.TextInput(
+        label="Bid amount", placeholder="e.g. 1500, 1.5m, or 2b max for a hidden maximum", max_length=32
+    )
+
+    def __init__(self, cog, auction_id: str):
+        super().__init__(timeout=300)
+        self.cog = cog
+        self.auction_id = auction_id
+
+    async def on_submit(self, interaction: discord.Interaction):
+        # The cog may have been reloaded while the modal was open
+        cog = interaction.client.get_cog("Auction") or self.cog
+        await cog.place_interaction_bid(
+            interaction, self.auction_id, self.amount.value.strip()
+        )
@@ -0,0 +1,91 @@
+# cogs/auction/bulk.py
+import csv
+import io
+import re
+from datetime import timedelta
+from typing import List, Optional, Tuple
+
+from utils.parsing import parse_amount, parse_duration
+
+HEADER = ("item", "starting_bid", "min_increment", "duration", "channel")
+CHANNEL_MENTION = re.compile(r"<#(\d+)>")
+
+
+class BulkRow:
+    """One validated line of a bulk auction listing."""
+
+    __slots__ = ("line", "item", "starting_bid", "min_increment", "duration", "channel")
+
+    def __init__(
+        self,
+        line: int,
+        item: str,
+        starting_bid: int,
+        min_increment: int,
+        duration: timedelta,
+        channel: Optional[str],
+    ):
+        self.line = line  # Line number in the listing, for error messages
+        self.item = item
+        self.starting_bid = starting_bid
+        self.min_increment = min_increment
+        self.duration = duration
+        self.channel = channel  # Channel mention, ID or name; None for the invoking channel
+
+
+def parse_listing(
+    text: str, min_duration: float, max_duration: float
+) -> Tuple[List[BulkRow], List[str]]:
+    """
+    Parse a bulk listing of `item, starting_bid, min_increment, duration[, channel]`
+    lines, as written in a CSV file. A header line is skipped. Every line is
+    checked, so all errors are returned together rather than one at a time.
+    """
+    rows, errors = [], []
+    for line, fields in enumerate(csv.reader(io.StringIO(text)), start=1):
+        fields = [field.strip() for field in fields]
+        if not any(fields):
+            continue
+        if line == 1 and fields[0].lower() == HEADER[0]:
+            continue
+        if len(fields) not in (4, 5):
+            errors.append(
+                f"Line {line}: expected 4 or 5 fields "
+                f"(item, starting bid, minimum increment, duration, channel), got {len(fields)}."
+            )
+            continue
+
+        item, starting_bid_str, min_increment_str, duration_str = fields[:4]
+        starting_bid = parse_amount(starting_bid_str)
+        min_increment = parse_amount(min_increment_str)
+        try:
+            duration = parse_duration(duration_str)
+        except (ValueError, OverflowError):
+            duration = None  # Too large for a timedelta
+        if not item:
+            errors.append(f"Line {line}: the item name is empty.")
+        elif starting_bid is None:
+            errors.append(f"Line {line}: invalid starting bid '{starting_bid_str}'.")
+        elif min_increment is None:
+            errors.append(f"Line {line}: invalid minimum increment '{min_increment_str}'.")
+        elif duration is None or duration.total_seconds() < min_duration:
+            errors.append(f"Line {line}: invalid or too short duration '{duration_str}'.")
+        elif duration.total_seconds() > max_duration:
+            errors.append(f"Line {line}: the duration '{duration_str}' is too long.")
+        else:
+            channel = fields[4] if len(fields) == 5 and fields[4] else None
+            rows.append(BulkRow(line, item, starting_bid, min_increment, duration, channel))
+    return rows, errors
+
+
+def resolve_channel(guild, reference: str):
+    """Find a text channel of the guild by mention, ID or name."""
+    match = CHANNEL_MENTION.fullmatch(reference)
+    if match:
+        return guild.get_channel(int(match[1]))
+    if reference.isdigit():
+        channel = guild.get_channel(int(reference))
+        if channel is not None:
+            return channel
+    name = reference.lstrip("#").lower()
+    return next((channel for channel in guild.text_channels if channel.name == name), None)
@@ -0,0 +1,232 @@
+# cogs/auction/embed_editor.py
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import discord
+
+from utils.metrics import Histogram
+from .outbound import OutboundDispatcher, Priority
+
+logger = logging.getLogger("discord_bot")
+
+
+class _PendingEdit:
+    __slots__ = ("channel_id", "render", "priority", "handle", "clear_view")
+
+    def __init__(
+        self, channel_id: int, render: Callable[[], discord.Embed], priority: Priority
+    ):
+        self.channel_id = channel_id
+        self.render = render  # Produces the latest embed once the debounce window ends
+        self.priority = priority
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.clear_view = False  # Whether the edit removes the message's buttons
+
+
+class EmbedEditPipeline:
+    """
+    Per-message embed edit pipeline.
+
+    Updates submitted for the same message within the debounce window are
+    collapsed into a single edit rendering the latest state. An edit whose embed
+    equals the one last sent for the message is skipped. Edits go through
+    cached message handles, so no message is fetched before editing it, and are
+    sent through the outbound dispatcher with the most urgent priority requested.
+    """
+
+    def __init__(self, bot, debounce: float, outbound: OutboundDispatcher):
+        self.bot = bot
+        self.outbound = outbound
+        self.debounce = debounce  # Seconds to wait for further updates before editing
+        self._messages: Dict[int, discord.abc.Snowflake] = {}  # Cached message handles
+        self._pending: Dict[int, _PendingEdit] = {}
+        self._last_sent: Dict[int, dict] = {}  # Message ID -> embed dict last shown
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self._tasks = set()  # Debounced flushes that are running
+
+        # Counters
+        self.submitted = 0  # Updates requested
+        self.coalesced = 0  # Updates merged into an already pending edit
+        self.edits = 0  # Edits sent to Discord
+        self.unchanged = 0  # Edits skipped because the embed would not change
+        self.failures = 0  # Edits that raised an error
+        self.edit_latency = Histogram(
+            "auction_embed_edit_seconds",
+            "Seconds from sending an auction embed edit until Discord answered.",
+        )
+
+    def bind(self, message: discord.Message, embed: Optional[discord.Embed] = None):
+        """Cache the handle of a message that will be edited later, and the embed it shows."""
+        self._messages[message.id] = message
+        if embed is not None:
+            self.record(message.id, embed)
+
+    def export_handles(self) -> List[Tuple[discord.abc.Snowflake, Optional[dict]]]:
+        """Return the cached message handles with the embed each one shows, for another pipeline to adopt."""
+        return [
+            (message, self._last_sent.get(message_id))
+            for message_id, message in self._messages.items()
+        ]
+
+    def adopt_handle(self, message: discord.abc.Snowflake, shown: Optional[dict]):
+        """Cache a handle exported by another pipeline, with the embed dict it shows."""
+        self._messages[message.id] = message
+        if shown is not None:
+            self._last_sent[message.id] = shown
+
+    def record(self, message_id: int, embed: discord.Embed):
+        """Remember the embed a message shows after it was updated another way."""
+        self._last_sent[message_id] = embed.to_dict()
+
+    def forget(self, message_id: int):
+        """Drop the cached handle and any pending edit for a message."""
+        self._messages.pop(message_id, None)
+        self._last_sent.pop(message_id, None)
+        self.discard(message_id)
+
+    def discard(self, message_id: int):
+        """Drop the pending edit for a message whose embed was updated another way."""
+        pending = self._pending.pop(message_id, None)
+        if pending and pending.handle:
+            pending.handle.cancel()
+
+    def submit(
+        self,
+        channel_id: int,
+        message_id: int,
+        render: Callable[[], discord.Embed],
+        priority: Priority = Priority.REFRESH,
+        clear_view: bool = False,
+    ):
+        """Request an edit of the message. The embed is rendered when the debounce window ends."""
+        self.submitted += 1
+        pending = self._pending.get(message_id)
+        if pending:
+            pending.render = render
+            pending.priority = min(pending.priority, priority)
+            pending.clear_view = pending.clear_view or clear_view
+            self.coalesced += 1
+            return
+
+        pending = _PendingEdit(channel_id, render, priority)
+        pending.clear_view = clear_view
+        self._pending[message_id] = pending
+        pending.handle = asyncio.get_running_loop().call_later(
+            self.debounce, self._start_flush, message_id
+        )
+
+    async def flush(self, message_id: int):
+        """Send the pending edit for a message right away."""
+        pending = self._pending.pop(message_id, None)
+        if not pending:
+            inflight = self._inflight.get(message_id)
+            if inflight:
+                await asyncio.shield(inflight)
+            return
+        if pending.handle:
+            pending.handle.cancel()
+        await self._run_edit(message_id, pending)
+
+    def export_pending(
+        self,
+    ) -> List[Tuple[int, int, Callable[[], discord.Embed], Priority, bool]]:
+        """
+        Cancel the debounce timers and return the pending edits as
+        (channel ID, message ID, render, priority, clear view), for another pipeline to adopt.
+        """
+        exported = []
+        for message_id, pending in self._pending.items():
+            if pending.handle:
+                pending.handle.cancel()
+            exported.append(
+                (pending.channel_id, message_id, pending.render, pending.priority, pending.clear_view)
+            )
+        self._pending.clear()
+        return exported
+
+    def _start_flush(self, message_id: int):
+        pending = self._pending.pop(message_id, None)
+        if pending:
+            task = asyncio.create_task(self._run_edit(message_id, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_edit(self, message_id: int, pending: _PendingEdit):
+        # Keep edits of one message in order
+        previous = self._inflight.get(message_id)
+        task = asyncio.create_task(self._edit(message_id, pending, previous))
+        self._inflight[message_id] = task
+        try:
+            await asyncio.shield(task)
+        finally:
+            if self._inflight.get(message_id) is task and task.done():
+                del self._inflight[message_id]
+
+    def _resolve(self, channel_id: int, message_id: int):
+        message = self._messages.get(message_id)
+        if message is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                return None
+            message = channel.get_partial_message(message_id)
+            self._messages[message_id] = message
+        return message
+
+    async def _edit(
+        self,
+        message_id: int,
+        pending: _PendingEdit,
+        previous: Optional[asyncio.Task],
+    ):
+        if previous and not previous.done():
+            await asyncio.wait([previous])
+
+        message = self._resolve(pending.channel_id, message_id)
+        if message is None:
+            self.failures += 1
+            logger.error(
+                "Channel %s not found for auction message %s.",
+                pending.channel_id,
+                message_id,
+            )
+            return
+
+        embed = pending.render()
+        content = embed.to_dict()
+        if not pending.clear_view and self._last_sent.get(message_id) == content:
+            self.unchanged += 1
+            return
+        if pending.clear_view:
+            edit = lambda: message.edit(embed=embed, view=None)
+        else:
+            edit = lambda: message.edit(embed=embed)
+
+        start = time.perf_counter()
+        try:
+            result = await self.outbound.submit(
+                "edit",
+                pending.channel_id,
+                pending.priority,
+                edit,
+                merge_key=("edit", message_id),
+            )
+            if result is not None:
+                self.edits += 1
+                self._last_sent[message_id] = content
+        except discord.NotFound:
+            self.failures += 1
+            self.forget(message_id)
+            logger.error("Auction message with ID %s could not be found.", message_id)
+        except discord.Forbidden:
+            self.failures += 1
+            logger.error(
+                "Bot does not have permissions to edit the auction message with ID %s.",
+                message_id,
+            )
+        except discord.HTTPException as e:
+            self.failures += 1
+            logger.error("Failed to edit auction message %s: %s", message_id, e)
+        finally:
+            self.edit_latency.observe(time.perf_counter() - start)
@@ -0,0 +1,121 @@
+# cogs/auction/handoff.py
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.auction_data import AuctionData
+
+logger = logging.getLogger("discord_bot")
+
+HANDOFF_ATTRIBUTE = "auction_handoff"  # Bot attribute holding the state between unload and load
+HANDOFF_MAX_AGE = 60.0  # Seconds an unclaimed handoff stays valid
+
+
+class AuctionHandoff:
+    """
+    In-memory state passed from an unloaded Auction cog to its replacement, so
+    reloading the extension keeps live auctions running without reading the
+    database or calling Discord.
+
+    Auctions are handed over as they are, bids and hidden maximums included.
+    Deadlines are handed over as timestamps, because the scheduled callbacks are
+    bound to the old cog; the new cog schedules its own at the same times.
+    Message handles are handed over so embed edits need no fetch. Pending embed
+    edits and queued REST calls are handed over unsent, and the new cog sends
+    them within its own rate limits.
+    """
+
+    __slots__ = (
+        "auctions",
+        "refresh_deadlines",
+        "messages",
+        "pending_edits",
+        "outbound_jobs",
+        "last_auction_id",
+        "restored",
+        "created_at",
+    )
+
+    def __init__(
+        self,
+        auctions: List[AuctionData],
+        refresh_deadlines: Dict[str, Optional[float]],
+        messages: List[Tuple[object, Optional[dict]]],
+        pending_edits: List[Tuple[int, int, Callable, int, bool]],
+        outbound_jobs: List[Tuple[str, int, object]],
+        last_auction_id: Optional[int],
+        restored: bool,
+    ):
+        self.auctions = auctions
+        # Armed auction ID -> its pending refresh deadline, None if no refresh is due
+        self.refresh_deadlines = refresh_deadlines
+        self.messages = messages  # Cached message handles and the embed dicts they show
+        # Debounced edits, rendered by the old cog's embed builder once they are due
+        self.pending_edits = pending_edits
+        self.outbound_jobs = outbound_jobs  # Queued REST calls with the futures awaiting them
+        self.last_auction_id = last_auction_id
+        self.restored = restored  # Whether the auctions were reconnected to Discord
+        self.created_at = time.monotonic()
+
+    @classmethod
+    def export(cls, cog) -> "AuctionHandoff":
+        """Capture the live state of a cog whose timers have stopped, taking its unsent calls."""
+        refresh_deadlines = {
+            auction.id: cog.scheduler.deadline((auction.id, "refresh"))
+            for auction in cog.auctions
+            if (auction.id, "close") in cog.scheduler
+        }
+        return cls(
+            cog.auctions.values(),
+            refresh_deadlines,
+            cog.embed_editor.export_handles(),
+            cog.embed_editor.export_pending(),
+            cog.outbound.export_jobs(),
+            cog.id_generator.last_issued(),
+            cog.restored,
+        )
+
+    def adopt(self, cog):
+        """Register the handed-over state with a new cog, re-arm its timers and resume its calls."""
+        for auction in self.auctions:
+            cog.auctions.add(auction)
+        for message, shown in self.messages:
+            cog.embed_editor.adopt_handle(message, shown)
+        for route, channel_id, job in self.outbound_jobs:
+            cog.outbound.adopt_job(route, channel_id, job)
+        for channel_id, message_id, render, priority, clear_view in self.pending_edits:
+            cog.embed_editor.submit(channel_id, message_id, render, priority, clear_view)
+        if self.last_auction_id is not None:
+            cog.id_generator.advance_past(self.last_auction_id)
+
+        # Auctions that were not reconnected yet are reconnected by the rehydration the new cog runs
+        cog.restored = self.restored
+        for auction in self.auctions:
+            if auction.id not in self.refresh_deadlines:
+                # Not armed yet, so it closes on time whether or not a rehydration follows
+                cog._arm_auction(auction)
+                continue
+            cog._schedule_close(auction)
+            refresh_deadline = self.refresh_deadlines[auction.id]
+            if refresh_deadline is not None:
+                cog._schedule_refresh(auction, refresh_deadline)
+
+
+def stash_handoff(bot, handoff: AuctionHandoff):
+    """Leave the state on the bot for the next Auction cog to claim."""
+    setattr(bot, HANDOFF_ATTRIBUTE, handoff)
+
+
+def claim_handoff(bot) -> Optional[AuctionHandoff]:
+    """Take the state left by the previous Auction cog, unless it is missing or stale."""
+    handoff = getattr(bot, HANDOFF_ATTRIBUTE, None)
+    if handoff is None:
+        return None
+    delattr(bot, HANDOFF_ATTRIBUTE)
+    age = time.monotonic() - handoff.created_at
+    if age > HANDOFF_MAX_AGE:
+        logger.warning(
+            "Ignoring the auction state handed over %.0fs ago; reloading from the database", age
+        )
+        return None
+    return handoff
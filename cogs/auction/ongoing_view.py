@@ -0,0 +1,43 @@
+# cogs/auction/ongoing_view.py
+import discord
+
+
+class OngoingAuctionsView(discord.ui.View):
+    """Previous/next buttons for the paginated ongoing auctions listing."""
+
+    def __init__(self, cog, guild_id: int, author_id: int, page: int, page_count: int):
+        super().__init__(timeout=120)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.author_id = author_id
+        self.page = page
+        self._update_buttons(page_count)
+
+    def _update_buttons(self, page_count: int):
+        self.previous_page.disabled = self.page <= 0
+        self.next_page.disabled = self.page >= page_count - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Only the member who requested the listing can flip its pages
+        if interaction.user.id == self.author_id:
+            return True
+        cog = interaction.client.get_cog("Auction") or self.cog
+        await cog._send_interaction_error(
+            interaction, "Only the member who requested this list can page through it."
+        )
+        return False
+
+    async def _show(self, interaction: discord.Interaction, page: int):
+        # Pages are rendered on demand from the live registry, of the current cog if it was reloaded
+        cog = interaction.client.get_cog("Auction") or self.cog
+        embed, self.page, page_count = cog._build_ongoing_page(self.guild_id, page)
+        self._update_buttons(page_count)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page - 1)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page + 1)
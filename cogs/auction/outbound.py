@@ -0,0 +1,282 @@
+# cogs/auction/outbound.py
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger("discord_bot")
+
+# discord.py routes of the outbound calls; Discord rate limits each per channel
+DISCORD_ROUTES = {
+    "send": ("POST", "/channels/{channel_id}/messages"),
+    "edit": ("PATCH", "/channels/{channel_id}/messages/{message_id}"),
+    "delete": ("DELETE", "/channels/{channel_id}/messages/{message_id}"),
+    "reaction": ("PUT", "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"),
+}
+
+# Reports (limit, remaining, seconds until reset) of a route in a channel, or None if unknown
+RateLimitReader = Callable[[str, int], Optional[Tuple[int, int, float]]]
+
+
+def discord_rate_limits(http) -> Optional[RateLimitReader]:
+    """
+    Read the rate limits discord.py parsed from Discord's response headers.
+
+    discord.py keeps them in private attributes of its HTTP client, so they
+    are only read from a discord.py 2 client that has them. Otherwise None is
+    returned and the dispatcher uses its configured limits.
+    """
+    buckets = getattr(http, "_buckets", None)
+    bucket_hashes = getattr(http, "_bucket_hashes", None)
+    if (
+        discord.version_info.major != 2
+        or not isinstance(buckets, dict)
+        or not isinstance(bucket_hashes, dict)
+    ):
+        logger.warning(
+            "Rate limits cannot be read from discord.py %s; using the configured outbound limits",
+            discord.__version__,
+        )
+        return None
+
+    def read(route: str, channel_id: int) -> Optional[Tuple[int, int, float]]:
+        method, path = DISCORD_ROUTES[route]
+        route_key = f"{method} {path}"
+        bucket_hash = bucket_hashes.get(route_key)
+        if bucket_hash is None:
+            keys = (f"{route_key}:{channel_id}",)
+        else:
+            # discord.py files the first window of a newly discovered bucket without the colon
+            keys = (f"{bucket_hash}:{channel_id}", f"{bucket_hash}{channel_id}")
+        for key in keys:
+            ratelimit = buckets.get(key)
+            if ratelimit is not None and getattr(ratelimit, "expires", None) is not None:
+                break
+        else:
+            return None  # No response headers seen for this route and channel
+        try:
+            reset_after = ratelimit.expires - asyncio.get_running_loop().time()
+            return int(ratelimit.limit), int(ratelimit.remaining), reset_after
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    return read
+
+
+class Priority(IntEnum):
+    """Outbound message classes. Lower values are sent first."""
+
+    RESULT = 0  # Closing results and new auction posts
+    BID = 1  # Bid confirmations and bid-triggered embed edits
+    REPLY = 2  # Error messages and other command replies
+    REFRESH = 3  # Periodic countdown refreshes
+
+
+class _Job:
+    __slots__ = ("priority", "seq", "factory", "future", "merge_key", "enqueued_at", "live")
+
+    def __init__(self, priority, seq, factory, future, merge_key):
+        self.priority = priority
+        self.seq = seq
+        self.factory = factory  # Creates the coroutine performing the REST call
+        self.future = future
+        self.merge_key = merge_key
+        self.enqueued_at = time.perf_counter()
+        self.live = True  # False once the job was merged into a newer one or evicted
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _RouteQueue:
+    __slots__ = ("heap", "merge_keys", "size", "limit", "remaining", "reset_at", "worker")
+
+    def __init__(self, limit: int):
+        self.heap: List[_Job] = []
+        self.merge_keys: Dict[Hashable, _Job] = {}
+        self.size = 0  # Number of live jobs in the heap
+        self.limit = limit  # Calls allowed per window
+        self.remaining = limit  # Calls left in the current window
+        self.reset_at: Optional[float] = None  # Monotonic end of the current window
+        self.worker: Optional[asyncio.Task] = None
+
+
+class OutboundDispatcher:
+    """
+    Sends outbound REST calls through priority queues per route and channel.
+
+    Discord rate limits sends, edits, deletions and reactions separately in
+    every channel, so each pair has its own queue and window. After every call
+    the window is synced with the limits Discord reported, read through
+    `limits`; while no limits are known for it, `rate` calls per `per` seconds are
+    assumed. Queued jobs sharing a merge key collapse into the newest one.
+    Refreshes are dropped while their bucket is saturated, and a full queue
+    evicts its lowest-priority job to make room for more important work.
+    """
+
+    def __init__(
+        self,
+        rate: int = 5,
+        per: float = 5.0,
+        max_queue: int = 50,
+        limits: Optional[RateLimitReader] = None,
+    ):
+        self.rate = rate
+        self.per = per
+        self.max_queue = max_queue
+        self.limits = limits
+        self._queues: Dict[Tuple[str, int], _RouteQueue] = {}
+        self._counter = itertools.count()
+
+        # Counters
+        self.sent = 0  # Jobs sent to Discord
+        self.dropped = 0  # Jobs discarded without being sent
+        self.merged = 0  # Jobs merged into a newer job with the same merge key
+        self.wait_total = 0.0  # Total seconds jobs spent queued
+        self.wait_max = 0.0  # Longest time a job spent queued
+
+    def depth(self, channel_id: Optional[int] = None) -> int:
+        """Return the number of queued jobs for one channel, or for all channels."""
+        return sum(
+            queue.size
+            for (_, queue_channel_id), queue in self._queues.items()
+            if channel_id is None or queue_channel_id == channel_id
+        )
+
+    def submit(
+        self,
+        route: str,
+        channel_id: int,
+        priority: Priority,
+        factory: Callable[[], Awaitable],
+        merge_key: Optional[Hashable] = None,
+    ) -> asyncio.Future:
+        """
+        Queue a REST call on one of the DISCORD_ROUTES for a channel.
+        The returned future resolves to the call's result, or None if the job was dropped.
+        """
+        future = asyncio.get_running_loop().create_future()
+        key = (route, channel_id)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _RouteQueue(self.rate)
+        self._reset_window(queue)
+
+        previous = queue.merge_keys.get(merge_key) if merge_key is not None else None
+        if previous is not None:
+            # Replace the queued job, keeping the more urgent of the two priorities
+            priority = min(priority, previous.priority)
+            self._discard(queue, previous)
+            self.merged += 1
+            previous.future.set_result(None)
+        elif priority >= Priority.REFRESH and queue.remaining < 1 and queue.size:
+            self.dropped += 1
+            future.set_result(None)
+            return future
+        elif queue.size >= self.max_queue and not self._evict(queue, priority):
+            self.dropped += 1
+            future.set_result(None)
+            return future
+
+        self._push(key, queue, _Job(priority, next(self._counter), factory, future, merge_key))
+        return future
+
+    def export_jobs(self) -> List[Tuple[str, int, _Job]]:
+        """
+        Take the queued jobs, in order, for another dispatcher to adopt.
+        Calls already being sent finish here, and the workers then stop.
+        """
+        jobs = []
+        for (route, channel_id), queue in self._queues.items():
+            jobs.extend((route, channel_id, job) for job in sorted(queue.heap) if job.live)
+            queue.heap.clear()
+            queue.merge_keys.clear()
+            queue.size = 0
+        return jobs
+
+    def adopt_job(self, route: str, channel_id: int, job: _Job):
+        """Queue a job exported by another dispatcher, keeping its priority and future."""
+        key = (route, channel_id)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _RouteQueue(self.rate)
+        job.seq = next(self._counter)
+        self._push(key, queue, job)
+
+    def _push(self, key: Tuple[str, int], queue: _RouteQueue, job: _Job):
+        heapq.heappush(queue.heap, job)
+        queue.size += 1
+        if job.merge_key is not None:
+            queue.merge_keys[job.merge_key] = job
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._drain(key, queue))
+
+    def _reset_window(self, queue: _RouteQueue):
+        if queue.reset_at is not None and time.monotonic() >= queue.reset_at:
+            queue.remaining = queue.limit
+            queue.reset_at = None
+
+    def _sync_window(self, key: Tuple[str, int], queue: _RouteQueue):
+        """Adopt the limits Discord reported for the route after a call."""
+        reported = self.limits(*key) if self.limits else None
+        if reported is None:
+            # Not reported yet, or no longer known: assume the configured limit
+            queue.limit = self.rate
+            return
+        queue.limit, queue.remaining, reset_after = reported
+        if reset_after > 0:
+            queue.reset_at = time.monotonic() + reset_after
+        else:
+            queue.remaining, queue.reset_at = queue.limit, None
+
+    def _discard(self, queue: _RouteQueue, job: _Job):
+        job.live = False
+        queue.size -= 1
+        if job.merge_key is not None and queue.merge_keys.get(job.merge_key) is job:
+            del queue.merge_keys[job.merge_key]
+
+    def _evict(self, queue: _RouteQueue, priority: Priority) -> bool:
+        """Drop the least important queued job if it is less important than `priority`."""
+        victim = max((job for job in queue.heap if job.live), default=None)
+        if victim is None or victim.priority <= priority:
+            return False
+        self._discard(queue, victim)
+        self.dropped += 1
+        victim.future.set_result(None)
+        return True
+
+    async def _drain(self, key: Tuple[str, int], queue: _RouteQueue):
+        while queue.size:
+            self._reset_window(queue)
+            if queue.remaining < 1:
+                await asyncio.sleep(max(queue.reset_at - time.monotonic(), 0))
+                continue
+
+            job = heapq.heappop(queue.heap)
+            if not job.live:
+                continue
+            self._discard(queue, job)
+            queue.remaining -= 1
+            if queue.reset_at is None:
+                queue.reset_at = time.monotonic() + self.per
+
+            waited = time.perf_counter() - job.enqueued_at
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            try:
+                result = await job.factory()
+            except Exception as e:
+                self._sync_window(key, queue)
+                if not job.future.done():
+                    job.future.set_exception(e)
+                continue
+            self._sync_window(key, queue)
+            self.sent += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        queue.heap.clear()  # Only discarded jobs are left
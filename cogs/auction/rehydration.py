@@ -0,0 +1,190 @@
+# cogs/auction/rehydration.py
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import discord
+
+from utils.auction_data import AuctionData
+from .outbound import Priority
+
+logger = logging.getLogger("discord_bot")
+
+HISTORY_PAGE_SIZE = 100  # Messages per history request, the most Discord returns
+MAX_HISTORY_PAGES = 5  # History pages read per channel before fetching the rest one by one
+
+
+class AuctionRehydrator:
+    """
+    Reconnects restored auctions to Discord after a restart.
+
+    Auctions are grouped by channel and each channel is resolved once, with at
+    most `concurrency` channels in flight. A channel holding a single auction
+    fetches its message; a channel holding several reads its history in pages
+    of 100 messages instead of fetching them one by one. Auctions whose channel
+    is gone are dropped, auctions whose message was deleted get a new one, and
+    auctions that ended while the bot was down are closed together before the
+    rest are armed. A channel or auction that fails with a Discord error is
+    logged and left as it is, so every surviving auction is still armed.
+    """
+
+    def __init__(self, cog, concurrency: int):
+        self.cog = cog
+        self.bot = cog.bot
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.requests = 0  # REST calls made to resolve channels and messages
+        self.reposted = 0
+        self.dropped = 0
+
+    async def run(self):
+        start = time.perf_counter()
+        by_channel: Dict[int, List[AuctionData]] = defaultdict(list)
+        for auction in self.cog.auctions.values():
+            by_channel[auction.channel_id].append(auction)
+
+        channels = list(by_channel.items())
+        results = await asyncio.gather(
+            *(self._rehydrate_channel(channel_id, auctions) for channel_id, auctions in channels),
+            return_exceptions=True,
+        )
+        for (channel_id, _), result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to rehydrate the auctions of channel %s: %s", channel_id, result)
+
+        ended = [
+            auction
+            for auction in self.cog.auctions.values()
+            if self.cog._get_remaining_time(auction) <= 0
+        ]
+        results = await asyncio.gather(
+            *(self.cog.close_auction(auction) for auction in ended), return_exceptions=True
+        )
+        for auction, result in zip(ended, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to close ended auction %s: %s", auction.id, result)
+
+        for auction in self.cog.auctions.values():
+            self.cog._arm_auction(auction)
+
+        logger.info(
+            "Rehydrated %s live auctions in %s channels in %.2fs: closed %s ended, "
+            "reposted %s, dropped %s, %s REST calls",
+            len(self.cog.auctions),
+            len(by_channel),
+            time.perf_counter() - start,
+            len(ended),
+            self.reposted,
+            self.dropped,
+            self.requests,
+        )
+
+    async def _rehydrate_channel(self, channel_id: int, auctions: List[AuctionData]):
+        async with self.semaphore:
+            try:
+                channel = await self._resolve_channel(channel_id)
+            except discord.HTTPException as e:
+                # Leave the auctions as they are; their edits will resolve the channel lazily
+                logger.error("Could not resolve channel %s: %s", channel_id, e)
+                return
+            if channel is None:
+                for auction in auctions:
+                    logger.warning(
+                        "Dropping auction %s: channel %s no longer exists",
+                        auction.id,
+                        channel_id,
+                    )
+                    self.cog._drop_auction(auction)
+                    self.dropped += 1
+                return
+
+            try:
+                messages = await self._resolve_messages(
+                    channel, [auction.message_id for auction in auctions if auction.message_id]
+                )
+            except discord.HTTPException as e:
+                # Leave the auctions as they are; their edits will resolve the messages lazily
+                logger.error(
+                    "Could not read the auction messages of channel %s: %s",
+                    channel_id,
+                    e,
+                )
+                return
+
+        for auction in auctions:
+            message = messages.get(auction.message_id)
+            if message is not None:
+                self.cog.embed_editor.bind(message, message.embeds[0] if message.embeds else None)
+            elif self.cog._get_remaining_time(auction) > 0:
+                try:
+                    await self._repost(channel, auction)
+                except discord.HTTPException as e:
+                    # The auction stays armed and closes on time, without a message to edit
+                    logger.error("Could not repost the message of auction %s: %s", auction.id, e)
+                    auction.message_id = None
+            else:
+                auction.message_id = None  # Closing it must not edit the deleted message
+
+    async def _resolve_channel(self, channel_id: int):
+        channel = self.bot.get_channel(channel_id)
+        if channel is not None:
+            return channel
+        self.requests += 1
+        try:
+            return await self.bot.fetch_channel(channel_id)
+        except (discord.NotFound, discord.Forbidden):
+            return None  # Other errors may be transient and are raised to the caller
+
+    async def _resolve_messages(self, channel, message_ids: List[int]) -> Dict[int, discord.Message]:
+        """Return the messages that still exist, keyed by ID."""
+        if len(message_ids) == 1:
+            self.requests += 1
+            try:
+                message = await channel.fetch_message(message_ids[0])
+            except discord.NotFound:
+                return {}
+            return {message.id: message}
+
+        found = {}
+        remaining = sorted(message_ids)
+        for _ in range(MAX_HISTORY_PAGES):
+            if not remaining:
+                break
+            # Read forward from the oldest unresolved message
+            self.requests += 1
+            newest = None
+            async for message in channel.history(
+                limit=HISTORY_PAGE_SIZE,
+                after=discord.Object(id=remaining[0] - 1),
+                oldest_first=True,
+            ):
+                newest = message.id
+                found[message.id] = message
+            if newest is None:
+                break
+            # Anything older than the newest message read and not found was deleted
+            remaining = [message_id for message_id in remaining if message_id > newest]
+        else:
+            # The messages are spread over more history than is worth paging through
+            for message_id in remaining:
+                self.requests += 1
+                try:
+                    message = await channel.fetch_message(message_id)
+                except discord.NotFound:
+                    continue
+                found[message.id] = message
+        return {message_id: found[message_id] for message_id in message_ids if message_id in found}
+
+    async def _repost(self, channel, auction: AuctionData):
+        embed = self.cog._build_auction_embed(auction)
+        message = await self.cog._send(
+            channel, Priority.RESULT, embed=embed, view=self.cog._build_bid_view(auction)
+        )
+        if message is None:
+            logger.error("Could not repost the message of auction %s", auction.id)
+            return
+        logger.info("Reposted the deleted message of auction %s", auction.id)
+        self.cog._set_auction_message(auction, message.id)
+        self.cog.embed_editor.bind(message, embed)
+        self.reposted += 1
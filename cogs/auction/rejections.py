@@ -0,0 +1,112 @@
+# cogs/auction/rejections.py
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import discord
+
+logger = logging.getLogger("discord_bot")
+
+# Why a bid was shed, by the throttle scope that refused it
+SHED_REASONS = {
+    "user": "You are bidding too fast. Please wait a moment before bidding again.",
+    "auction": "This auction is receiving too many bids. Please try again in a moment.",
+    "channel": "This channel is receiving too many bids. Please try again in a moment.",
+}
+# Shown in the channel for a rejected maximum bid whose reason could not be sent privately
+PRIVATE_REJECTION_REASON = (
+    "Your maximum bid was not placed. Allow direct messages from server members to see why."
+)
+
+
+class _Window:
+    __slots__ = ("destination", "rejections", "handle")
+
+    def __init__(self):
+        self.destination = None  # Where the aggregated rejection is sent
+        self.rejections: List[Tuple[str, str]] = []  # (bidder name, reason) held back
+        self.handle = None
+
+
+class RejectionBatcher:
+    """
+    Collapses bid rejections in a channel into one message per window.
+
+    The first rejection in a quiet channel is sent right away and opens a window
+    of `window` seconds. Rejections arriving while it is open are held back and
+    sent as a single summary when it ends, which opens the next window, so a
+    channel flooded with bad bids costs one message per window.
+    """
+
+    MAX_LINES = 10  # Bidders listed in a summary before the rest are counted
+
+    def __init__(self, window: float, send: Callable[..., Awaitable]):
+        self.window = window
+        self._send = send  # send(destination, embed) posts a message in the channel
+        self._windows: Dict[int, _Window] = {}
+        self._tasks = set()
+
+        # Counters
+        self.sent = 0  # Rejection messages sent
+        self.merged = 0  # Rejections folded into a summary
+
+    async def reject(self, destination, bidder_name: str, reason: str):
+        """Tell a bidder their bid was rejected, or hold it for the channel's next summary."""
+        channel_id = getattr(destination, "channel", destination).id
+        window = self._windows.get(channel_id)
+        if window is not None:
+            window.destination = destination
+            window.rejections.append((bidder_name, reason))
+            self.merged += 1
+            return
+
+        self._open(channel_id)
+        embed = discord.Embed(title="Error", description=reason, color=discord.Color.red())
+        await self._deliver(destination, embed)
+
+    def close(self):
+        """Cancel the open windows, dropping held-back rejections."""
+        for window in self._windows.values():
+            window.handle.cancel()
+        self._windows.clear()
+
+    def _open(self, channel_id: int):
+        window = self._windows[channel_id] = _Window()
+        window.handle = asyncio.get_running_loop().call_later(
+            self.window, self._end_window, channel_id
+        )
+
+    def _end_window(self, channel_id: int):
+        window = self._windows.pop(channel_id, None)
+        if window is None or not window.rejections:
+            return
+        self._open(channel_id)
+        task = asyncio.create_task(self._deliver(window.destination, self._summarize(window.rejections)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _summarize(self, rejections: List[Tuple[str, str]]) -> discord.Embed:
+        # Count each bidder's rejections and keep the latest reason
+        by_bidder: Dict[str, List] = {}
+        for name, reason in rejections:
+            entry = by_bidder.setdefault(name, [0, reason])
+            entry[0] += 1
+            entry[1] = reason
+        lines = [
+            f"**{name}** ({count}): {reason}"
+            for name, (count, reason) in list(by_bidder.items())[: self.MAX_LINES]
+        ]
+        if len(by_bidder) > self.MAX_LINES:
+            lines.append(f"...and {len(by_bidder) - self.MAX_LINES} more bidders.")
+        return discord.Embed(
+            title=f"{len(rejections)} Bids Rejected",
+            description="\n".join(lines),
+            color=discord.Color.red(),
+        )
+
+    async def _deliver(self, destination, embed: discord.Embed):
+        try:
+            await self._send(destination, embed)
+            self.sent += 1
+        except discord.HTTPException as e:
+            logger.error("Failed to send a bid rejection: %s", e)
@@ -0,0 +1,364 @@
+# cogs/diagnostics.py
+import asyncio
+import io
+import logging
+import os
+import selectors
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Dict, List, Optional
+
+import discord
+from discord.ext import commands
+
+logger = logging.getLogger("discord_bot")
+
+# Files the loop thread sits in while it waits for I/O rather than running callbacks
+IDLE_FILES = frozenset((selectors.__file__, asyncio.runners.__file__))
+# Files of the loop machinery that sits below every callback, left out of stall stacks
+LOOP_FILES = IDLE_FILES | {asyncio.base_events.__file__, asyncio.events.__file__}
+
+
+def _describe(code) -> str:
+    """Name a function by its file and first line, relative to the bot's directory."""
+    path = code.co_filename
+    if path.startswith(os.getcwd() + os.sep):
+        path = os.path.relpath(path)
+    else:
+        path = os.path.join(*path.split(os.sep)[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+class LoopSampler(threading.Thread):
+    """
+    Samples the event loop thread's stack from a background thread, so the
+    code being profiled is not slowed down by tracing every call. Samples taken
+    while the loop waits for I/O only count towards the idle share.
+    """
+
+    def __init__(self, thread_id: int, interval: float, command_codes: Dict):
+        super().__init__(name="loop-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.command_codes = command_codes  # Command callback code → command name
+        self.samples = 0
+        self.idle = 0
+        self.own = Counter()  # Samples with the function at the top of the stack
+        self.total = Counter()  # Samples with the function anywhere on the stack
+        self.handler_own = Counter()
+        self.handler_total = Counter()
+        self.by_command = Counter()
+        self.started = time.monotonic()
+        self.stopped = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.exception("Event loop profiler failed to take a sample: %s", e)
+        self.stopped = time.monotonic()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        self.samples += 1
+        if frame is None or frame.f_code.co_filename in IDLE_FILES:
+            self.idle += 1
+            return
+
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        command = next((self.command_codes[code] for code in codes if code in self.command_codes), None)
+        unique = set(codes)
+        self.own[codes[0]] += 1
+        self.total.update(unique)
+        if command is not None:
+            self.by_command[command] += 1
+            self.handler_own[codes[0]] += 1
+            self.handler_total.update(unique)
+
+    def report(self, limit: int) -> str:
+        """Format the hottest functions as a plain text table."""
+        elapsed = (self.stopped or time.monotonic()) - self.started
+        busy = self.samples - self.idle
+        in_handlers = sum(self.by_command.values())
+        lines = [
+            f"Event loop profile: {elapsed:.1f}s, {self.samples} samples every {self.interval * 1000:g}ms",
+            f"Busy: {busy} samples ({busy / max(self.samples, 1):.1%}), "
+            f"{in_handlers} of them in command handlers",
+            "",
+            "Samples by command:",
+        ]
+        lines.extend(f"  {count:>7}  {name}" for name, count in self.by_command.most_common())
+        if not self.by_command:
+            lines.append("  (none)")
+
+        for title, own, total in (
+            ("Hottest functions in command handlers", self.handler_own, self.handler_total),
+            ("Hottest functions overall", self.own, self.total),
+        ):
+            lines.extend(["", f"{title}:", f"  {'own':>7}  {'total':>7}  function"])
+            for code, count in own.most_common(limit):
+                lines.append(f"  {count:>7}  {total[code]:>7}  {_describe(code)}")
+            if not own:
+                lines.append("  (none)")
+        return "\n".join(lines) + "\n"
+
+
+class Diagnostics(commands.Cog):
+    """Event-loop stall watchdog, an on-demand sampling profiler and hot reloads, for the bot owner."""
+
+    STALL_THRESHOLD = float(os.getenv("LOOP_STALL_THRESHOLD_MS", "100")) / 1000  # Seconds of blocking reported as a stall; 0 disables
+    HEARTBEAT_INTERVAL = 0.05  # Seconds between event-loop heartbeats
+    STALL_STACK_DEPTH = 8  # Innermost frames logged with a stall
+    PROFILE_INTERVAL = 0.005  # Seconds between profiler samples
+    MAX_PROFILE_DURATION = 300  # Longest profiling window in seconds
+    PROFILE_TOP_FUNCTIONS = 25  # Functions listed per table of a profile
+    DEFAULT_RELOAD_EXTENSION = "cogs.auction.auction"  # Extension reloaded when none is named
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.threshold = self.STALL_THRESHOLD
+        self.stalls = 0
+        self.worst_stall = 0.0
+        self.running_commands = Counter()  # Commands in flight, by name
+        self.sampler: Optional[LoopSampler] = None
+        # Command callback code → command name. Built on the event loop and replaced
+        # whole, so the watchdog and profiler threads never iterate the command dicts.
+        self.command_codes: Dict = {}
+        self._loop_thread_id = None
+        self._heartbeat_task = None
+        self._watchdog = None
+        self._watchdog_stop = threading.Event()
+        # Shared with the watchdog thread: the heartbeat's sequence number and
+        # deadline, and the stack captured for a heartbeat that was late
+        self._beat = 0
+        self._beat_deadline = 0.0
+        self._captured_beat = -1
+        self._captured_stack: Optional[List[str]] = None
+        self._captured_command: Optional[str] = None
+
+    async def cog_load(self):
+        self._loop_thread_id = threading.get_ident()
+        self._refresh_command_codes()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def cog_unload(self):
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+        self._watchdog_stop.set()
+        if self.sampler is not None:
+            self.sampler.stop()
+
+    async def cog_command_error(self, ctx: commands.Context, error: commands.CommandError):
+        if isinstance(error, commands.NotOwner):
+            ctx.handled = True
+            logger.warning(
+                "%s tried to use the owner-only command %s", ctx.author, ctx.command.qualified_name
+            )
+
+    @commands.Cog.listener()
+    async def on_command(self, ctx: commands.Context):
+        ctx.diagnostics_command = ctx.command.qualified_name
+        self.running_commands[ctx.diagnostics_command] += 1
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context):
+        self._command_finished(ctx)
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx: commands.Context, error: commands.CommandError):
+        self._command_finished(ctx)
+
+    def _command_finished(self, ctx: commands.Context):
+        # Errors raised before invocation, such as unknown commands, were never counted
+        name = getattr(ctx, "diagnostics_command", None)
+        if name is None:
+            return
+        self.running_commands[name] -= 1
+        if self.running_commands[name] <= 0:
+            del self.running_commands[name]
+
+    def _refresh_command_codes(self):
+        """Map the code of every command callback to its command, as currently loaded."""
+        self.command_codes = {
+            command.callback.__code__: command.qualified_name
+            for command in self.bot.walk_commands()
+        }
+
+    async def _heartbeat(self):
+        while True:
+            self._beat_deadline = time.monotonic() + self.HEARTBEAT_INTERVAL
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+            lag = time.monotonic() - self._beat_deadline
+            if self.threshold and lag >= self.threshold:
+                self._report_stall(lag)
+            self._beat += 1
+
+    def _watch(self):
+        """Watchdog thread: capture the loop's stack while a heartbeat is overdue."""
+        while not self._watchdog_stop.wait(self.HEARTBEAT_INTERVAL / 2):
+            # An error must not end the thread, or stalls would go unreported from then on
+            try:
+                self._check_heartbeat()
+            except Exception as e:
+                logger.exception("Event loop watchdog failed to capture a stall: %s", e)
+
+    def _check_heartbeat(self):
+        beat = self._beat
+        if not self.threshold or beat == self._captured_beat:
+            return
+        if time.monotonic() - self._beat_deadline < self.threshold:
+            return
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        command_codes = self.command_codes
+        command = None
+        walker = frame
+        while walker is not None and command is None:
+            command = command_codes.get(walker.f_code)
+            walker = walker.f_back
+        stack = traceback.format_list(
+            [entry for entry in traceback.extract_stack(frame) if entry.filename not in LOOP_FILES]
+            [-self.STALL_STACK_DEPTH:]
+        )
+        del frame, walker
+        self._captured_stack = stack
+        self._captured_command = command
+        self._captured_beat = beat
+
+    def _report_stall(self, lag: float):
+        self.stalls += 1
+        self.worst_stall = max(self.worst_stall, lag)
+        if self._captured_beat != self._beat:
+            # The watchdog polls at intervals and can miss a stall just over the threshold
+            logger.warning(
+                "Event loop blocked for %.0f ms (no stack captured); commands in flight: %s",
+                lag * 1000,
+                self._format_running(),
+            )
+            return
+        if self._captured_command is not None:
+            source = "in command %s" % self._captured_command
+        else:
+            source = "outside command handlers; commands in flight: %s" % self._format_running()
+        logger.warning(
+            "Event loop blocked for %.0f ms %s. Blocking stack:\n%s",
+            lag * 1000,
+            source,
+            "".join(self._captured_stack).rstrip(),
+        )
+
+    def _format_running(self) -> str:
+        if not self.running_commands:
+            return "none"
+        return ", ".join(
+            f"{name} ({count})" if count > 1 else name
+            for name, count in self.running_commands.most_common()
+        )
+
+    @commands.command(name="profile", aliases=["profiler"])
+    @commands.is_owner()
+    async def profile(self, ctx: commands.Context, seconds: int = 30):
+        """Sample the event loop for a while and attach the hottest functions."""
+        if self.sampler is not None:
+            await ctx.send("A profile is already running.")
+            return
+        if not 1 <= seconds <= self.MAX_PROFILE_DURATION:
+            await ctx.send(f"The profiling window must be between 1 and {self.MAX_PROFILE_DURATION} seconds.")
+            return
+
+        self.sampler = LoopSampler(self._loop_thread_id, self.PROFILE_INTERVAL, self.command_codes)
+        self.sampler.start()
+        await ctx.send(f"Profiling the event loop for {seconds} seconds.")
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler, self.sampler = self.sampler, None
+            sampler.stop()
+
+        report = sampler.report(self.PROFILE_TOP_FUNCTIONS)
+        logger.info("Profiled the event loop for %s seconds, %s samples", seconds, sampler.samples)
+        await ctx.send(
+            "Profile complete.",
+            file=discord.File(io.BytesIO(report.encode()), filename="profile.txt"),
+        )
+
+    @commands.command(name="watchdog", aliases=["looplag"])
+    @commands.is_owner()
+    async def watchdog(self, ctx: commands.Context, threshold: str = None):
+        """Show stall statistics, or set the stall threshold in milliseconds ('off' disables it)."""
+        if threshold is not None:
+            if threshold.lower() == "off":
+                self.threshold = 0.0
+            elif threshold.isdigit() and int(threshold) > 0:
+                self.threshold = int(threshold) / 1000
+            else:
+                await ctx.send("The threshold must be a number of milliseconds or 'off'.")
+                return
+            logger.info("Event loop stall threshold set to %s by %s", threshold, ctx.author)
+
+        status = f"{self.threshold * 1000:.0f} ms" if self.threshold else "off"
+        await ctx.send(
+            f"Stall threshold: {status}. Stalls reported: {self.stalls}, "
+            f"worst {self.worst_stall * 1000:.0f} ms. Commands in flight: {self._format_running()}."
+        )
+
+    @commands.command(name="reload", aliases=["hotreload"])
+    @commands.is_owner()
+    async def reload(self, ctx: commands.Context, extension: str = DEFAULT_RELOAD_EXTENSION):
+        """Reload an extension from disk, along with the other modules of its package."""
+        if extension not in self.bot.extensions:
+            await ctx.send(f"The extension `{extension}` is not loaded.")
+            return
+
+        # reload_extension only re-imports the extension module itself. When the
+        # extension has a package of its own, its other modules are dropped too,
+        # so that fixes to them are picked up.
+        package = extension.rpartition(".")[0]
+        stale = {}
+        if package and not any(
+            other != extension and other.startswith(package + ".") for other in self.bot.extensions
+        ):
+            stale = {
+                name: module
+                for name, module in sys.modules.items()
+                if name.startswith(package + ".") and name != extension
+            }
+        for name in stale:
+            del sys.modules[name]
+
+        started = time.perf_counter()
+        try:
+            await self.bot.reload_extension(extension)
+        except commands.ExtensionError as e:
+            # discord.py restores the previous extension module; restore its package with it
+            sys.modules.update(stale)
+            logger.exception("Reloading %s failed: %s", extension, e)
+            await ctx.send(f"Reloading `{extension}` failed, the previous version was kept: {e}")
+            return
+        finally:
+            self._refresh_command_codes()
+
+        elapsed = time.perf_counter() - started
+        logger.info("%s reloaded %s in %.1f ms", ctx.author, extension, elapsed * 1000)
+        await ctx.send(f"Reloaded `{extension}` in {elapsed * 1000:.0f} ms.")
+
+
+async def setup(bot: commands.Bot):
+    """Sets up the Diagnostics cog."""
+    await bot.add_cog(Diagnostics(bot))
+    logger.info("Diagnostics cog loaded")
@@ -0,0 +1,253 @@
+# cogs/metrics.py
+import asyncio
+import logging
+import os
+import time
+
+from aiohttp import web
+from discord.ext import commands
+
+from utils.metrics import CONTENT_TYPE, Counter, Gauge, Histogram, MetricsRegistry
+from utils.utilities import resident_memory_bytes
+
+logger = logging.getLogger("discord_bot")
+
+RATE_LIMIT_MESSAGE = "We are being rate limited."
+GLOBAL_RATE_LIMIT_MESSAGE = "Global rate limit has been hit."
+
+
+class RateLimitCounter(logging.Handler):
+    """
+    Counts the 429 responses discord.py logs while handling rate limits.
+
+    discord.py logs every 429, then logs a global one a second time without
+    awaiting in between. A 429 is therefore only counted once the current
+    callback has finished, as global if that second record followed, so each
+    response is counted exactly once under its scope.
+    """
+
+    def __init__(self, counter: Counter):
+        super().__init__(logging.WARNING)
+        self.counter = counter
+        self._pending = False  # A 429 was logged and its scope is not known yet
+
+    def emit(self, record: logging.LogRecord):
+        if not isinstance(record.msg, str):
+            return
+        if record.msg.startswith(RATE_LIMIT_MESSAGE):
+            self._count_pending()
+            self._pending = True
+            try:
+                asyncio.get_running_loop().call_soon(self._count_pending)
+            except RuntimeError:
+                self._count_pending()  # Logged outside the event loop
+        elif record.msg.startswith(GLOBAL_RATE_LIMIT_MESSAGE):
+            self._pending = False
+            self.counter.inc(1, "global")
+
+    def _count_pending(self):
+        if self._pending:
+            self._pending = False
+            self.counter.inc(1, "route")
+
+
+class Metrics(commands.Cog):
+    """Serves Prometheus-style metrics over HTTP on a local port."""
+
+    HOST = os.getenv("METRICS_HOST", "127.0.0.1")  # Interface the endpoint listens on
+    PORT = int(os.getenv("METRICS_PORT", "9200"))  # Base port; 0 disables the endpoint
+    LAG_SAMPLE_INTERVAL = 0.5  # Seconds between event-loop lag samples
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.registry = MetricsRegistry()
+        self.command_latency = self.registry.register(
+            Histogram(
+                "discord_command_seconds",
+                "Seconds from invoking a command until it completed.",
+                ["command", "outcome"],
+            )
+        )
+        self.rate_limit_hits = self.registry.register(
+            Counter(
+                "discord_rate_limit_hits_total",
+                "429 responses received from Discord.",
+                ["scope"],
+            )
+        )
+        self.loop_lag = self.registry.register(
+            Histogram(
+                "event_loop_lag_seconds",
+                "Delay of the event loop beyond a scheduled wakeup.",
+                buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+            )
+        )
+        self.registry.add_collector(self._collect_process)
+        self.registry.add_collector(self._collect_auctions)
+        self.registry.add_collector(self._collect_diagnostics)
+        self.rate_limit_handler = RateLimitCounter(self.rate_limit_hits)
+        self._http_log_level = None  # Level of discord.http before it was lowered for the counter
+        self._runner = None
+        self._lag_task = None
+
+    async def cog_load(self):
+        http_logger = logging.getLogger("discord.http")
+        http_logger.addHandler(self.rate_limit_handler)
+        if http_logger.getEffectiveLevel() > logging.WARNING:
+            # The 429 warnings must reach the counter whatever LOG_LEVEL is;
+            # the log handlers still drop records below it
+            self._http_log_level = http_logger.level
+            http_logger.setLevel(logging.WARNING)
+        self._lag_task = asyncio.create_task(self._sample_lag())
+        if not self.PORT:
+            return
+        # Clusters on the same host listen on consecutive ports
+        port = self.PORT + getattr(self.bot, "cluster_id", 0)
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, self.HOST, port).start()
+        except OSError as e:
+            logger.error(
+                "Metrics endpoint could not listen on %s:%s: %s", self.HOST, port, e
+            )
+            await self._runner.cleanup()
+            self._runner = None
+            return
+        logger.info("Serving metrics on http://%s:%s/metrics", self.HOST, port)
+
+    async def cog_unload(self):
+        http_logger = logging.getLogger("discord.http")
+        http_logger.removeHandler(self.rate_limit_handler)
+        if self._http_log_level is not None:
+            http_logger.setLevel(self._http_log_level)
+        if self._lag_task:
+            self._lag_task.cancel()
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode(), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+    @commands.Cog.listener()
+    async def on_command(self, ctx: commands.Context):
+        ctx.metrics_started = time.perf_counter()
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context):
+        self._observe_command(ctx, "success")
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx: commands.Context, error: commands.CommandError):
+        self._observe_command(ctx, "error")
+
+    def _observe_command(self, ctx: commands.Context, outcome: str):
+        # Errors raised before invocation, such as unknown commands, have no start time
+        started = getattr(ctx, "metrics_started", None)
+        if started is None or ctx.command is None:
+            return
+        self.command_latency.observe(
+            time.perf_counter() - started, ctx.command.qualified_name, outcome
+        )
+
+    async def _sample_lag(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.LAG_SAMPLE_INTERVAL
+            await asyncio.sleep(self.LAG_SAMPLE_INTERVAL)
+            self.loop_lag.observe(max(loop.time() - expected, 0.0))
+
+    def _collect_process(self):
+        rss = resident_memory_bytes()
+        if rss is None:
+            return []
+        memory = Gauge("process_resident_memory_bytes", "Resident memory size in bytes.")
+        memory.set(rss)
+        return [memory]
+
+    def _collect_diagnostics(self):
+        diagnostics = self.bot.get_cog("Diagnostics")
+        if diagnostics is None:
+            return []
+        stalls = Counter(
+            "event_loop_stalls_total", "Times the event loop blocked for longer than the stall threshold."
+        )
+        stalls.set(diagnostics.stalls)
+        return [stalls]
+
+    def _collect_auctions(self):
+        """Metrics read from the auction cog's state at scrape time."""
+        auction = self.bot.get_cog("Auction")
+        if auction is None:
+            return []
+
+        active = Gauge("auction_active", "Live auctions per guild.", ["guild"])
+        for guild_id, count in auction.auctions.guild_counts().items():
+            active.set(count, guild_id)
+        deadlines = Gauge(
+            "auction_scheduled_deadlines", "Closing and refresh deadlines pending in the scheduler."
+        )
+        deadlines.set(len(auction.scheduler))
+        queued_bids = Gauge("auction_queued_bids", "Bids waiting in auction bid queues.")
+        queued_bids.set(sum(len(queue) for queue in auction.bid_queues.values()))
+
+        editor = auction.embed_editor
+        embed_updates = Counter(
+            "auction_embed_updates_total", "Auction embed updates, by how they were handled.", ["result"]
+        )
+        embed_updates.set(editor.submitted, "submitted")
+        embed_updates.set(editor.coalesced, "coalesced")
+        embed_updates.set(editor.edits, "edited")
+        embed_updates.set(editor.unchanged, "unchanged")
+        embed_updates.set(editor.failures, "failed")
+
+        throttle = auction.bid_throttle
+        bids_shed = Counter(
+            "auction_bids_shed_total", "Bids shed by the bid throttle, by the limit reached.", ["scope"]
+        )
+        for scope in throttle.SCOPES:
+            bids_shed.set(throttle.shed[scope], scope)
+        rejections = Counter(
+            "auction_bid_rejections_total",
+            "Bid rejections, by whether they were sent or merged into a summary.",
+            ["result"],
+        )
+        rejections.set(auction.rejections.sent, "sent")
+        rejections.set(auction.rejections.merged, "merged")
+
+        outbound = auction.outbound
+        outbound_depth = Gauge("auction_outbound_queued", "REST calls queued by the outbound dispatcher.")
+        outbound_depth.set(outbound.depth())
+        outbound_jobs = Counter(
+            "auction_outbound_jobs_total", "REST calls handled by the outbound dispatcher.", ["result"]
+        )
+        outbound_jobs.set(outbound.sent, "sent")
+        outbound_jobs.set(outbound.dropped, "dropped")
+        outbound_jobs.set(outbound.merged, "merged")
+        outbound_wait = Counter(
+            "auction_outbound_wait_seconds_total", "Seconds REST calls spent queued for rate limits."
+        )
+        outbound_wait.set(outbound.wait_total)
+
+        return [
+            active,
+            deadlines,
+            queued_bids,
+            embed_updates,
+            editor.edit_latency,
+            bids_shed,
+            rejections,
+            outbound_depth,
+            outbound_jobs,
+            outbound_wait,
+        ]
+
+
+async def setup(bot: commands.Bot):
+    """Sets up the Metrics cog."""
+    await bot.add_cog(Metrics(bot))
+    logger.info("Metrics cog loaded")
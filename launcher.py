@@ -0,0 +1,100 @@
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+
+# Launches the bot as several cluster processes, each running a block of shards.
+# Every cluster is a separate `python bot.py` process configured through environment variables.
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s:%(levelname)s:launcher: %(message)s')
+logger = logging.getLogger('launcher')
+
+RESTART_DELAY = 5  # Seconds to wait before restarting a crashed cluster
+MAX_RESTART_DELAY = 300  # Upper bound for the restart backoff
+
+
+def shard_blocks(shard_count, cluster_count):
+    """Split the shards into contiguous blocks, one per cluster."""
+    base, extra = divmod(shard_count, cluster_count)
+    blocks = []
+    start = 0
+    for cluster_id in range(cluster_count):
+        size = base + (1 if cluster_id < extra else 0)
+        blocks.append(list(range(start, start + size)))
+        start += size
+    return blocks
+
+
+def start_cluster(cluster_id, cluster_count, shard_count, shard_ids):
+    env = dict(
+        os.environ,
+        CLUSTER_ID=str(cluster_id),
+        CLUSTER_COUNT=str(cluster_count),
+        SHARD_COUNT=str(shard_count),
+        SHARD_IDS=','.join(str(shard_id) for shard_id in shard_ids),
+    )
+    logger.info('Starting cluster %s with shards %s', cluster_id, shard_ids)
+    return subprocess.Popen([sys.executable, 'bot.py'], env=env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the bot as multiple shard clusters.')
+    parser.add_argument('--shards', type=int, required=True, help='Total number of shards')
+    parser.add_argument('--clusters', type=int, required=True, help='Number of cluster processes')
+    args = parser.parse_args()
+    if not 0 < args.clusters <= args.shards:
+        parser.error('--clusters must be between 1 and --shards')
+
+    blocks = shard_blocks(args.shards, args.clusters)
+    processes = {
+        cluster_id: start_cluster(cluster_id, args.clusters, args.shards, shard_ids)
+        for cluster_id, shard_ids in enumerate(blocks)
+    }
+    delays = {cluster_id: RESTART_DELAY for cluster_id in processes}
+    restart_at = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while not stopping:
+        for cluster_id, process in processes.items():
+            if process.poll() is None or cluster_id in restart_at:
+                continue
+            logger.error(
+                'Cluster %s exited with code %s, restarting in %ss',
+                cluster_id,
+                process.returncode,
+                delays[cluster_id],
+            )
+            restart_at[cluster_id] = time.monotonic() + delays[cluster_id]
+            delays[cluster_id] = min(delays[cluster_id] * 2, MAX_RESTART_DELAY)
+
+        for cluster_id, when in list(restart_at.items()):
+            if time.monotonic() >= when:
+                del restart_at[cluster_id]
+                processes[cluster_id] = start_cluster(
+                    cluster_id, args.clusters, args.shards, blocks[cluster_id]
+                )
+        time.sleep(1)
+
+    logger.info('Stopping clusters')
+    for process in processes.values():
+        if process.poll() is None:
+            process.send_signal(signal.SIGINT)
+    for process in processes.values():
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+if __name__ == '__main__':
+    main()
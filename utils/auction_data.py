@@ -1,5 +1,59 @@
 # utils/auction_data.py
+from array import array
+from itertools import islice
+
+# Money is stored as integer minor units (hundredths) to keep comparisons exact
+MONEY_SCALE = 100
+# Largest amount in minor units that fits the compact bid log
+MAX_AMOUNT = 2**63 - 1
+
+
+class BidLog:
+    """
+    Chronological bids of one auction, packed into typed arrays (20 bytes per bid).
+    Each bid links to the previous bid of the same bidder, which indexes the log
+    per bidder without an object per bidder.
+    """
+
+    __slots__ = ("amounts", "placed_at", "previous")
+
+    def __init__(self):
+        self.amounts = array("q")
+        self.placed_at = array("d")
+        self.previous = array("i")  # Index of the bidder's previous bid, -1 for their first
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def append(self, amount, placed_at, previous):
+        self.amounts.append(amount)
+        self.placed_at.append(placed_at)
+        self.previous.append(previous)
+
+
 class AuctionData:
+    """A live auction. All amounts are integer minor units."""
+
+    __slots__ = (
+        "id",
+        "item",
+        "starting_bid",
+        "current_bid",
+        "min_increment",
+        "end_time",
+        "channel_id",
+        "guild_id",
+        "creator_name",
+        "creator_id",
+        "bids",
+        "bidder_names",
+        "ranking",
+        "proxies",
+        "active",
+        "message_id",
+        "winner",
+    )
+
     def __init__(
         self,
         id,
@@ -23,10 +77,83 @@ class AuctionData:
         self.guild_id = guild_id
         self.creator_name = creator_name
         self.creator_id = creator_id
-        self.bidders = {}  # Stores bidder names and their bids
+        # Bid containers are created with the first bid
+        self.bids = None  # BidLog of every accepted bid, oldest first
+        self.bidder_names = None  # Latest display name per bidder ID
+        self.ranking = None  # Bidder ID -> index of their latest bid in the log, ascending
+        self.proxies = None  # Bidder ID -> hidden maximum bid, in registration order
         self.active = True  # Indicates whether the auction is still active
         self.message_id = message_id  # ID of the message containing the auction details
-        self.remaining_time_str = (
-            None  # String representation of the time remaining in the auction
-        )
         self.winner = None
+
+    def record_bid(self, bidder_id, bidder_name, amount, placed_at):
+        """
+        Record an accepted bid. Accepted bids always exceed the current bid,
+        so the bidder moves to the top of the ranking.
+        """
+        self._ensure_bid_containers()
+        self.current_bid = amount
+        # Re-inserting moves the bidder to the end of the insertion order
+        self.bids.append(amount, placed_at, self.ranking.pop(bidder_id, -1))
+        self.bidder_names[bidder_id] = bidder_name
+        self.ranking[bidder_id] = len(self.bids) - 1
+
+    def _ensure_bid_containers(self):
+        if self.bids is None:
+            self.bids, self.bidder_names, self.ranking = BidLog(), {}, {}
+
+    def set_proxy(self, bidder_id, bidder_name, maximum):
+        """Register or raise a bidder's hidden maximum bid."""
+        self._ensure_bid_containers()
+        if self.proxies is None:
+            self.proxies = {}
+        self.bidder_names[bidder_id] = bidder_name
+        self.proxies[bidder_id] = maximum
+
+    def prune_proxies(self):
+        """Drop the maximums that can no longer outbid the leader."""
+        if not self.proxies:
+            return
+        leader = self.highest_bid
+        leader_id = leader[0] if leader else None
+        floor = self.current_bid + max(self.min_increment, 1)
+        self.proxies = {
+            bidder_id: maximum
+            for bidder_id, maximum in self.proxies.items()
+            if maximum >= floor or bidder_id == leader_id
+        } or None
+
+    @property
+    def highest_bid(self):
+        """Return (bidder ID, bidder name, amount) of the leading bid, or None."""
+        if not self.ranking:
+            return None
+        bidder_id = next(reversed(self.ranking))
+        return (
+            bidder_id,
+            self.bidder_names[bidder_id],
+            self.bids.amounts[self.ranking[bidder_id]],
+        )
+
+    @property
+    def bid_count(self):
+        return len(self.bids) if self.bids else 0
+
+    def bid_history(self, bidder_id):
+        """Return (amount, placed_at) of every bid of one bidder, oldest first."""
+        history = []
+        index = self.ranking.get(bidder_id, -1) if self.ranking else -1
+        while index >= 0:
+            history.append((self.bids.amounts[index], self.bids.placed_at[index]))
+            index = self.bids.previous[index]
+        history.reverse()
+        return history
+
+    def top_bidders(self, count):
+        """Return up to `count` (bidder name, highest bid) pairs, highest first."""
+        if not self.ranking:
+            return []
+        return [
+            (self.bidder_names[bidder_id], self.bids.amounts[index])
+            for bidder_id, index in islice(reversed(self.ranking.items()), count)
+        ]
@@ -0,0 +1,264 @@
+# utils/auction_journal.py
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from utils.auction_data import AuctionData
+
+logger = logging.getLogger("discord_bot")
+
+SEGMENT_PREFIX = "journal-"
+SEGMENT_SUFFIX = ".log"
+
+
+class AuctionJournal:
+    """
+    Append-only journal of auction mutations.
+
+    Records are JSON lines holding a sequence number (`s`) and an operation
+    (`op`). They are buffered and written with one fsync per interval. The
+    journal is split into segment files named after their first sequence
+    number, so segments covered by a snapshot can be deleted whole. A record
+    torn by a crash can only be the last line of the newest segment; it is cut
+    off when the journal is opened, and corruption anywhere else is an error.
+    """
+
+    def __init__(
+        self, directory: str, fsync_interval: float = 0.2, segment_records: int = 10_000
+    ):
+        self.directory = directory
+        self.fsync_interval = fsync_interval  # Seconds between fsync batches
+        self.segment_records = segment_records  # Records per segment before rolling
+        self.seq = 0  # Sequence number of the last appended record
+        self._buffer: List[str] = []
+        self._segments: List[int] = []  # First sequence number of each segment, in order
+        self._segment_count = 0  # Records in the current segment
+        self._written_seq = 0  # Sequence number of the last record on disk
+        self._snapshot_seq = 0  # Records up to here are covered by a snapshot
+        self._truncated_seq = 0  # Snapshot sequence number already truncated
+        self._file = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="auction-journal"
+        )
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def open(self):
+        """Open the journal, continuing after the last record on disk."""
+        await self._run(self._open)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Write buffered records and close the journal."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        await self._run(self._close_file)
+        self._executor.shutdown(wait=True)
+
+    def append(self, op: str, **fields) -> int:
+        """Buffer a record and return its sequence number."""
+        self.seq += 1
+        record = {"s": self.seq, "op": op, **fields}
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+        return self.seq
+
+    def mark_snapshot(self, seq: int):
+        """Record that a snapshot covers every record up to `seq`.
+        Covered segments are deleted on the next flush."""
+        self._snapshot_seq = max(self._snapshot_seq, seq)
+
+    async def flush(self):
+        """Write and fsync every buffered record, then drop covered segments."""
+        lines, self._buffer = self._buffer, []
+        first_seq = self.seq - len(lines) + 1
+        snapshot_seq = self._snapshot_seq
+        if not lines and snapshot_seq == self._truncated_seq:
+            return
+        try:
+            await self._run(self._write, lines, first_seq, snapshot_seq)
+            self._truncated_seq = snapshot_seq
+        except OSError as e:
+            logger.error("Failed to write %s journal records: %s", len(lines), e)
+
+    async def replay(self, after_seq: int) -> List[dict]:
+        """Read every record with a sequence number greater than `after_seq`."""
+        return await self._run(lambda: list(self.read_records(after_seq)))
+
+    def read_records(self, after_seq: int) -> Iterator[dict]:
+        """Yield records after `after_seq`, skipping segments that end before it."""
+        segments = self._list_segments()
+        for index, first_seq in enumerate(segments):
+            next_first = segments[index + 1] if index + 1 < len(segments) else None
+            if next_first is not None and next_first <= after_seq + 1:
+                continue
+            newest = next_first is None
+            with open(self._segment_path(first_seq), encoding="utf-8") as segment:
+                for line in segment:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        if not newest or next(segment, None) is not None:
+                            raise ValueError(
+                                f"Corrupt journal record in segment {first_seq} "
+                                "followed by further records"
+                            ) from None
+                        # A torn write at the end of the journal
+                        logger.warning(
+                            "Skipping corrupt journal record in segment %s", first_seq
+                        )
+                        break
+                    if record["s"] > after_seq:
+                        yield record
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.fsync_interval)
+            await self.flush()
+
+    def _segment_path(self, first_seq: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{first_seq:020d}{SEGMENT_SUFFIX}"
+        )
+
+    def _list_segments(self) -> List[int]:
+        return sorted(
+            int(name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+
+    # The methods below run on the journal thread
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._segments = self._list_segments()
+        if not self._segments:
+            return
+        # Recover the last sequence number from the newest segment
+        last = self._segments[-1]
+        self._cut_torn_tail(self._segment_path(last))
+        self.seq = last - 1
+        self._segment_count = 0
+        for record in self.read_records(last - 1):
+            self.seq = record["s"]
+            self._segment_count += 1
+        self._written_seq = self.seq
+        self._file = open(self._segment_path(last), "a", encoding="utf-8")
+
+    def _cut_torn_tail(self, path: str):
+        """Truncate a segment after its last complete record, so appends start on a fresh line."""
+        with open(path, "rb+") as segment:
+            good_end = 0
+            for line in segment:
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                good_end += len(line)
+            else:
+                return
+            if segment.read():
+                return  # Corruption before the last line is reported when the journal is read
+            if good_end < segment.tell():
+                logger.warning(
+                    "Truncating a torn journal record at byte %s of %s", good_end, path
+                )
+                segment.truncate(good_end)
+                segment.flush()
+                os.fsync(segment.fileno())
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _abandon_file(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass  # Buffered data that failed to write is cut off anyway
+        self._file = None
+
+    def _roll(self, first_seq: int):
+        self._close_file()
+        self._segments.append(first_seq)
+        self._segment_count = 0
+        self._file = open(self._segment_path(first_seq), "a", encoding="utf-8")
+
+    def _write(self, lines: List[str], first_seq: int, snapshot_seq: int):
+        if lines:
+            if self._file is None or self._segment_count >= self.segment_records:
+                self._roll(first_seq)
+            path = self._segment_path(self._segments[-1])
+            offset = self._file.tell()
+            try:
+                self._file.write("\n".join(lines) + "\n")
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError:
+                # Cut off a partly written batch so later records do not follow a torn line
+                self._abandon_file()
+                try:
+                    os.truncate(path, offset)
+                except OSError as e:
+                    logger.error("Failed to truncate a torn journal write in %s: %s", path, e)
+                raise
+            self._segment_count += len(lines)
+            self._written_seq = first_seq + len(lines) - 1
+        self._truncate(snapshot_seq)
+
+    def _truncate(self, seq: int):
+        # Every segment but the current one ends right before the next one starts
+        while len(self._segments) > 1 and self._segments[1] <= seq + 1:
+            os.remove(self._segment_path(self._segments.pop(0)))
+        if self._file is not None and self._segment_count and seq >= self._written_seq:
+            # The current segment is fully covered; start a new one on the next write
+            self._close_file()
+
+
+def apply_record(auctions: Dict[str, AuctionData], record: dict) -> Optional[AuctionData]:
+    """Apply a journal record to a mapping of auction IDs to auctions."""
+    op = record["op"]
+    if op == "create":
+        auction = AuctionData(
+            id=record["id"],
+            item=record["item"],
+            starting_bid=record["start"],
+            min_increment=record["inc"],
+            end_time=datetime.fromtimestamp(record["end"]),
+            channel_id=record["channel"],
+            guild_id=record["guild"],
+            creator_name=record["creator_name"],
+            creator_id=record["creator"],
+            message_id=record["message"],
+        )
+        auctions[auction.id] = auction
+        return auction
+
+    auction = auctions.get(record["id"])
+    if auction is None:
+        return None
+    if op == "bid":
+        auction.record_bid(record["bidder"], record["name"], record["amount"], record["t"])
+    elif op == "extend":
+        auction.end_time = datetime.fromtimestamp(record["end"])
+    elif op == "message":
+        auction.message_id = record["message"]
+    elif op == "proxy":
+        auction.set_proxy(record["bidder"], record["name"], record["max"])
+    elif op == "close":
+        auction.active = False
+        del auctions[auction.id]
+    return auction
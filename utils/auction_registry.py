@@ -0,0 +1,76 @@
+# utils/auction_registry.py
+from typing import Dict, Iterator, List, Optional
+
+from utils.auction_data import AuctionData
+
+
+class AuctionRegistry:
+    """
+    Live auctions keyed by auction ID, with channel → auctions and guild →
+    auctions indexes, so lookups by ID are O(1), a channel can host several
+    auctions, and per-guild counts and listings never scan other guilds.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, AuctionData] = {}
+        self._by_channel: Dict[int, Dict[str, AuctionData]] = {}
+        self._by_guild: Dict[int, Dict[str, AuctionData]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[AuctionData]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, auction_id: str) -> bool:
+        return auction_id in self._by_id
+
+    def values(self) -> List[AuctionData]:
+        return list(self._by_id.values())
+
+    def get(self, auction_id: str) -> Optional[AuctionData]:
+        return self._by_id.get(auction_id)
+
+    def add(self, auction: AuctionData):
+        """Register an auction, replacing any auction with the same ID."""
+        replaced = self._by_id.get(auction.id)
+        if replaced is not None:
+            self.remove(replaced)
+        self._by_id[auction.id] = auction
+        self._by_channel.setdefault(auction.channel_id, {})[auction.id] = auction
+        self._by_guild.setdefault(auction.guild_id, {})[auction.id] = auction
+
+    def remove(self, auction: AuctionData) -> bool:
+        """Unregister an auction. Returns False if it was not registered."""
+        if self._by_id.get(auction.id) is not auction:
+            return False
+        del self._by_id[auction.id]
+        for index, key in ((self._by_channel, auction.channel_id), (self._by_guild, auction.guild_id)):
+            auctions = index[key]
+            del auctions[auction.id]
+            if not auctions:
+                del index[key]
+        return True
+
+    def in_channel(self, channel_id: int) -> List[AuctionData]:
+        """Return the live auctions of a channel, oldest first."""
+        return list(self._by_channel.get(channel_id, {}).values())
+
+    def count(self, guild_id: int) -> int:
+        """Return the number of live auctions in a guild."""
+        return len(self._by_guild.get(guild_id, ()))
+
+    def in_guild(self, guild_id: int) -> List[AuctionData]:
+        """Return the live auctions of a guild."""
+        return list(self._by_guild.get(guild_id, {}).values())
+
+    def by_deadline(self, guild_id: int) -> List[AuctionData]:
+        """Return the live auctions of a guild, ending soonest first."""
+        return sorted(
+            self._by_guild.get(guild_id, {}).values(),
+            key=lambda auction: auction.end_time,
+        )
+
+    def guild_counts(self) -> Dict[int, int]:
+        """Return the number of live auctions per guild."""
+        return {guild_id: len(auctions) for guild_id, auctions in self._by_guild.items()}
@@ -0,0 +1,488 @@
+# utils/auction_store.py
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from utils.auction_data import AuctionData
+
+logger = logging.getLogger("discord_bot")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS auctions (
+    id TEXT PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    message_id INTEGER,
+    item TEXT NOT NULL,
+    starting_bid INTEGER NOT NULL,
+    min_increment INTEGER NOT NULL,
+    current_bid INTEGER NOT NULL,
+    end_time REAL NOT NULL,
+    creator_name TEXT NOT NULL,
+    creator_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bids (
+    auction_id TEXT NOT NULL,
+    bidder_id INTEGER NOT NULL,
+    bidder_name TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    placed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bids_by_auction ON bids (auction_id, placed_at);
+CREATE TABLE IF NOT EXISTS proxy_bids (
+    auction_id TEXT NOT NULL,
+    bidder_id INTEGER NOT NULL,
+    bidder_name TEXT NOT NULL,
+    max_amount INTEGER NOT NULL,
+    registered_at REAL NOT NULL,
+    PRIMARY KEY (auction_id, bidder_id)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id INTEGER PRIMARY KEY,
+    max_auctions INTEGER
+);
+CREATE TABLE IF NOT EXISTS archived_auctions (
+    id TEXT PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    starting_bid INTEGER NOT NULL,
+    final_bid INTEGER,
+    creator_id INTEGER NOT NULL,
+    creator_name TEXT NOT NULL,
+    winner_id INTEGER,
+    winner_name TEXT,
+    bid_count INTEGER NOT NULL,
+    bidder_count INTEGER NOT NULL,
+    closed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS archived_by_guild ON archived_auctions (guild_id, closed_at);
+CREATE INDEX IF NOT EXISTS archived_by_creator ON archived_auctions (creator_id, closed_at);
+CREATE INDEX IF NOT EXISTS archived_by_winner ON archived_auctions (winner_id, closed_at);
+CREATE INDEX IF NOT EXISTS archived_by_close ON archived_auctions (closed_at);
+CREATE TABLE IF NOT EXISTS archived_bids (
+    auction_id TEXT NOT NULL,
+    bidder_id INTEGER NOT NULL,
+    bidder_name TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    placed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS archived_bids_by_auction ON archived_bids (auction_id, placed_at);
+CREATE TABLE IF NOT EXISTS bidder_stats (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    user_name TEXT NOT NULL,
+    auctions_entered INTEGER NOT NULL,
+    auctions_won INTEGER NOT NULL,
+    total_spent INTEGER NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS bidder_stats_by_spent ON bidder_stats (guild_id, total_spent DESC);
+CREATE INDEX IF NOT EXISTS bidder_stats_by_win_rate
+    ON bidder_stats (guild_id, (auctions_won * 1.0 / auctions_entered) DESC);
+"""
+
+UPSERT_AUCTION = """
+INSERT INTO auctions (
+    id, guild_id, channel_id, message_id, item, starting_bid, min_increment,
+    current_bid, end_time, creator_name, creator_id
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    message_id = excluded.message_id,
+    current_bid = excluded.current_bid,
+    end_time = excluded.end_time
+"""
+
+# Leaderboard aggregates are updated once per bidder when an auction is archived
+UPSERT_BIDDER_STATS = """
+INSERT INTO bidder_stats (
+    guild_id, user_id, user_name, auctions_entered, auctions_won, total_spent
+) VALUES (?, ?, ?, 1, ?, ?)
+ON CONFLICT (guild_id, user_id) DO UPDATE SET
+    user_name = excluded.user_name,
+    auctions_entered = auctions_entered + 1,
+    auctions_won = auctions_won + excluded.auctions_won,
+    total_spent = total_spent + excluded.total_spent
+"""
+
+# Sort key of the win-rate leaderboard; must match the bidder_stats_by_win_rate index
+WIN_RATE = "(auctions_won * 1.0 / auctions_entered)"
+
+
+class AuctionStore:
+    """
+    SQLite-backed store for live auctions and the archive of closed ones.
+
+    Writes are buffered in memory and committed in one transaction per flush
+    interval on a dedicated thread, so the event loop never waits on disk.
+    A batch that fails to commit is retried with the next one.
+    `on_commit` is called with the meta values of every committed batch.
+    Archiving a closed auction moves its bids and updates the per-bidder
+    leaderboard aggregates in the same transaction that deletes it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = 1.0,
+        on_commit: Optional[Callable[[Dict[str, str]], None]] = None,
+    ):
+        self.path = path
+        self.flush_interval = flush_interval  # Seconds between write-behind batches
+        self.on_commit = on_commit
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="auction-store"
+        )
+        self._connection: Optional[sqlite3.Connection] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Write-behind buffers
+        self._dirty: Dict[str, AuctionData] = {}  # Auctions to upsert
+        self._bids: List[tuple] = []  # Bids to insert
+        self._proxies: Dict[tuple, tuple] = {}  # (auction ID, bidder ID) -> proxy bid to upsert
+        self._deleted: List[str] = []  # Auction IDs to delete
+        self._meta: Dict[str, str] = {}  # Meta values to set
+        self._capacities: Dict[int, Optional[int]] = {}  # Guild auction limits to set
+        self._archived: List[tuple] = []  # (auction row, bidder stats rows) to archive
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def open(self):
+        """Open the database and start the write-behind loop."""
+        await self._run(self._connect)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Flush pending writes and close the database."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        await self._run(self._connection.close)
+        self._executor.shutdown(wait=True)
+
+    def save_auction(self, auction: AuctionData):
+        """Queue an insert or update of an auction."""
+        self._dirty[auction.id] = auction
+
+    def record_bid(
+        self,
+        auction_id: str,
+        bidder_id: int,
+        bidder_name: str,
+        amount: int,
+        placed_at: float,
+    ):
+        """Queue an accepted bid."""
+        self._bids.append((auction_id, bidder_id, bidder_name, amount, placed_at))
+
+    def save_proxy(
+        self,
+        auction_id: str,
+        bidder_id: int,
+        bidder_name: str,
+        max_amount: int,
+        registered_at: float,
+    ):
+        """Queue an insert or update of a hidden maximum bid."""
+        self._proxies[(auction_id, bidder_id)] = (
+            auction_id,
+            bidder_id,
+            bidder_name,
+            max_amount,
+            registered_at,
+        )
+
+    def delete_auction(self, auction_id: str):
+        """Queue the removal of an auction, its bids and its maximum bids."""
+        self._dirty.pop(auction_id, None)
+        self._deleted.append(auction_id)
+
+    def archive_auction(self, auction: AuctionData, closed_at: float):
+        """Queue the archiving of a closed auction. Its deletion must be queued as well."""
+        highest = auction.highest_bid
+        winner_id, winner_name, final_bid = highest if highest else (None, None, None)
+        bidder_ids = list(auction.ranking or ())
+        row = (
+            auction.id,
+            auction.guild_id,
+            auction.channel_id,
+            auction.item,
+            auction.starting_bid,
+            final_bid,
+            auction.creator_id,
+            auction.creator_name,
+            winner_id,
+            winner_name,
+            auction.bid_count,
+            len(bidder_ids),
+            closed_at,
+        )
+        stats = [
+            (
+                auction.guild_id,
+                bidder_id,
+                auction.bidder_names[bidder_id],
+                int(bidder_id == winner_id),
+                final_bid if bidder_id == winner_id else 0,
+            )
+            for bidder_id in bidder_ids
+        ]
+        self._archived.append((row, stats))
+
+    async def load_history(
+        self, guild_id: int, limit: int, offset: int = 0, user_id: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Load archived auctions of a guild, most recently closed first, optionally
+        only those a user created or won. Rows are (id, item, final bid, winner
+        name, creator name, bid count, closed at).
+        """
+        query = (
+            "SELECT id, item, final_bid, winner_name, creator_name, bid_count, closed_at "
+            "FROM archived_auctions WHERE guild_id = ?"
+        )
+        params = [guild_id]
+        if user_id is not None:
+            query += " AND (creator_id = ? OR winner_id = ?)"
+            params += [user_id, user_id]
+        query += " ORDER BY closed_at DESC LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        return await self._run(lambda: self._connection.execute(query, params).fetchall())
+
+    async def load_top_spenders(self, guild_id: int, limit: int) -> List[tuple]:
+        """Load (name, total spent, auctions won) of a guild's biggest spenders."""
+        return await self._run(
+            lambda: self._connection.execute(
+                "SELECT user_name, total_spent, auctions_won FROM bidder_stats "
+                "WHERE guild_id = ? AND total_spent > 0 ORDER BY total_spent DESC LIMIT ?",
+                (guild_id, limit),
+            ).fetchall()
+        )
+
+    async def load_win_rates(self, guild_id: int, limit: int, min_entered: int) -> List[tuple]:
+        """Load (name, auctions won, auctions entered) of a guild's best win rates."""
+        return await self._run(
+            lambda: self._connection.execute(
+                "SELECT user_name, auctions_won, auctions_entered FROM bidder_stats "
+                f"WHERE guild_id = ? AND auctions_entered >= ? ORDER BY {WIN_RATE} DESC LIMIT ?",
+                (guild_id, min_entered, limit),
+            ).fetchall()
+        )
+
+    def set_meta(self, key: str, value):
+        """Queue an update of a meta value."""
+        self._meta[key] = str(value)
+
+    def set_guild_capacity(self, guild_id: int, max_auctions: Optional[int]):
+        """Queue an update of a guild's concurrent auction limit; None restores the default."""
+        self._capacities[guild_id] = max_auctions
+
+    async def load_guild_capacities(self) -> Dict[int, int]:
+        """Load the concurrent auction limit of every guild that set one."""
+        rows = await self._run(
+            lambda: self._connection.execute(
+                "SELECT guild_id, max_auctions FROM guild_settings WHERE max_auctions IS NOT NULL"
+            ).fetchall()
+        )
+        return dict(rows)
+
+    async def get_meta(self, key: str) -> Optional[str]:
+        row = await self._run(
+            lambda: self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        return row[0] if row else None
+
+    async def load_active(self) -> List[AuctionData]:
+        """Load every stored auction together with its bids."""
+        auction_rows, bid_rows, proxy_rows = await self._run(self._read_active)
+        auctions = {}
+        for row in auction_rows:
+            auction = AuctionData(
+                id=row[0],
+                guild_id=row[1],
+                channel_id=row[2],
+                message_id=row[3],
+                item=row[4],
+                starting_bid=row[5],
+                min_increment=row[6],
+                end_time=datetime.fromtimestamp(row[8]),
+                creator_name=row[9],
+                creator_id=row[10],
+            )
+            auction.current_bid = row[7]
+            auctions[auction.id] = auction
+        for auction_id, bidder_id, bidder_name, amount, placed_at in bid_rows:
+            auction = auctions.get(auction_id)
+            if auction:
+                auction.record_bid(bidder_id, bidder_name, amount, placed_at)
+        for auction_id, bidder_id, bidder_name, max_amount in proxy_rows:
+            auction = auctions.get(auction_id)
+            if auction:
+                auction.set_proxy(bidder_id, bidder_name, max_amount)
+        return list(auctions.values())
+
+    async def flush(self):
+        """Commit every queued write in a single transaction."""
+        if not (
+            self._dirty
+            or self._bids
+            or self._proxies
+            or self._deleted
+            or self._meta
+            or self._capacities
+            or self._archived
+        ):
+            return
+        dirty, bids, deleted, meta = self._dirty, self._bids, self._deleted, self._meta
+        capacities, archived, proxies = self._capacities, self._archived, self._proxies
+        self._dirty, self._bids, self._deleted, self._meta = {}, [], [], {}
+        self._capacities, self._archived, self._proxies = {}, [], {}
+        # Rows are built on the event loop so the worker thread never reads live objects
+        batch = (
+            [self._auction_row(auction) for auction in dirty.values()],
+            bids,
+            deleted,
+            list(meta.items()),
+            list(capacities.items()),
+            archived,
+            list(proxies.values()),
+        )
+        try:
+            await self._run(self._write_batch, *batch)
+        except sqlite3.Error as e:
+            # Queue the batch again, under the writes made since. Its journal sequence
+            # number is only committed, and the journal truncated, along with its data.
+            logger.error("Failed to write auction batch, retrying with the next one: %s", e)
+            self._dirty = {
+                **{auction_id: auction for auction_id, auction in dirty.items() if auction_id not in self._deleted},
+                **self._dirty,
+            }
+            self._bids = bids + self._bids
+            self._deleted = deleted + self._deleted
+            self._meta = {**meta, **self._meta}
+            self._capacities = {**capacities, **self._capacities}
+            self._archived = archived + self._archived
+            self._proxies = {**proxies, **self._proxies}
+            return
+        if self.on_commit:
+            self.on_commit(dict(meta))
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    @staticmethod
+    def _auction_row(auction: AuctionData) -> tuple:
+        return (
+            auction.id,
+            auction.guild_id,
+            auction.channel_id,
+            auction.message_id,
+            auction.item,
+            auction.starting_bid,
+            auction.min_increment,
+            auction.current_bid,
+            auction.end_time.timestamp(),
+            auction.creator_name,
+            auction.creator_id,
+        )
+
+    # The methods below run on the store thread
+
+    def _connect(self):
+        # Several bot processes may share the database; wait for their write locks
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def _read_active(self):
+        auction_rows = self._connection.execute(
+            "SELECT id, guild_id, channel_id, message_id, item, starting_bid, min_increment, "
+            "current_bid, end_time, creator_name, creator_id FROM auctions"
+        ).fetchall()
+        bid_rows = self._connection.execute(
+            # Bids settled together share a timestamp; rowid keeps their insertion order
+            "SELECT auction_id, bidder_id, bidder_name, amount, placed_at FROM bids "
+            "ORDER BY auction_id, placed_at, rowid"
+        ).fetchall()
+        proxy_rows = self._connection.execute(
+            "SELECT auction_id, bidder_id, bidder_name, max_amount FROM proxy_bids "
+            "ORDER BY auction_id, registered_at, rowid"
+        ).fetchall()
+        return auction_rows, bid_rows, proxy_rows
+
+    def _write_batch(self, upserts, bids, deleted, meta, capacities, archived, proxies):
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(UPSERT_AUCTION, upserts)
+            connection.executemany(
+                "INSERT INTO bids (auction_id, bidder_id, bidder_name, amount, placed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                bids,
+            )
+            # A raised maximum keeps its original registration time, which breaks ties
+            connection.executemany(
+                "INSERT INTO proxy_bids "
+                "(auction_id, bidder_id, bidder_name, max_amount, registered_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (auction_id, bidder_id) DO UPDATE SET "
+                "bidder_name = excluded.bidder_name, max_amount = excluded.max_amount",
+                proxies,
+            )
+            # Archived before the deletes below, which remove the live bids
+            for row, stats in archived:
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO archived_auctions VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+                if cursor.rowcount == 0:
+                    continue  # Already archived; the aggregates include it
+                connection.execute(
+                    "INSERT INTO archived_bids "
+                    "SELECT auction_id, bidder_id, bidder_name, amount, placed_at "
+                    "FROM bids WHERE auction_id = ?",
+                    (row[0],),
+                )
+                connection.executemany(UPSERT_BIDDER_STATS, stats)
+            connection.executemany(
+                "DELETE FROM auctions WHERE id = ?", [(i,) for i in deleted]
+            )
+            connection.executemany(
+                "DELETE FROM bids WHERE auction_id = ?", [(i,) for i in deleted]
+            )
+            connection.executemany(
+                "DELETE FROM proxy_bids WHERE auction_id = ?", [(i,) for i in deleted]
+            )
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                meta,
+            )
+            connection.executemany(
+                "INSERT INTO guild_settings (guild_id, max_auctions) VALUES (?, ?) "
+                "ON CONFLICT (guild_id) DO UPDATE SET max_auctions = excluded.max_auctions",
+                capacities,
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
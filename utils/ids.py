@@ -0,0 +1,64 @@
+# utils/ids.py
+import time
+from typing import List, Optional
+
+EPOCH = 1704067200000  # 2024-01-01T00:00:00Z, in milliseconds
+WORKER_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+TIMESTAMP_SHIFT = WORKER_BITS + SEQUENCE_BITS
+
+
+class SnowflakeGenerator:
+    """
+    Time-ordered 64-bit IDs laid out like Discord's snowflakes: milliseconds
+    since EPOCH, then the worker ID, then a sequence number within the millisecond.
+
+    Processes with distinct worker IDs never hand out the same ID, and the IDs
+    of one worker always increase, even if the clock steps back. A worker that
+    runs out of sequence numbers borrows the next millisecond instead of waiting.
+    """
+
+    def __init__(self, worker_id: int):
+        if not 0 <= worker_id <= MAX_WORKER_ID:
+            raise ValueError(f"Worker ID must be between 0 and {MAX_WORKER_ID}, got {worker_id}")
+        self.worker_id = worker_id
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    def generate(self, count: int = 1) -> List[int]:
+        """Return `count` new IDs in increasing order."""
+        ids = []
+        for _ in range(count):
+            timestamp = max(time.time_ns() // 1_000_000 - EPOCH, self._last_timestamp)
+            if timestamp > self._last_timestamp:
+                self._sequence = 0
+            elif self._sequence < SEQUENCE_MASK:
+                self._sequence += 1
+            else:
+                timestamp += 1
+                self._sequence = 0
+            self._last_timestamp = timestamp
+            ids.append(
+                timestamp << TIMESTAMP_SHIFT | self.worker_id << SEQUENCE_BITS | self._sequence
+            )
+        return ids
+
+    def last_issued(self) -> Optional[int]:
+        """Return the highest ID this worker issued, or None if it issued none."""
+        if self._last_timestamp < 0:
+            return None
+        return self._last_timestamp << TIMESTAMP_SHIFT | self.worker_id << SEQUENCE_BITS | self._sequence
+
+    def advance_past(self, snowflake: int):
+        """Never issue an ID at or below one this worker issued before, e.g. before a restart."""
+        if (snowflake >> SEQUENCE_BITS) & MAX_WORKER_ID != self.worker_id:
+            return
+        timestamp = snowflake >> TIMESTAMP_SHIFT
+        if timestamp > self._last_timestamp:
+            self._last_timestamp = timestamp
+            self._sequence = snowflake & SEQUENCE_MASK
+        elif timestamp == self._last_timestamp:
+            self._sequence = max(self._sequence, snowflake & SEQUENCE_MASK)
+
@@ -0,0 +1,97 @@
+# utils/logging_setup.py
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+from typing import Optional
+
+TEXT_FORMAT = "%(asctime)s:%(levelname)s:%(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key not in entry:
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the arguments into the message here, since they may change
+        # before the listener gets to them. Timestamps, JSON and the rest of the
+        # formatting happen on the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None  # Do not keep the frames alive in the queue
+        return record
+
+
+def setup_logging(
+    log_file: str,
+    level: int = logging.INFO,
+    json_format: bool = False,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    rotate_when: Optional[str] = None,
+) -> logging.handlers.QueueListener:
+    """
+    Route every log record through a queue to a background thread that writes
+    the console and the log file.
+
+    The file is appended to and rotated once it reaches `max_bytes`, or at the
+    `rotate_when` interval (e.g. 'midnight') if one is given. Returns the
+    listener, which must be stopped on shutdown to flush the queue.
+    """
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    if rotate_when:
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when=rotate_when, backupCount=backup_count, encoding="utf-8"
+        )
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    queue_handler = _QueueHandler(log_queue)
+    # Also applied at the handler, so loggers lowered for their own handlers are not written out
+    queue_handler.setLevel(level)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    listener.start()
+    return listener
@@ -0,0 +1,170 @@
+# utils/metrics.py
+import bisect
+import math
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets in seconds, from a fast command to a slow Discord edit
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Metric:
+    """Base of the metric types: a named family of values keyed by label values."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labelvalues: Sequence) -> Tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labelvalues)}"
+            )
+        return tuple(str(value) for value in labelvalues)
+
+    def clear(self):
+        self._values.clear()
+
+    def samples(self) -> Iterable[Tuple[str, Sequence[Tuple[str, str]], float]]:
+        """Yield (name, labels, value) for every exported sample."""
+        for key, value in self._values.items():
+            yield self.name, tuple(zip(self.labelnames, key)), value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, *labelvalues):
+        key = self._key(labelvalues)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, *labelvalues):
+        """Set the total directly, for counters mirrored from another component."""
+        self._values[self._key(labelvalues)] = value
+
+
+class Gauge(Metric):
+    """A value that can go up and down."""
+
+    type = "gauge"
+
+    def set(self, value: float, *labelvalues):
+        self._values[self._key(labelvalues)] = value
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size  # Non-cumulative counts per bucket
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Counts observations into cumulative buckets and tracks their sum."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, *labelvalues):
+        key = self._key(labelvalues)
+        histogram = self._values.get(key)
+        if histogram is None:
+            histogram = self._values[key] = _HistogramValue(len(self.buckets))
+        histogram.buckets[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def samples(self):
+        for key, histogram in self._values.items():
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.buckets):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_sum", labels, histogram.sum
+            yield f"{self.name}_count", labels, histogram.count
+
+
+class MetricsRegistry:
+    """
+    Holds metrics and renders them in the Prometheus text format.
+
+    Collectors are called on every render and return metrics built from the
+    current state of a component, so values owned elsewhere are never copied
+    on the hot path.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]):
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], Iterable[Metric]]):
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def collect(self) -> List[Metric]:
+        metrics = list(self._metrics.values())
+        for collector in self._collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.collect():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
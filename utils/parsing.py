@@ -0,0 +1,140 @@
+# utils/parsing.py
+import re
+from datetime import timedelta
+from decimal import Decimal, DecimalException, Inexact, localcontext
+from functools import lru_cache
+from typing import Optional
+
+from utils.auction_data import MAX_AMOUNT, MONEY_SCALE
+
+# Amounts like '1500', '1.5m', '.5k' or '2e3'
+AMOUNT_PATTERN = re.compile(
+    r"\s*(?P<sign>[+-]?)(?P<whole>\d*)(?:\.(?P<fraction>\d*))?"
+    r"(?:e(?P<exponent>[+-]?\d+))?\s*(?P<suffix>[kmbt])?\s*",
+    re.I,
+)
+# Largest exponent magnitude accepted; anything beyond is out of range or finer than a minor unit
+MAX_EXPONENT = 40
+# Significant digits Decimal amounts are computed with, well beyond those of MAX_AMOUNT
+AMOUNT_PRECISION = 60
+# Most digits an amount in range can be written with, once leading and trailing zeros are dropped
+MAX_AMOUNT_DIGITS = len(str(MAX_AMOUNT)) + MAX_EXPONENT
+SHORTHAND_MULTIPLIERS = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "b": 1_000_000_000,
+    "t": 1_000_000_000_000,
+}
+
+UNITS = ["", "K", "M", "B", "T"]
+# Minor units per one of each unit, and the decimal digits below it
+UNIT_SCALES = [MONEY_SCALE * 1000**idx for idx in range(len(UNITS))]
+UNIT_DIGITS = [len(str(scale)) - 1 for scale in UNIT_SCALES]
+
+# Matches patterns like '1d', '2h', '30m', '1 minute', '2 hours'
+DURATION_PATTERN = re.compile(
+    r"(\d+)\s*(d|day|h|hour|hr|m|min|minute|s|sec|second|w|week)s?\b", re.I
+)
+DURATION_UNIT_SECONDS = {
+    "d": 86400,
+    "day": 86400,
+    "h": 3600,
+    "hour": 3600,
+    "hr": 3600,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "w": 604800,
+    "week": 604800,
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_amount(amount_str: str) -> Optional[int]:
+    """
+    Parses a bid amount string into integer minor units.
+    Accepts formats like '1k', '1m', '1b', '1t', etc., and their uppercase equivalents,
+    including decimal values like '1.5m'.
+    Returns None if the format is incorrect or the amount is finer than one minor unit.
+    """
+    match = AMOUNT_PATTERN.fullmatch(amount_str)
+    if not match:
+        return None
+    whole = match["whole"]
+    fraction = match["fraction"] or ""
+    if not whole and not fraction:
+        return None
+    # Bound the digits before converting, so long strings are rejected instead of raising
+    whole = whole.lstrip("0")
+    fraction = fraction.rstrip("0")
+    if len(whole) + len(fraction) > MAX_AMOUNT_DIGITS:
+        return None
+    suffix = match["suffix"]
+    multiplier = SHORTHAND_MULTIPLIERS[suffix.lower()] if suffix else 1
+
+    if match["exponent"]:
+        # Bound the exponent before scaling, so huge ones cannot overflow or stall
+        if abs(int(match["exponent"])) > MAX_EXPONENT:
+            return None
+        try:
+            with localcontext() as context:
+                # Any amount in range is exact at this precision; rounding means it is not
+                context.prec = AMOUNT_PRECISION
+                context.traps[Inexact] = True
+                minor_units = (
+                    Decimal(f"{whole or 0}.{fraction or 0}e{match['exponent']}")
+                    * multiplier
+                    * MONEY_SCALE
+                )
+        except DecimalException:
+            return None
+        # Check the range before int(), which is slow for huge values
+        if abs(minor_units) > MAX_AMOUNT or minor_units != minor_units.to_integral_value():
+            return None
+        minor_units = int(minor_units)
+    else:
+        # Integer arithmetic: digits * scale must divide evenly by 10^len(fraction)
+        minor_units, remainder = divmod(
+            int(whole + fraction or "0") * multiplier * MONEY_SCALE, 10 ** len(fraction)
+        )
+        if remainder:
+            return None
+
+    if match["sign"] == "-":
+        minor_units = -minor_units
+    if abs(minor_units) > MAX_AMOUNT:
+        return None
+    return minor_units
+
+
+@lru_cache(maxsize=4096)
+def format_amount(amount: int) -> str:
+    """
+    Formats an amount in minor units into a shorthand notation with exact precision.
+    Examples (in whole units):
+    - 1500 -> '1.5K'
+    - 2500000 -> '2.5M'
+    - 123456789 -> '123.456789M'
+    - 1200000000000 -> '1.2T'
+    """
+    idx = 0
+    while idx < len(UNITS) - 1 and amount >= UNIT_SCALES[idx + 1]:
+        idx += 1
+
+    whole, fraction = divmod(abs(amount), UNIT_SCALES[idx])
+    formatted_amount = f"{'-' if amount < 0 else ''}{whole}"
+    if fraction:
+        formatted_amount += "." + str(fraction).zfill(UNIT_DIGITS[idx]).rstrip("0")
+    return formatted_amount + UNITS[idx]
+
+
+@lru_cache(maxsize=256)
+def parse_duration(duration_str: str) -> timedelta:
+    """Parses a duration string like '1d 2h 30m' or '1 minute' into a timedelta object."""
+    seconds = 0
+    for match in DURATION_PATTERN.finditer(duration_str):
+        seconds += int(match.group(1)) * DURATION_UNIT_SECONDS[match.group(2).lower()]
+    return timedelta(seconds=seconds)
@@ -0,0 +1,45 @@
+# utils/proxy_bidding.py
+from typing import Dict, List, Optional, Tuple
+
+
+def resolve_proxy_bids(
+    leader_id: Optional[int], price: int, increment: int, maxima: Dict[int, int]
+) -> List[Tuple[int, int]]:
+    """
+    Settle the bid war between hidden maximum bids.
+
+    `leader_id` holds the auction at `price`, and `maxima` maps bidder IDs to
+    their hidden maximums, in the order they were registered. The strongest
+    challenger is played against the leader as if both raised by `increment`
+    in turn until one could not, which takes constant time per pair. Pairs are
+    settled until no challenger can raise the price. Returns the bids to record
+    as (bidder ID, amount): at most the loser's last bid and the winner's final
+    bid per pair, instead of every step of the war.
+    """
+    step = max(increment, 1)  # Bids must raise the price by at least one minor unit
+    bids = []
+    while True:
+        challengers = [
+            (maximum, bidder_id)
+            for bidder_id, maximum in maxima.items()
+            if bidder_id != leader_id and maximum >= price + step
+        ]
+        if not challengers:
+            return bids
+        # The highest maximum challenges; of equal maximums the earliest one
+        challenger_max, challenger_id = max(challengers, key=lambda challenger: challenger[0])
+        leader_max = max(price, maxima.get(leader_id, 0))
+
+        # The challenger bids price + step, price + 3 steps, ...; the leader answers
+        # with price + 2 steps, price + 4 steps, ...
+        attempts = (challenger_max - price - step) // (2 * step) + 1
+        answers = max((leader_max - price - 2 * step) // (2 * step) + 1, 0)
+        if attempts > answers:
+            if answers:
+                bids.append((leader_id, price + 2 * answers * step))
+            price += (2 * answers + 1) * step
+            leader_id = challenger_id
+        else:
+            bids.append((challenger_id, price + (2 * attempts - 1) * step))
+            price += 2 * attempts * step
+        bids.append((leader_id, price))
@@ -0,0 +1,101 @@
+# utils/rate_limit.py
+import time
+from collections import Counter
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class KeyedBuckets:
+    """
+    Token buckets sharing one rate, keyed by e.g. user ID and created on first use.
+
+    Each bucket holds up to `rate` tokens and refills at `rate` tokens per `per`
+    seconds. Buckets that have refilled completely are indistinguishable from
+    new ones, so they are pruned to keep memory bounded by the active keys.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._pruned_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _refill(self, key: Hashable, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(float(self.rate), now)
+        elif now > bucket.updated_at:
+            bucket.tokens = min(
+                self.rate, bucket.tokens + (now - bucket.updated_at) * self.rate / self.per
+            )
+            bucket.updated_at = now
+        return bucket
+
+    def has_token(self, key: Hashable, now: float) -> bool:
+        """Check if the key's bucket can pay for one request, without taking it."""
+        return self._refill(key, now).tokens >= 1
+
+    def take(self, key: Hashable, now: float):
+        """Take one token from the key's bucket."""
+        self._refill(key, now).tokens -= 1
+        if now - self._pruned_at >= self.per:
+            self.prune(now)
+
+    def prune(self, now: float):
+        """Drop the buckets that would be full by now."""
+        self._pruned_at = now
+        refill_rate = self.rate / self.per
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated_at) * refill_rate < self.rate
+        }
+
+
+class BidThrottle:
+    """
+    Per-user, per-auction and per-channel admission control for bids.
+
+    A bid is admitted only if every bucket it falls into has a token, and then
+    takes one from each, so a request shed by one scope costs nothing in the
+    others. Everything happens in memory, before any REST call is made.
+    """
+
+    SCOPES = ("user", "auction", "channel")
+
+    def __init__(self, user: Tuple[int, float], auction: Tuple[int, float], channel: Tuple[int, float]):
+        self.buckets = {
+            "user": KeyedBuckets(*user),
+            "auction": KeyedBuckets(*auction),
+            "channel": KeyedBuckets(*channel),
+        }
+        self.admitted = 0
+        self.shed = Counter()  # Shed requests per scope that refused them
+
+    def admit(self, user_id: int, auction_id: Optional[str], channel_id: int) -> Optional[str]:
+        """
+        Take a token for a bid. Returns None if it was admitted, or the scope
+        ('user', 'auction' or 'channel') whose bucket was empty.
+        """
+        now = time.monotonic()
+        keys = {"user": user_id, "auction": auction_id, "channel": channel_id}
+        for scope in self.SCOPES:
+            key = keys[scope]
+            if key is not None and not self.buckets[scope].has_token(key, now):
+                self.shed[scope] += 1
+                return scope
+        for scope in self.SCOPES:
+            if keys[scope] is not None:
+                self.buckets[scope].take(keys[scope], now)
+        self.admitted += 1
+        return None
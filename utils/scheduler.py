@@ -0,0 +1,134 @@
+# utils/scheduler.py
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger("discord_bot")
+
+
+class DeadlineScheduler:
+    """
+    Runs callbacks at wall-clock deadlines using a single min-heap and one task.
+
+    Every entry is addressed by a key. Scheduling a key that is already pending
+    replaces its deadline in O(log n); the superseded heap entry is discarded
+    lazily when it reaches the top of the heap.
+    """
+
+    # Rebuild the heap once stale entries outnumber live ones by this factor
+    COMPACT_RATIO = 2
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._entries: Dict[Hashable, Tuple[float, int, Callable[[], Awaitable]]] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = set()  # Callback tasks that have not finished yet
+        self.wakeups = 0  # Number of times the scheduler loop woke up
+        self.fired = 0  # Number of callbacks started
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Return the pending deadline (epoch seconds) for a key, if any."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def schedule(
+        self, key: Hashable, deadline: float, callback: Callable[[], Awaitable]
+    ):
+        """Schedule (or reschedule) a callback to run at the given epoch timestamp."""
+        seq = next(self._counter)
+        self._entries[key] = (deadline, seq, callback)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        # Only wake the loop if the new entry is now the earliest deadline
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+        if len(self._heap) > self.COMPACT_RATIO * len(self._entries) + 64:
+            self._compact()
+
+    def cancel(self, key: Hashable):
+        """Cancel a pending entry. Unknown keys are ignored."""
+        self._entries.pop(key, None)
+
+    def start(self):
+        """Start the scheduler loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the scheduler loop. Pending entries are kept."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_running(self):
+        """Wait for the callbacks that were already started."""
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _compact(self):
+        """Drop superseded heap entries."""
+        self._heap = [
+            (deadline, seq, key)
+            for deadline, seq, key in self._heap
+            if self._is_live(key, seq)
+        ]
+        heapq.heapify(self._heap)
+
+    def _is_live(self, key: Hashable, seq: int) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] == seq
+
+    def _fire_due(self, now: float):
+        """Start every callback whose deadline has passed."""
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, key = heapq.heappop(self._heap)
+            if not self._is_live(key, seq):
+                continue
+            _, _, callback = self._entries.pop(key)
+            task = asyncio.create_task(self._invoke(key, callback))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+            self.fired += 1
+
+    async def _invoke(self, key: Hashable, callback: Callable[[], Awaitable]):
+        try:
+            await callback()
+        except Exception as e:
+            logger.exception("Scheduled callback %s failed: %s", key, e)
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            self._fire_due(time.time())
+
+            # Drop stale entries sitting on top so the timeout reflects a live deadline
+            while self._heap and not self._is_live(self._heap[0][2], self._heap[0][1]):
+                heapq.heappop(self._heap)
+
+            # A timer sets the wakeup event at the next deadline. Unlike wait_for, this
+            # cannot swallow a cancellation that arrives as the timeout expires.
+            timer = None
+            if self._heap:
+                timer = asyncio.get_running_loop().call_later(
+                    max(self._heap[0][0] - time.time(), 0), self._wakeup.set
+                )
+            try:
+                await self._wakeup.wait()
+            finally:
+                if timer:
+                    timer.cancel()
+            self.wakeups += 1
@@ -1,7 +1,17 @@
 # utils/utilities.py
 from datetime import datetime, timedelta
-import re
+from typing import Optional
 import math
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Kept importable from here for existing callers
+from utils.parsing import parse_duration
 
 
 def format_time_remaining(remaining_seconds: float):
@@ -28,45 +38,14 @@ def format_time_remaining(remaining_seconds: float):
     return formatted_time
 
 
-def parse_duration(duration_str: str):
-    """Parses a duration string like '1d 2h 30m' or '1 minute' into a timedelta object."""
-    # Regex to match patterns like '1d', '2h', '30m', '1 minute', '2 hours'
-    pattern = re.compile(
-        r"(\d+)\s*(d|day|h|hour|hr|m|min|minute|s|sec|second|w|week)s?\b", re.I
-    )
-    # Dictionary to map the time unit to the corresponding timedelta keyword
-    time_unit_keywords = {
-        "d": "days",
-        "day": "days",
-        "days": "days",
-        "h": "hours",
-        "hour": "hours",
-        "hr": "hours",
-        "hrs": "hours",
-        "hours": "hours",
-        "m": "minutes",
-        "minute": "minutes",
-        "min": "minutes",
-        "mins": "minutes",
-        "minutes": "minutes",
-        "s": "seconds",
-        "second": "seconds",
-        "sec": "seconds",
-        "secs": "seconds",
-        "seconds": "seconds",
-        "w": "weeks",
-        "week": "weeks",
-        "weeks": "weeks",
-    }
-    # Initialize the default timedelta
-    duration = timedelta()
-    # Find all matches and add them to the duration
-    for match in pattern.finditer(duration_str):
-        value, unit = int(match.group(1)), match.group(2).lower()
-        if unit in time_unit_keywords:
-            if unit == "week" or unit == "weeks":
-                duration += timedelta(days=value * 7)  # Convert weeks to days
-            else:
-                kwargs = {time_unit_keywords[unit]: value}
-                duration += timedelta(**kwargs)
-    return duration
+def resident_memory_bytes() -> Optional[int]:
+    """Current resident set size of this process, or the peak where the current size is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in bytes on macOS and in kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024